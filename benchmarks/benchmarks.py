@@ -1,8 +1,19 @@
 # Syncopy benchmark suite.
 # See "Writing benchmarks" in the asv docs for more information.
 
+import os
+import shutil
+import tempfile
+import numpy as np
+
 import syncopy as spy
 from syncopy.synthdata.analog import white_noise
+from syncopy.specest.mtmfft import mtmfft
+from syncopy.specest.mtmconvol import mtmconvol
+from syncopy.specest import wavelets as spywave
+from syncopy.preproc import firws, resampling
+from syncopy.connectivity.connectivity_analysis import ppc_trial_pairs
+from syncopy.shared.storage_policy import storagePolicies
 
 
 class SelectionSuite:
@@ -28,9 +39,13 @@ class MTMFFT:
     """
     def setup(self):
         self.adata = white_noise(nSamples=5000, nChannels=32, nTrials=250, samplerate=1000)
+        # single trial for the backend, 11 Slepian tapers
+        self.trial = np.random.randn(5000, 128)
+        self.taper_opt = {"Kmax": 11, "NW": 6}
 
     def teardown(self):
         del self.adata
+        del self.trial
 
     def time_mtmfft_untapered(self):
         _ = spy.freqanalysis(self.adata, taper=None)
@@ -38,6 +53,154 @@ class MTMFFT:
     def time_mtmfft_multitaper(self):
         _ = spy.freqanalysis(self.adata, tapsmofrq=2)
 
+    def time_mtmfft_backend_multitaper(self):
+        _ = mtmfft(self.trial, 1000, taper="dpss", taper_opt=self.taper_opt)
+
+    def time_mtmfft_backend_multitaper_threaded(self):
+        _ = mtmfft(self.trial, 1000, taper="dpss", taper_opt=self.taper_opt, workers=-1)
+
+    def time_mtmfft_backend_multitaper_float32(self):
+        _ = mtmfft(self.trial, 1000, taper="dpss", taper_opt=self.taper_opt, single_precision=True)
+
+
+class MTMConvol:
+    """
+    Benchmark multi-tapered sliding window FFT
+    """
+    def setup(self):
+        self.trial = np.random.randn(10000, 16)
+        self.taper_opt = {"Kmax": 5, "NW": 3}
+
+    def teardown(self):
+        del self.trial
+
+    def time_mtmconvol_backend_multitaper(self):
+        _ = mtmconvol(self.trial, 1000, nperseg=500, noverlap=450, taper="dpss", taper_opt=self.taper_opt.copy())
+
+    def time_mtmconvol_backend_all_toi_detrend(self):
+        _ = mtmconvol(
+            self.trial,
+            1000,
+            nperseg=500,
+            noverlap=499,
+            taper="dpss",
+            taper_opt=self.taper_opt.copy(),
+            detrend="linear",
+        )
+
+    def time_mtmconvol_backend_sparse_toi(self):
+        # a few event-locked windows in a long trial
+        centers = np.arange(500, 9500, 750)
+        _ = mtmconvol(self.trial, 1000, nperseg=500, taper="dpss", taper_opt=self.taper_opt.copy(), centers=centers)
+
+
+class Wavelet:
+    """
+    Benchmark time vs. frequency domain Morlet wavelet transform
+    """
+    def setup(self):
+        self.adata = white_noise(nSamples=5000, nChannels=16, nTrials=20, samplerate=1000)
+        self.trial = np.random.randn(20000, 16)
+        self.wfun = spywave.Morlet(6)
+        self.scales = self.wfun.scale_from_period(1 / np.arange(2, 200, 2))
+
+    def teardown(self):
+        del self.adata
+        del self.trial
+
+    def time_cwt_time_domain(self):
+        _ = spywave.cwt(self.trial, self.wfun, self.scales, dt=1e-3, frequency=False, axis=0)
+
+    def time_cwt_frequency_domain(self):
+        _ = spywave.cwt(self.trial, self.wfun, self.scales, dt=1e-3, frequency=True, axis=0)
+
+    def time_wavelet_frontend(self):
+        _ = spy.freqanalysis(self.adata, method="wavelet", foi=np.arange(2, 200, 2))
+
+
+class FIRFiltering:
+    """
+    Benchmark windowed sinc filtering of a long trial
+    """
+    def setup(self):
+        self.trial = np.random.randn(200000, 16)
+        self.fkernel = firws.design_wsinc("hamming", 1000, 0.1)
+
+    def teardown(self):
+        del self.trial
+
+    def time_fir_whole_trial_fft(self):
+        _ = firws.apply_fir(self.trial, self.fkernel, method="fft")
+
+    def time_fir_overlap_add(self):
+        _ = firws.apply_fir(self.trial, self.fkernel, method="oa")
+
+    def time_fir_stream(self):
+        blocks = (self.trial[i : i + 20000] for i in range(0, self.trial.shape[0], 20000))
+        for _ in firws.stream_fir(blocks, self.fkernel, npass=2):
+            pass
+
+
+class Preprocessing:
+    """
+    Benchmark the fused preprocessing pipeline
+    """
+    def setup(self):
+        self.adata = white_noise(nSamples=10000, nChannels=32, nTrials=50, samplerate=1000)
+
+    def teardown(self):
+        del self.adata
+
+    def time_preprocessing_fused(self):
+        _ = spy.preprocessing(self.adata, filter_class="but", freq=[10, 40], filter_type="bp", zscore=True, hilbert="abs")
+
+    def time_freqanalysis_preprocess(self):
+        _ = spy.freqanalysis(self.adata, tapsmofrq=2, preprocess={"filter_class": "but", "freq": 100})
+
+
+class PolyphaseResampling:
+    """
+    Benchmark polyphase resampling of a long trial
+    """
+    def setup(self):
+        self.trial = np.random.randn(200000, 16)
+        self.up, self.down = resampling._get_updn(1000, 300)
+        self.window = resampling.anti_alias_window(1000, 300, self.trial.shape[0], order=1000)
+
+    def teardown(self):
+        del self.trial
+
+    def time_resample_whole_trial(self):
+        _ = resampling.resample(self.trial, 1000, 300, window=self.window)
+
+    def time_resample_stream(self):
+        read = lambda start, stop: self.trial[start:stop]
+        blocks = resampling.resample_stream(read, self.trial.shape[0], self.up, self.down, self.window, 20000)
+        for _ in blocks:
+            pass
+
+
+class PPC:
+    """
+    Benchmark the single pass pairwise phase consistency
+    against the explicit computation of all trial pairs
+    """
+
+    def setup(self):
+        adata = white_noise(nSamples=1000, nChannels=8, nTrials=100, samplerate=1000)
+        self.spec = spy.freqanalysis(adata, tapsmofrq=5, output="fourier", keeptapers=True)
+        self.st_csd = spy.connectivityanalysis(self.spec, method="csd", keeptrials=True)
+
+    def teardown(self):
+        del self.spec
+        del self.st_csd
+
+    def time_ppc(self):
+        _ = spy.connectivityanalysis(self.spec, method="ppc")
+
+    def time_ppc_trial_pairs(self):
+        _ = ppc_trial_pairs(self.st_csd)
+
 
 class Arithmetic:
     """
@@ -61,6 +224,117 @@ class Arithmetic:
     def time_dset_add(self):
         _ = self.adata + self.adata2
 
+    def time_chained(self):
+        _ = (self.adata - self.adata2) / self.adata2 * 3
+
+    def time_chained_lazy(self):
+        _ = ((spy.lazy(self.adata) - self.adata2) / self.adata2 * 3).compute()
+
+
+class StoragePolicies:
+    """
+    Benchmark trial reads, compression ratio and an end-to-end
+    computation for each HDF5 storage policy
+    """
+
+    params = list(storagePolicies.keys())
+    param_names = ["policy"]
+
+    def setup(self, policy):
+        spy.__storagepolicy__ = policy
+        # random walks are closer to LFP recordings than white noise
+        rng = np.random.default_rng(42)
+        trials = [np.cumsum(rng.standard_normal((5000, 32)), axis=0).astype(np.float32) for _ in range(50)]
+        self.adata = spy.AnalogData(data=trials, samplerate=1000)
+
+    def teardown(self, policy):
+        del self.adata
+        spy.__storagepolicy__ = "contiguous"
+
+    def time_trial_read(self, policy):
+        for trial in self.adata.trials:
+            pass
+
+    def track_compression_ratio(self, policy):
+        dset = self.adata.data
+        return dset.size * dset.dtype.itemsize / dset.id.get_storage_size()
+
+    track_compression_ratio.unit = "ratio"
+
+    def time_freqanalysis(self, policy):
+        _ = spy.freqanalysis(self.adata, method="mtmfft", taper="hann", keeptrials=True)
+
+
+class MemmapTrialAccess:
+    """
+    Benchmark trial reads via memory maps (read-only files) against
+    reads via h5py (writable files)
+    """
+
+    params = ["r", "r+"]
+    param_names = ["mode"]
+
+    def setup(self, mode):
+        self.tdir = tempfile.mkdtemp()
+        adata = white_noise(nSamples=5000, nChannels=32, nTrials=200, samplerate=1000)
+        adata.save(os.path.join(self.tdir, "adata"))
+        del adata
+        self.adata = spy.load(os.path.join(self.tdir, "adata"), mode="r")
+        self.adata.mode = mode
+
+    def teardown(self, mode):
+        del self.adata
+        shutil.rmtree(self.tdir, ignore_errors=True)
+
+    def time_trial_read(self, mode):
+        for trial in self.adata.trials:
+            pass
+
+    def time_mtmfft(self, mode):
+        _ = spy.freqanalysis(self.adata, method="mtmfft", taper="hann", keeptrials=True)
+
+
+class BulkTrialAccess:
+    """
+    Benchmark bulk and prefetched trial reads against single trial reads
+    """
+
+    def setup(self):
+        self.adata = white_noise(nSamples=5000, nChannels=32, nTrials=200, samplerate=1000)
+
+    def teardown(self):
+        del self.adata
+
+    def time_single_reads(self):
+        _ = [self.adata.trials[i] for i in range(10, 150)]
+
+    def time_bulk_read(self):
+        _ = self.adata.trials[10:150]
+
+    def time_prefetched_iteration(self):
+        for trial in self.adata.trials.prefetch():
+            pass
+
+    def time_trial_mean(self):
+        _ = spy.mean(self.adata, dim="trials")
+
+
+class ImportSuite:
+    """
+    Benchmark the time needed to import Syncopy in a fresh interpreter
+    """
+
+    def timeraw_import_syncopy(self):
+        return """
+        import syncopy
+        """
+
+    def timeraw_import_syncopy_freqanalysis(self):
+        return """
+        import syncopy
+        syncopy.freqanalysis
+        """
+
 
 class MemSuite:
     """Test memory usage of data classes.
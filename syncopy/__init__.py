@@ -9,10 +9,11 @@ import sys
 import subprocess
 import getpass
 import socket
+import importlib
 import numpy as np
 from hashlib import blake2b, sha1
 from importlib.metadata import version, PackageNotFoundError
-import dask.distributed as dd
+from importlib.util import find_spec
 
 # Get package version: either via meta-information from egg or via latest git commit
 try:
@@ -47,11 +48,23 @@ except PackageNotFoundError:
 # --- Greeting ---
 
 
-def startup_print_once(message, force=False):
-    """Print message once: do not spam message n times during all n worker imports."""
+def _dask_client_running():
+    """Whether a dask client is connected, e.g., if imported by a dask worker"""
+    # without dask.distributed having been imported there can't be a client
+    if "distributed" not in sys.modules:
+        return False
+    import dask.distributed as dd
+
     try:
         dd.get_client()
     except ValueError:
+        return False
+    return True
+
+
+def startup_print_once(message, force=False):
+    """Print message once: do not spam message n times during all n worker imports."""
+    if not _dask_client_running():
         silence_file = os.path.join(os.path.expanduser("~"), ".spy", "silentstartup")
         if force or (os.getenv("SPYSILENTSTARTUP") is None and not os.path.isfile(silence_file)):
             print(message)
@@ -68,15 +81,12 @@ startup_print_once(msg)
 # Set up sensible printing options for NumPy arrays
 np.set_printoptions(suppress=True, precision=4, linewidth=80)
 
-# Check concurrent computing  setup (if acme is installed, dask is present too)
-# Import `esi_cluster_setup` and `cluster_cleanup` from acme to make the routines
-# available in the `spy` package namespace
-try:
-    from acme import esi_cluster_setup, cluster_cleanup
-
-    __acme__ = True
-except ImportError:
-    __acme__ = False
+# Check concurrent computing  setup (if acme is installed, dask is present too).
+# Only check whether optional packages are present, these are imported when needed:
+# `esi_cluster_setup` and `cluster_cleanup` from acme are made available in the
+# `spy` package namespace on first access
+__acme__ = find_spec("acme") is not None
+if not __acme__:
     # ACME is critical on ESI infrastructure
     if socket.gethostname().startswith("esi-sv"):
         msg = (
@@ -87,27 +97,13 @@ except ImportError:
             + "\tpip install esi-acme"
         )
         # do not spam via worker imports
-        try:
-            dd.get_client()
-        except ValueError:
+        if not _dask_client_running():
             print(msg)
 
-# (Try to) set up visualization environment
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.style as mplstyle
-    import matplotlib as mpl
+# Visualization environment
+__plt__ = find_spec("matplotlib") is not None
 
-    __plt__ = True
-except ImportError:
-    __plt__ = False
-
-try:
-    import pynwb
-
-    __pynwb__ = True
-except ImportError:
-    __pynwb__ = False
+__pynwb__ = find_spec("pynwb") is not None
 
 # Set package-wide temp directory
 csHome = "/cs/home/{}".format(getpass.getuser())
@@ -134,6 +130,18 @@ if not os.path.exists(__spydir__):
 # Set upper bound for temp directory size (in GB)
 __storagelimit__ = 10
 
+# Set maximum age of the cached size census of the temp directory (in hours)
+__storagecheckinterval__ = 24
+
+# Set disk quota of the temporary storage folder (in GB): unreferenced files get
+# evicted if exceeded, `None` disables the quota
+__storagequota__ = float(os.environ["SPYSTORAGEQUOTA"]) if os.environ.get("SPYSTORAGEQUOTA") else None
+
+# Set layout of newly created HDF5 datasets: "contiguous", trial-wise "chunked" or
+# chunked and compressed ("lzf", "gzip" and, if hdf5plugin is installed, "blosc"
+# or "zstd"), see `syncopy.shared.storage_policy`
+__storagepolicy__ = os.environ.get("SPYSTORAGEPOLICY", "contiguous")
+
 # Establish ID and log-file for current session
 __sessionid__ = blake2b(digest_size=2, salt=os.urandom(blake2b.SALT_SIZE)).hexdigest()
 
@@ -143,28 +151,80 @@ __tbcount__ = 5
 # Set checksum algorithm to be used
 __checksum_algorithm__ = sha1
 
-# Fill namespace
+# Fill namespace: core subpackages are imported right away, all others
+# on first access of one of their public names (see `__getattr__` below)
 from . import shared, io, datatype
 
 from .shared import *
 from .io import *
 from .datatype import *
-from .specest import *
-from .connectivity import *
-from .statistics import *
-from .plotting import *
-from .preproc import *
-from .synthdata import *
-
-from .datatype.util import setup_storage, get_dir_size
-
-(
-    storage_tmpdir_size_gb,
-    storage_tmpdir_numfiles,
-) = (
-    setup_storage()
-)  # Creates the storage dir if needed and computes size and number of files in there if any.
-spydir_size_gb, spydir_numfiles = get_dir_size(__spydir__, out="GB")
+
+_lazy_subpackages = ("specest", "connectivity", "statistics", "plotting", "preproc", "synthdata")
+_acme_names = ("esi_cluster_setup", "cluster_cleanup")
+
+# public names of the lazy subpackages: only the subpackage providing
+# a name gets imported on its first access
+_lazy_names = {
+    "freqanalysis": "specest",
+    "connectivityanalysis": "connectivity",
+    "spike_psth": "statistics",
+    "timelockanalysis": "statistics",
+    "mean": "statistics",
+    "std": "statistics",
+    "var": "statistics",
+    "median": "statistics",
+    "itc": "statistics",
+    "singlepanelplot": "plotting",
+    "multipanelplot": "plotting",
+    "preprocessing": "preproc",
+    "resampledata": "preproc",
+    "collect_trials": "synthdata",
+    "white_noise": "synthdata",
+    "linear_trend": "synthdata",
+    "harmonic": "synthdata",
+    "phase_diffusion": "synthdata",
+    "ar2_network": "synthdata",
+    "red_noise": "synthdata",
+    "ar2_peak_freq": "synthdata",
+    "mk_RandomAdjMat": "synthdata",
+    "poisson_noise": "synthdata",
+}
+
+# names exported by `from syncopy import *`, the ones of the
+# lazy subpackages (but `synthdata`) get imported on the way
+__all__ = []
+__all__.extend(datatype.__all__)
+__all__.extend(io.__all__)
+__all__.extend(shared.__all__)
+__all__.extend(name for name, subpackage in _lazy_names.items() if subpackage != "synthdata")
+
+
+def __getattr__(name):
+    """Import lazy subpackages and their public names on first access"""
+    if name in _lazy_subpackages:
+        return importlib.import_module("." + name, __name__)
+    if name in _acme_names and __acme__:
+        acme = importlib.import_module("acme")
+        return getattr(acme, name)
+    if name in _lazy_names:
+        module = importlib.import_module("." + _lazy_names[name], __name__)
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
+
+
+def __dir__():
+    names = list(globals())
+    names.extend(_lazy_subpackages)
+    names.extend(_lazy_names)
+    if __acme__:
+        names.extend(_acme_names)
+    return sorted(names)
+
+
+from .datatype.util import setup_storage, get_dir_size, check_storage
+
+setup_storage(__storage__)  # Creates the storage dir if needed
 
 from .shared.log import setup_logging
 
@@ -174,30 +234,6 @@ startup_print_once(
     f"Logging to log directory '{__logdir__}'.\nTemporary storage directory set to '{__storage__}'.\n"
 )
 
-storage_msg = (
-    "\nSyncopy <core> WARNING: {folder_desc}:s '{tmpdir:s}' "
-    + "contains {nfs:d} files taking up a total of {sze:4.2f} GB on disk. \n"
-    + "Please run `spy.cleanup()` and/or manually free up disk space."
-)
-if storage_tmpdir_size_gb > __storagelimit__:
-    msg_formatted = storage_msg.format(
-        folder_desc="Temporary storage folder",
-        tmpdir=__storage__,
-        nfs=storage_tmpdir_numfiles,
-        sze=storage_tmpdir_size_gb,
-    )
-    startup_print_once(msg_formatted, force=True)
-else:
-    # We also check the size of the whole Syncopy cfg folder, as older Syncopy versions placed files directly into it.
-    if spydir_size_gb > __storagelimit__:
-        msg_formatted = storage_msg.format(
-            folder_desc="User config folder",
-            tmpdir=__spydir__,
-            nfs=spydir_numfiles,
-            sze=spydir_size_gb,
-        )
-        startup_print_once(msg_formatted, force=True)
-
 # Override default traceback (differentiate b/w Jupyter/iPython and regular Python)
 from .shared.errors import SPYExceptionHandler
 
@@ -215,13 +251,8 @@ except:
 from .shared.errors import log
 from .shared.log import set_loglevel
 
-# Manage user-exposed namespace imports
-__all__ = []
-__all__.extend(datatype.__all__)
-__all__.extend(io.__all__)
-__all__.extend(shared.__all__)
-__all__.extend(specest.__all__)
-__all__.extend(connectivity.__all__)
-__all__.extend(statistics.__all__)
-__all__.extend(plotting.__all__)
-__all__.extend(preproc.__all__)
+# Warn if temporary storage and config folder take up too much space: use the cached
+# census of previous sessions, refresh it in the background if it is outdated
+if os.environ.get("SPYSTORAGECHECK", "background") != "off":
+    if not _dask_client_running():
+        check_storage(block=os.environ.get("SPYSTORAGECHECK") == "sync")
@@ -16,7 +16,7 @@ from inspect import signature
 
 # backend method imports
 from .csd import normalize_csd
-from .wilson_sf import wilson_sf, regularize_csd
+from .wilson_sf import wilson_sf_batch, regularize_csd_batch
 from .granger import granger
 
 # syncopy imports
@@ -290,7 +290,16 @@ class NormalizeCrossCov(ComputationalRoutine):
 
 
 @process_io
-def granger_cF(csd_av_dat, rtol=5e-6, nIter=100, cond_max=1e4, chunkShape=None, noCompute=False):
+def granger_cF(
+    csd_av_dat,
+    rtol=5e-6,
+    nIter=100,
+    cond_max=1e4,
+    send_idx=None,
+    rec_idx=None,
+    chunkShape=None,
+    noCompute=False,
+):
 
     """
     Given the trial averaged cross spectral densities,
@@ -332,6 +341,13 @@ def granger_cF(csd_av_dat, rtol=5e-6, nIter=100, cond_max=1e4, chunkShape=None,
         If the condition number is above `cond_max`, a brute force
         regularization is performed until the regularized CSD matrix has a
         condition number below `cond_max`.
+    send_idx : list of int or None
+        Channel indices of the senders. If given together with `rec_idx`,
+        Granger causality gets computed pairwise from the 2x2 sub-matrices
+        of the CSD for all (sender, receiver) combinations. All pairs are
+        factorized together in one stacked pass.
+    rec_idx : list of int or None
+        Channel indices of the receivers
     noCompute : bool
         Preprocessing flag. If `True`, do not perform actual calculation but
         instead return expected shape and :class:`numpy.dtype` of output
@@ -343,7 +359,9 @@ def granger_cF(csd_av_dat, rtol=5e-6, nIter=100, cond_max=1e4, chunkShape=None,
         Spectral Granger-Geweke causality between all channel
         combinations. Directionality follows array
         notation: causality from ``i -> j`` is ``Granger[0,:,i,j]``,
-        causality from ``j -> i`` is ``Granger[0,:,j,i]``
+        causality from ``j -> i`` is ``Granger[0,:,j,i]``.
+        For pairwise computation the shape is ``(1, nFreq, nSenders, nReceivers)``
+        and only the direction sender -> receiver is returned.
 
     Notes
     -----
@@ -375,8 +393,11 @@ def granger_cF(csd_av_dat, rtol=5e-6, nIter=100, cond_max=1e4, chunkShape=None,
             factorization, calculates the granger causalities
     """
 
-    # it's the same as the input shape!
-    outShape = csd_av_dat.shape
+    # it's the same as the input shape, or rectangular for pairs
+    if send_idx is not None:
+        outShape = csd_av_dat.shape[:2] + (len(send_idx), len(rec_idx))
+    else:
+        outShape = csd_av_dat.shape
 
     # For initialization of computational routine,
     # just return output shape and dtype
@@ -384,32 +405,102 @@ def granger_cF(csd_av_dat, rtol=5e-6, nIter=100, cond_max=1e4, chunkShape=None,
     if noCompute:
         return outShape, spectralDTypes["abs"]
 
-    # strip off singleton time dimension
-    # for the backend calls
-    CSD = csd_av_dat[0]
+    # the singleton time dimension is the batch axis of the backend
+    Granger, mdata = granger_batch(
+        csd_av_dat,
+        rtol=rtol,
+        nIter=nIter,
+        cond_max=cond_max,
+        send_idx=send_idx,
+        rec_idx=rec_idx,
+    )
+
+    # format is 'label--cast'
+    metadata = {
+        "converged--bool": np.array(mdata["converged"].all()),
+        "max rel. err--float": np.array(mdata["max rel. err"].max()),
+        "reg. factor--float": np.array(-1 if -1 in mdata["reg. factor"] else mdata["reg. factor"].max()),
+        "initial cond. num--float": np.array(mdata["initial cond. num"].max()),
+    }
+
+    return Granger, metadata
+
+
+def granger_batch(CSD, rtol=5e-6, nIter=100, cond_max=1e4, send_idx=None, rec_idx=None):
+
+    """
+    Granger causalities for a batch of trial averaged CSDs,
+    e.g. the jackknife replicates, in one vectorized pass.
+    Regularization and Wilson's factorization are carried out
+    individually for each member (and channel pair).
+
+    Parameters
+    ----------
+    CSD : (nBatch, nFreq, N, N) :class:`numpy.ndarray`
+        Cross-spectral densities stacked along the 1st axis
+    rtol : float
+        Relative error tolerance for Wilson's algorithm
+    nIter : int
+        Maximum number of iterations for CSD factorization
+    cond_max : float
+        The maximal condition number of the spectral matrix
+    send_idx : list of int or None
+        Channel indices of the senders for a pairwise computation
+    rec_idx : list of int or None
+        Channel indices of the receivers for a pairwise computation
+
+    Returns
+    -------
+    Granger : (nBatch, nFreq, N, N) :class:`numpy.ndarray`
+        Spectral Granger-Geweke causalities, the shape is
+        ``(nBatch, nFreq, nSenders, nReceivers)`` for pairwise computation
+    metadata : dict
+        Per member (nBatch,) arrays with keys 'converged', 'max rel. err',
+        'reg. factor', 'initial cond. num' and 'iterations'. For pairwise
+        computation these summarize all pairs of a member.
+    """
+
+    nBatch, nFreq = CSD.shape[:2]
+
+    # cast to 64bit for better precision
+    CSD = CSD.astype(np.complex128)
+
+    if send_idx is not None:
+        # all channel pairs, has shape (nPairs x 2)
+        pairs = np.array([(i, j) for i in send_idx for j in rec_idx])
+        # stacked 2x2 CSDs, shape is (nBatch x nPairs x nFreq x 2 x 2)
+        CSD = CSD[:, :, pairs[:, :, None], pairs[:, None, :]].transpose(0, 2, 1, 3, 4)
+    else:
+        # a single 'pair' holding all channels
+        CSD = CSD[:, np.newaxis]
 
     # auto-regularize to `cond_max` condition number
     # maximal regularization factor is 1e-1
-    CSDreg, factor, ini_cn = regularize_csd(CSD, cond_max=cond_max, eps_max=1e-1)
-    # cast to 64bit for better precision
-    CSDreg = CSDreg.astype(np.complex128)
+    CSDreg, factor, ini_cn = regularize_csd_batch(CSD, cond_max=cond_max, eps_max=1e-1)
 
     # call Wilson
-    H, Sigma, conv, err = wilson_sf(CSDreg, nIter=nIter, rtol=rtol)
+    H, Sigma, conv, err, nIters = wilson_sf_batch(CSDreg, nIter=nIter, rtol=rtol)
 
     # calculate G-causality
     Granger = granger(CSDreg, H, Sigma)
 
-    # format is 'label--cast'
+    if send_idx is not None:
+        # only direction sender -> receiver
+        Granger = Granger[..., 0, 1].reshape(nBatch, len(send_idx), len(rec_idx), nFreq)
+        Granger = Granger.transpose(0, 3, 1, 2)
+    else:
+        Granger = Granger[:, 0]
+
     metadata = {
-        "converged--bool": np.array(conv),
-        "max rel. err--float": np.array(err),
-        "reg. factor--float": np.array(factor),
-        "initial cond. num--float": np.array(ini_cn),
+        "converged": conv.all(axis=1),
+        "max rel. err": err.max(axis=1),
+        # a failed regularization of any pair has priority
+        "reg. factor": np.where(np.any(factor == -1, axis=1), -1, factor.max(axis=1)),
+        "initial cond. num": ini_cn.max(axis=1),
+        "iterations": nIters.max(axis=1),
     }
 
-    # reattach dummy time axis
-    return Granger[None, ...], metadata
+    return Granger, metadata
 
 
 class GrangerCausality(ComputationalRoutine):
@@ -471,7 +562,14 @@ class GrangerCausality(ComputationalRoutine):
 
     def process_metadata(self, data, out):
 
-        propagate_properties(data, out, self.keeptrials)
+        # pairwise computation, output only holds the selected pairs
+        if self.cfg["send_idx"] is not None:
+            out.channel_i = np.array(data.channel_i[self.cfg["send_idx"]])
+            out.channel_j = np.array(data.channel_j[self.cfg["rec_idx"]])
+            out.trialdefinition = data.trialdefinition[0, :][None, :]
+            out.samplerate = data.samplerate
+        else:
+            propagate_properties(data, out, self.keeptrials)
         out.freq = data.freq
 
         # digest metadata and attach to .info property
@@ -13,7 +13,7 @@ from inspect import signature
 from hashlib import blake2b
 
 # backend method imports
-from .csd import csd
+from .csd import csd, unit_phasors
 
 # syncopy imports
 from syncopy.shared.const_def import spectralDTypes
@@ -32,6 +32,7 @@ def spectral_dyadic_product_cF(specs,
                                send_N=None,
                                rec_idx=None,
                                rec_N=None,
+                               unit_norm=False,
                                chunkShape=None,
                                noCompute=False):
     """
@@ -48,6 +49,9 @@ def spectral_dyadic_product_cF(specs,
         Complex and time and frequency aligned multi-channel single-trial spectral data.
         The 3rd dimension is interpreted as the frequency axis, `M` is the number
         of tapers used. `N` columns represent individual channels.
+    unit_norm : bool
+        Set to `True` to normalize the cross spectra to unit phasors,
+        their trial average is all what is needed for the PPC
     noCompute : bool
         Preprocessing flag. If `True`, do not perform actual calculation but
         instead return expected shape and :class:`numpy.dtype` of output
@@ -114,6 +118,10 @@ def spectral_dyadic_product_cF(specs,
     # now average tapers
     # result has shape (nTime x nFreq x nChannels x nChannels)
     CS_ij = CS_ij.mean(axis=1)
+
+    if unit_norm:
+        CS_ij = unit_phasors(CS_ij)
+
     return CS_ij
 
 
@@ -276,6 +284,7 @@ def cross_spectra_cF(
     demean_taper=False,
     polyremoval=False,
     timeAxis=0,
+    unit_norm=False,
     chunkShape=None,
     noCompute=False,
 ):
@@ -335,6 +344,9 @@ def cross_spectra_cF(
         If `polyremoval` is `None`, no de-trending is performed.
     timeAxis : int, optional
         Index of running time axis in `trl_dat` (0 or 1)
+    unit_norm : bool
+        Set to `True` to normalize the cross spectra to unit phasors,
+        their trial average is all what is needed for the PPC
     noCompute : bool
         Preprocessing flag. If `True`, do not perform actual calculation but
         instead return expected shape and :class:`numpy.dtype` of output
@@ -417,6 +429,9 @@ def cross_spectra_cF(
         demean_taper=demean_taper,
     )
 
+    if unit_norm:
+        CS_ij = unit_phasors(CS_ij)
+
     # Hash the freqs and add to second return value.
     freqs_hash = blake2b(freqs).hexdigest().encode("utf-8")
     metadata = {"freqs_hash": np.array(freqs_hash)}  # Will have dtype='|S128'
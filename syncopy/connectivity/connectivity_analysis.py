@@ -4,8 +4,8 @@
 #
 
 # Builtin/3rd party package imports
-import numpy as np
 import h5py
+import numpy as np
 
 # Syncopy imports
 import syncopy as spy
@@ -13,6 +13,7 @@ from syncopy.connectivity.AV_compRoutines import (
     NormalizeCrossSpectra,
     NormalizeCrossCov,
     GrangerCausality,
+    granger_batch,
 )
 from syncopy.connectivity.ST_compRoutines import (
     CrossSpectra,
@@ -20,6 +21,7 @@ from syncopy.connectivity.ST_compRoutines import (
     SpectralDyadicProduct,
     PPC_column,
 )
+from syncopy.connectivity.csd import ppc_from_phasors
 from syncopy.shared.input_processors import (
     process_taper,
     process_foi,
@@ -529,11 +531,12 @@ def connectivityanalysis(
                     data.selection = None
 
                 st_compRoutine = SpectralDyadicProduct(send_idx=send_idx, send_N=send_N,
-                                                       rec_idx=rec_idx, rec_N=rec_N)
+                                                       rec_idx=rec_idx, rec_N=rec_N,
+                                                       unit_norm=method == "ppc")
             else:
                 # there are no free parameters here,
                 # everything had to be setup during freqanalysis!
-                st_compRoutine = SpectralDyadicProduct()
+                st_compRoutine = SpectralDyadicProduct(unit_norm=method == "ppc")
 
             st_dimord = SpectralDyadicProduct.dimord
 
@@ -557,8 +560,8 @@ def connectivityanalysis(
             besides = ['channelcmb']
         check_effective_parameters(PPC_column, defaults, lcls, besides=besides)
 
-        # this needs to be treated differently, as we need repeated
-        # inits of the PPC CR to compute all trial pairs
+        # the trial average of the unit phasors from the
+        # single trial CR already contains all trial pairs
         av_compRoutine = "ppc"
 
     elif method == "granger":
@@ -571,9 +574,21 @@ def connectivityanalysis(
 
         check_effective_parameters(GrangerCausality, defaults, lcls, besides=besides)
 
+        # pairwise computation for the requested channel combinations,
+        # all pairs get factorized together in one stacked pass
+        if channelcmb is not None:
+            senders, receivers = channelcmb
+            chan_list = list(data.channel)
+            send_idx = [chan_list.index(ch) if isinstance(ch, str) else ch for ch in senders]
+            rec_idx = [chan_list.index(ch) if isinstance(ch, str) else ch for ch in receivers]
+        else:
+            send_idx, rec_idx = None, None
+
         # after trial averaging
         # hardcoded numerical parameters
-        av_compRoutine = GrangerCausality(rtol=5e-6, nIter=100, cond_max=1e4)
+        av_compRoutine = GrangerCausality(
+            rtol=5e-6, nIter=100, cond_max=1e4, send_idx=send_idx, rec_idx=rec_idx
+        )
 
     # here the single trial spectra are the final result
     elif method == "csd":
@@ -586,8 +601,8 @@ def connectivityanalysis(
     # the single trial results need a new DataSet
     st_out = CrossSpectralData(dimord=st_dimord)
 
-    # we need single trials for the jackknife and the PPC
-    keeptrials = True if (keeptrials or (jackknife or method == "ppc")) else False
+    # we need single trials for the jackknife
+    keeptrials = True if (keeptrials or jackknife) else False
 
     # Perform the trial-parallelized computation of the matrix quantity
     st_compRoutine.initialize(
@@ -618,122 +633,32 @@ def connectivityanalysis(
 
     # -- PPC computation --
 
-    # set up nTrials(nTrials-1) pair computations
-    # which need an outer loop over nTrials as a single CR
-    # can only compute one column of all the nTrials x nTrials combinations
+    # the single trial CR streamed once through all trials and
+    # averaged the unit phasors, the sum over all nTrials(nTrials-1)
+    # trial pairs follows in closed form
     elif av_compRoutine == "ppc":
-        # we need to average all the CR results, shapes match
-        accumulator = np.zeros(st_out.trials[0].shape, dtype=np.float32)
-        nTrials = len(st_out.trials)
-        # to create the trial selections
-        trl_arr = np.arange(nTrials)
-        # upper triangle weights for grand average
-        weights = np.arange(1, nTrials) / (nTrials - 1)
-
-        # any selection got already digested by the preceding st_compRoutine
-        # so we can loop over all trials for the upper triangular (w/o diagonal)
-        for trl_idx in range(1, nTrials):
-
-            # hdf5 index tuple to access a 2nd trial
-            # needs to be done before(!) any trial subselection
-            trl2_idx = st_out._preview_trial(trl_idx).idx
-            hdf5_path = st_out._filename
-
-            # create selection for upper triangle
-            trl_bi = trl_arr < trl_idx
-            st_out.selectdata(trials=trl_arr[trl_bi], inplace=True)
-
-            # set up CR
-            ppc_CR = PPC_column(trl2_idx=trl2_idx, hdf5_path=hdf5_path)
-            # inner result
-            trl_pairs = CrossSpectralData(dimord=st_dimord)
-            ppc_CR.initialize(st_out, trl_pairs._stackingDim, chan_per_worker=None, keeptrials=True)
-            ppc_CR.compute(st_out, trl_pairs, parallel=kwargs.get("parallel"), log_dict=log_dict)
-
-            # now average the nTrials-1 remaining pairs
-            trl_pairs_avg = st.mean(trl_pairs, dim="trials")
-            accumulator += trl_pairs_avg.trials[0] * weights[trl_idx - 1]
-
-            # reset selection
-            st_out.selection = None
-
-        # normalize and create single trial PPC output object
-        accumulator *= 2 / nTrials
-
-        out = CrossSpectralData(dimord=st_dimord, data=accumulator)
+        ppc = ppc_from_phasors(st_out.trials[0], nTrials)
+
+        out = CrossSpectralData(dimord=st_dimord, data=ppc)
         time_axis = np.any(np.diff(st_out.trialdefinition)[:, 0] != 1)
         propagate_properties(st_out, out, keeptrials=False, time_axis=time_axis)
-        # add log from last PPC CR call
-        out.log = trl_pairs._log
+        out.log = st_out._log
 
     # -- Coherence and Granger --
 
     else:
         out = CrossSpectralData(dimord=st_dimord)
 
-        # full quadratic CSD for coherence in any case
-        if method == 'coh' or channelcmb is None:
-            # now take the trial average from the single trial CR as input
-            av_compRoutine.initialize(st_out, out._stackingDim, chan_per_worker=None)
-            av_compRoutine.pre_check()  # make sure we got a trial_average
-            av_compRoutine.compute(st_out, out, parallel=kwargs.get("parallel"), log_dict=log_dict)
-
-        # loop over the pairs and write in CR external hdf5 to
-        # collect results of individual pair results
-        elif channelcmb is not None and method == 'granger':
-            senders, receivers = channelcmb
-
-            # create new filename
-            fname = spy.CrossSpectralData().filename
-            with h5py.File(fname, "w") as h5file:
-
-                shape = (1, len(st_out.freq), len(senders), len(receivers))
-                dset = h5file.create_dataset("data",
-                                             dtype=np.float32,
-                                             shape=shape)
-
-            # compute granger in pairs
-            for idx1, ch1 in enumerate(senders):
-                for idx2, ch2 in enumerate(receivers):
-                    # 2-channel quadratic csd
-                    st_out.selectdata(channel_i=[ch1, ch2], channel_j=[ch1, ch2], inplace=True)
-
-                    # single pair result
-                    pair_out = spy.CrossSpectralData(dimord=st_dimord)
-                    av_compRoutine.initialize(st_out, pair_out._stackingDim, chan_per_worker=None)
-                    av_compRoutine.pre_check()  # make sure we got a trial_average
-                    av_compRoutine.compute(st_out, pair_out, parallel=kwargs.get("parallel"), log_dict=log_dict)
-
-                    # write result, idx1/idx2 directly encode positions in result matrix
-                    with h5py.File(fname, "r+") as h5file:
-                        dset = h5file['data']
-
-                        # only direction sender(ch1) -> receiver(ch2)
-                        dset[0, :, idx1, idx2] = pair_out.data[0, :, 0, 1]
-
-            # finally attach result matrix to result object
-            with h5py.File(fname, "r") as h5file:
-                dset = h5file['data']
-                out.data = dset
-            out._reopen()
-
-            # ..and attach metadata
-            out._log = pair_out._log
-            out.samplerate = st_out.samplerate
-
-            # either str or int
-            if isinstance(senders[0], str):
-                out.channel_i = senders
-                out.channel_j = receivers
-            else:
-                out.channel_i = data.channel[senders]
-                out.channel_j = data.channel[receivers]
-
-            # trivial trialdefinition
-            out.trialdefinition = np.array([[0, 1., 0]])
+        # now take the trial average from the single trial CR as input
+        av_compRoutine.initialize(st_out, out._stackingDim, chan_per_worker=None)
+        av_compRoutine.pre_check()  # make sure we got a trial_average
+        av_compRoutine.compute(st_out, out, parallel=kwargs.get("parallel"), log_dict=log_dict)
 
         # `out` is the direct estimate
-        if jackknife:
+        # for Granger all replicates get factorized batch-wise in one go
+        if jackknife and method == "granger":
+            jack_rep = granger_replicates(replicates_avg, out, **av_compRoutine.cfg)
+        elif jackknife:
             jack_rep = CrossSpectralData(dimord=st_dimord)
             av_compRoutine.initialize(replicates_avg, jack_rep._stackingDim)
             # without `pre_check` we can compute the replicates for all loo averages (in parallel!)
@@ -743,6 +668,8 @@ def connectivityanalysis(
                 parallel=kwargs.get("parallel"),
                 log_dict=log_dict,
             )
+
+        if jackknife:
             # now compute bias and variance
             bias, variance = jk.bias_var(out, jack_rep)
 
@@ -864,9 +791,127 @@ def cross_spectra(
         demean_taper=method == "granger",
         polyremoval=polyremoval,
         timeAxis=timeAxis,
+        unit_norm=method == "ppc",
         foi=foi,
     )
     # hard coded as class attribute
     st_dimord = CrossSpectra.dimord
 
     return st_compRoutine, st_dimord
+
+
+def ppc_trial_pairs(st_out, parallel=False, log_dict=None):
+    """
+    Reference implementation of the PPC by explicitly computing
+    all nTrials(nTrials-1) / 2 trial pairs, one :class:`PPC_column`
+    ComputationalRoutine run per column of the trial pair matrix.
+    Scales quadratically with the number of trials, use
+    :func:`~syncopy.connectivityanalysis` with ``method='ppc'`` instead.
+
+    Parameters
+    ----------
+    st_out : :class:`~syncopy.CrossSpectralData`
+        Single trial cross spectra
+    parallel : bool
+        Set to `True` to compute the columns in parallel
+
+    Returns
+    -------
+    ppc : :class:`numpy.ndarray`
+        The real valued PPC
+    """
+
+    # we need to average all the CR results, shapes match
+    accumulator = np.zeros(st_out.trials[0].shape, dtype=np.float32)
+    nTrials = len(st_out.trials)
+    # to create the trial selections
+    trl_arr = np.arange(nTrials)
+    # upper triangle weights for grand average
+    weights = np.arange(1, nTrials) / (nTrials - 1)
+
+    # any selection got already digested by the preceding st_compRoutine
+    # so we can loop over all trials for the upper triangular (w/o diagonal)
+    for trl_idx in range(1, nTrials):
+
+        # hdf5 index tuple to access a 2nd trial
+        # needs to be done before(!) any trial subselection
+        trl2_idx = st_out._preview_trial(trl_idx).idx
+        hdf5_path = st_out._filename
+
+        # create selection for upper triangle
+        trl_bi = trl_arr < trl_idx
+        st_out.selectdata(trials=trl_arr[trl_bi], inplace=True)
+
+        # set up CR
+        ppc_CR = PPC_column(trl2_idx=trl2_idx, hdf5_path=hdf5_path)
+        # inner result
+        trl_pairs = CrossSpectralData(dimord=st_out.dimord)
+        ppc_CR.initialize(st_out, trl_pairs._stackingDim, chan_per_worker=None, keeptrials=True)
+        ppc_CR.compute(st_out, trl_pairs, parallel=parallel, log_dict=log_dict)
+
+        # now average the nTrials-1 remaining pairs
+        trl_pairs_avg = st.mean(trl_pairs, dim="trials")
+        accumulator += trl_pairs_avg.trials[0] * weights[trl_idx - 1]
+
+        # reset selection
+        st_out.selection = None
+
+    # normalize
+    accumulator *= 2 / nTrials
+
+    return accumulator
+
+
+def granger_replicates(replicates, direct_estimate, batch_size=32, **granger_kwargs):
+    """
+    Granger causalities of all jackknife replicates, instead of
+    one :class:`GrangerCausality` run per replicate the trial averaged
+    CSDs get factorized in stacked batches of `batch_size` replicates.
+
+    Parameters
+    ----------
+    replicates : :class:`~syncopy.CrossSpectralData`
+        The leave-one-out trial averaged CSDs, one per trial
+    direct_estimate : :class:`~syncopy.CrossSpectralData`
+        The Granger causality of the full trial average,
+        provides the channel and frequency labels
+    batch_size : int
+        Number of replicates factorized together
+    **granger_kwargs : dict
+        Numerical parameters passed on to
+        :func:`~syncopy.connectivity.AV_compRoutines.granger_batch`
+
+    Returns
+    -------
+    jack_rep : :class:`~syncopy.CrossSpectralData`
+        The Granger causality replicates, one per trial
+    """
+
+    valid = ("rtol", "nIter", "cond_max", "send_idx", "rec_idx")
+    granger_kwargs = {key: value for key, value in granger_kwargs.items() if key in valid}
+
+    nRep = len(replicates.trials)
+    jack_rep = CrossSpectralData(dimord=direct_estimate.dimord, samplerate=replicates.samplerate)
+
+    # one replicate per slot along the stacking dim
+    shape = (nRep,) + direct_estimate.data.shape[1:]
+    with h5py.File(jack_rep._filename, mode="w") as h5file:
+        dset = h5file.create_dataset("data", shape=shape, dtype=direct_estimate.data.dtype)
+        jack_rep.data = dset
+
+    # we still need to write into it
+    jack_rep._reopen()
+
+    for start in range(0, nRep, batch_size):
+        stop = min(start + batch_size, nRep)
+        # each replicate is of shape (1, nFreq, N, N)
+        CSD = np.concatenate([replicates.trials[idx] for idx in range(start, stop)])
+        Granger, _ = granger_batch(CSD, **granger_kwargs)
+        jack_rep.data[start:stop] = Granger
+
+    jack_rep.channel_i = direct_estimate.channel_i
+    jack_rep.channel_j = direct_estimate.channel_j
+    jack_rep.freq = direct_estimate.freq
+    jack_rep.trialdefinition = np.column_stack([np.arange(nRep), np.arange(nRep) + 1, np.zeros(nRep)])
+
+    return jack_rep
@@ -170,3 +170,69 @@ def normalize_csd(csd_av_dat, output="abs"):
     CS_ij = spectralConversions[output](CS_ij)
 
     return CS_ij
+
+
+def unit_phasors(CS_ij):
+
+    """
+    Normalizes complex cross spectra to unit magnitude,
+    such that only the relative phases remain. Vanishing
+    entries get assigned a relative phase of 0.
+
+    Parameters
+    ----------
+    CS_ij : :class:`numpy.ndarray` with complex dtype
+        Single trial cross spectra of arbitrary shape
+
+    Returns
+    -------
+    phasors : :class:`numpy.ndarray` with complex dtype
+        The unit phasors ``exp(i * arg(CS_ij))``
+    """
+
+    absCS = np.abs(CS_ij)
+    phasors = np.ones_like(CS_ij)
+    np.divide(CS_ij, absCS, out=phasors, where=absCS > 0)
+
+    return phasors
+
+
+def ppc_from_phasors(phasor_av, nTrials):
+
+    r"""
+    Pairwise phase consistency [1]_ from the trial average of
+    the unit phasors of the single trial cross spectra.
+
+    The PPC is the average of the dot products
+    ``cos(theta_j - theta_k)`` over all ``N(N - 1) / 2`` trial pairs.
+    With ``u_j = exp(i theta_j)`` the sum over all pairs can be
+    written in closed form via the sum of the phasors:
+
+    .. math::
+
+          \sum_{j \neq k} u_j u_k^* = |\sum_j u_j|^2 - N
+
+    hence a single pass over the trials is enough to compute the PPC.
+
+    Parameters
+    ----------
+    phasor_av : :class:`numpy.ndarray` with complex dtype
+        Trial average of the unit phasors, see :func:`unit_phasors`
+    nTrials : int
+        Number of trials `N` the average was taken over
+
+    Returns
+    -------
+    ppc : :class:`numpy.ndarray`
+        The real valued PPC, same shape as the input
+
+    Notes
+    -----
+    .. [1] Vinck, Martin, et al. "The pairwise phase consistency: a bias-free
+          measure of rhythmic neuronal synchronization."
+          Neuroimage 51.1 (2010): 112-122.
+    """
+
+    ppc = (nTrials * np.abs(phasor_av) ** 2 - 1) / (nTrials - 1)
+
+    return ppc.astype(np.float32)
@@ -18,17 +18,18 @@ def granger(CSD, Hfunc, Sigma):
 
     Parameters
     ----------
-    CSD : (nFreq, N, N) :class:`numpy.ndarray`
+    CSD : (..., nFreq, N, N) :class:`numpy.ndarray`
         Complex cross spectra for all channel combinations ``i,j``
-        `N` corresponds to number of input channels.
-    Hfunc : (nFreq, N, N) :class:`numpy.ndarray`
+        `N` corresponds to number of input channels. Additional
+        leading axes hold stacked CSDs, e.g. of many channel pairs.
+    Hfunc : (..., nFreq, N, N) :class:`numpy.ndarray`
         Spectral transfer functions for all channel combinations ``i,j``
-    Sigma :  (N, N) :class:`numpy.ndarray`
+    Sigma :  (..., N, N) :class:`numpy.ndarray`
         The noise covariances
 
     Returns
     -------
-    Granger : (nFreq, N, N) :class:`numpy.ndarray`
+    Granger : (..., nFreq, N, N) :class:`numpy.ndarray`
         Spectral Granger-Geweke causality between all channel
         combinations. Directionality follows array
         notation: causality from ``i -> j`` is ``Granger[:,i,j]``,
@@ -49,29 +50,29 @@ def granger(CSD, Hfunc, Sigma):
 
     """
 
-    nChannels = CSD.shape[1]
-    auto_spectra = CSD.transpose(1, 2, 0).diagonal()
+    nChannels = CSD.shape[-1]
+    auto_spectra = np.diagonal(CSD, axis1=-2, axis2=-1)
     auto_spectra = np.abs(auto_spectra)  # auto-spectra are real
 
     # we need the stacked auto-spectra of the form (nChannel=3):
     #           S_11 S_22 S_33
     # Smat(f) = S_11 S_22 S_33
     #           S_11 S_22 S_33
-    Smat = auto_spectra[:, None, :] * np.ones(nChannels)[:, None]
+    Smat = auto_spectra[..., None, :] * np.ones(nChannels)[:, None]
 
     # Granger i->j needs H_ji entry
-    Hmat = np.abs(Hfunc.transpose(0, 2, 1)) ** 2
+    Hmat = np.abs(Hfunc.swapaxes(-1, -2)) ** 2
     # Granger i->j needs Sigma_ji entry
-    SigmaJI = np.abs(Sigma.T)
+    SigmaJI = np.abs(Sigma.swapaxes(-1, -2))
 
     # imag part should be 0
-    auto_cov = np.abs(Sigma.diagonal())
+    auto_cov = np.abs(np.diagonal(Sigma, axis1=-2, axis2=-1))
     # same stacking as for the auto spectra (without freq axis)
-    SigmaII = auto_cov[None, :] * np.ones(nChannels)[:, None]
+    SigmaII = auto_cov[..., None, :] * np.ones(nChannels)[:, None]
 
     # the denominator
-    denom = SigmaII.T - SigmaJI**2 / SigmaII
-    denom = Smat - denom * Hmat
+    denom = SigmaII.swapaxes(-1, -2) - SigmaJI**2 / SigmaII
+    denom = Smat - denom[..., None, :, :] * Hmat
 
     # linear causality i -> j
     Granger = np.log(Smat / denom)
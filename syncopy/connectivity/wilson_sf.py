@@ -20,12 +20,17 @@ def wilson_sf(CSD, nIter=100, rtol=1e-6, direct_inversion=True):
     Converges extremely fast, so the default number of
     iterations should be more than enough in practical situations.
 
+    Multiple CSD matrices, e.g. the 2x2 sub-matrices of many channel pairs,
+    can be factorized simultaneously by stacking them along
+    additional leading axes. See :func:`wilson_sf_batch` to get
+    the convergence information for each stacked CSD individually.
+
     This is a pure backend function and hence no input argument
     checking is performed.
 
     Parameters
     ----------
-    CSD : (nFreq, N, N) :class:`numpy.ndarray`
+    CSD : (..., nFreq, N, N) :class:`numpy.ndarray`
         Complex cross spectra for all channel combinations ``i,j``.
         `N` corresponds to number of input channels. Has to be
         positive definite and well conditioned.
@@ -42,9 +47,9 @@ def wilson_sf(CSD, nIter=100, rtol=1e-6, direct_inversion=True):
 
     Returns
     -------
-    Hfunc : (nFreq, N, N) :class:`numpy.ndarray`
+    Hfunc : (..., nFreq, N, N) :class:`numpy.ndarray`
         The transfer function
-    Sigma : (N, N) :class:`numpy.ndarray`
+    Sigma : (..., N, N) :class:`numpy.ndarray`
         Noise covariance
     converged : bool
         Indicates wether the algorithm converged.
@@ -55,69 +60,138 @@ def wilson_sf(CSD, nIter=100, rtol=1e-6, direct_inversion=True):
         between input CSD and factorized CSD
     """
 
-    nFreq = CSD.shape[0]
+    Hfunc, Sigma, converged, err, _ = wilson_sf_batch(
+        CSD, nIter=nIter, rtol=rtol, direct_inversion=direct_inversion
+    )
+
+    return Hfunc, Sigma, bool(np.all(converged)), float(np.max(err))
+
+
+def wilson_sf_batch(CSD, nIter=100, rtol=1e-6, direct_inversion=True):
+    """
+    Wilsons spectral matrix factorization for a
+    batch of CSD matrices stacked along leading axes,
+    e.g. jackknife replicates or channel pairs.
+
+    All members get iterated together, however every member has
+    its own convergence criterion: once its relative error is below
+    `rtol` it gets frozen and drops out of all further iterations.
+    For a single CSD the result is identical to :func:`wilson_sf`.
+
+    Parameters
+    ----------
+    CSD : (..., nFreq, N, N) :class:`numpy.ndarray`
+        Complex cross spectra, any leading axes
+        are treated as batch axes
+    nIter : int
+        Maximum number of iterations per member
+    rtol : float
+        Tolerance of the relative maximal
+        error of the factorization.
+    direct_inversion : bool
+        With `True` a direct matrix inversion is
+        performed, `False` solves the associated
+        least-square problems.
+
+    Returns
+    -------
+    Hfunc : (..., nFreq, N, N) :class:`numpy.ndarray`
+        The transfer functions
+    Sigma : (..., N, N) :class:`numpy.ndarray`
+        Noise covariances
+    converged : (...) :class:`numpy.ndarray`
+        Boolean convergence mask, one entry per member
+    err : (...) :class:`numpy.ndarray`
+        Final maximal relative error per member
+    nIters : (...) :class:`numpy.ndarray`
+        Number of iterations performed per member
+    """
+
+    batch_shape = CSD.shape[:-3]
+    nFreq, nChannel = CSD.shape[-3], CSD.shape[-1]
 
-    Ident = np.eye(*CSD.shape[1:])
+    # flatten all batch axes into one
+    CSD = CSD.reshape((-1,) + CSD.shape[-3:])
+    nBatch = CSD.shape[0]
+
+    Ident = np.eye(nChannel)
 
     # attach negative frequencies
-    CSD = np.r_[CSD, CSD[nFreq - 2 : 0 : -1].conj()]
+    CSD = np.concatenate([CSD, CSD[:, nFreq - 2 : 0 : -1].conj()], axis=1)
 
-    # nChannel x nChannel
+    # nBatch x nChannel x nChannel
     psi0 = _psi0_initial(CSD)
 
     # initial choice of psi, constant for all z(~f)
-    psi = np.tile(psi0, (nFreq, 1, 1))
-    # attach negative frequencies
-    psi = np.r_[psi, psi[nFreq - 2 : 0 : -1].conj()]
+    # psi0 is real, so also for the negative frequencies
+    psi = np.broadcast_to(psi0[:, np.newaxis], CSD.shape).astype(np.complex128)
+
+    converged = np.zeros(nBatch, dtype=bool)
+    err = np.full(nBatch, np.inf)
+    nIters = np.zeros(nBatch, dtype=int)
 
-    g = np.zeros(CSD.shape, dtype=np.complex64)
-    converged = False
     # use cholesky for performance
     U = np.linalg.cholesky(CSD)
+
+    # indices of the members still iterating
+    active = np.arange(nBatch)
     for _ in range(nIter):
 
+        psi_a = psi[active]
         if direct_inversion:
-            psi_inv = np.linalg.inv(psi)
+            psi_inv = np.linalg.inv(psi_a)
 
             # the bracket of equation 3.1
             # g = psi_inv @ CSD @ psi_inv.conj().transpose(0, 2, 1)
 
             # equivalent using cholesky decomposition
-            g = psi_inv @ U
-            g = g @ g.conj().transpose(0, 2, 1)
+            g = psi_inv @ U[active]
+            g = g @ _herm(g)
 
         else:
-            for i in range(g.shape[0]):
-                C = np.linalg.lstsq(psi[i], CSD[i], rcond=None)[0]
-                g[i] = np.linalg.lstsq(psi[i], C.conj().T, rcond=None)[0].conj().T
+            CSD_a = CSD[active]
+            g = np.zeros(psi_a.shape, dtype=np.complex64)
+            for i in np.ndindex(g.shape[:-2]):
+                C = np.linalg.lstsq(psi_a[i], CSD_a[i], rcond=None)[0]
+                g[i] = np.linalg.lstsq(psi_a[i], C.conj().T, rcond=None)[0].conj().T
 
         gplus, gplus_0 = _plusOperator(g + Ident)
 
         # the 'any' matrix
         S = np.triu(gplus_0)
-        S = S - S.conj().T  # S + S* = 0
+        S = S - _herm(S)  # S + S* = 0
 
         # the next step psi_{tau+1}
-        psi = psi @ (gplus + S)
-        psi0 = psi0 @ (gplus_0 + S)
-
-        # max relative error
-        CSDfac = psi @ psi.conj().transpose(0, 2, 1)
-        err = max_rel_err(CSD, CSDfac)
-
-        # converged
-        if err < rtol:
-            converged = True
+        psi_a = psi_a @ (gplus + S[:, np.newaxis])
+        psi[active] = psi_a
+        psi0[active] = psi0[active] @ (gplus_0 + S)
+        nIters[active] += 1
+
+        # max relative error per member
+        CSDfac = psi_a @ _herm(psi_a)
+        err[active] = max_rel_err(CSD[active], CSDfac, axis=(1, 2, 3))
+
+        # freeze the converged members
+        done = err[active] < rtol
+        converged[active[done]] = True
+        active = active[~done]
+        if active.size == 0:
             break
 
     # Noise Covariance
-    Sigma = psi0 @ psi0.T
+    Sigma = psi0 @ psi0.swapaxes(-1, -2)
 
     # Transfer function
     psi0_inv = np.linalg.inv(psi0)
-    Hfunc = psi @ psi0_inv
+    Hfunc = psi[:, :nFreq] @ psi0_inv[:, np.newaxis]
 
-    return Hfunc[:nFreq], Sigma, converged, err
+    return (
+        Hfunc.reshape(batch_shape + Hfunc.shape[1:]),
+        Sigma.reshape(batch_shape + Sigma.shape[1:]),
+        converged.reshape(batch_shape),
+        err.reshape(batch_shape),
+        nIters.reshape(batch_shape),
+    )
 
 
 def _psi0_initial(CSD):
@@ -129,26 +203,25 @@ def _psi0_initial(CSD):
     explicitly proposed in section 4. of the original paper.
     """
 
-    nSamples = CSD.shape[1]
-
     # perform (i)fft to obtain gammas.
-    gamma = np.fft.fft(CSD, axis=0)
-    gamma0 = gamma[0, ...]
+    gamma = np.fft.fft(CSD, axis=-3)
+    gamma0 = gamma[..., 0, :, :]
 
     # Remove any asymmetry due to rounding error.
     # This also will zero out any imaginary values
     # on the diagonal - real diagonals are required for cholesky.
-    gamma0 = np.real((gamma0 + gamma0.T.conj()) / 2)
+    gamma0 = np.real((gamma0 + _herm(gamma0)) / 2)
 
-    # check for positive definiteness
-    eivals = np.linalg.eigvals(gamma0)
-    if np.all(np.imag(eivals) == 0):
-        psi0 = np.linalg.cholesky(gamma0)
     # otherwise initialize with 1's as a fallback
-    else:
-        psi0 = np.ones((nSamples, nSamples))
+    psi0 = np.ones(gamma0.shape)
+
+    # check for positive definiteness,
+    # individually for stacked CSDs
+    eivals = np.linalg.eigvals(gamma0)
+    pos_def = np.all(np.imag(eivals) == 0, axis=-1)
+    psi0[pos_def] = np.linalg.cholesky(gamma0[pos_def])
 
-    return psi0.T
+    return psi0.swapaxes(-1, -2)
 
 
 def _plusOperator(g):
@@ -157,40 +230,49 @@ def _plusOperator(g):
     The []+ operator from definition 1.2,
     given by explicit Fourier transformations
 
-    The nFreq x nChannel x nChannel matrix `g` is given
+    The (...) x nFreq x nChannel x nChannel matrix `g` is given
     in the frequency domain.
     """
 
     # 'negative lags' from the ifft
-    nLag = g.shape[0] // 2
+    nLag = g.shape[-3] // 2
 
     # the series expansion in beta_k
     # is covariance like
-    beta = np.real(np.fft.ifft(g, axis=0))
+    beta = np.real(np.fft.ifft(g, axis=-3))
 
     # take half of the zero lag
-    beta[0, ...] = 0.5 * beta[0, ...]
-    g0 = beta[0, ...].copy()
+    beta[..., 0, :, :] = 0.5 * beta[..., 0, :, :]
+    g0 = beta[..., 0, :, :].copy()
 
     # take half of Nyquist bin
     # Dhamala "NewEdits" 28.01.22
-    beta[nLag, ...] = 0.5 * beta[nLag, ...]
+    beta[..., nLag, :, :] = 0.5 * beta[..., nLag, :, :]
 
     # Zero out negative lags
-    beta[nLag + 1 :, ...] = 0
+    beta[..., nLag + 1 :, :, :] = 0
 
-    gp = np.fft.fft(beta, axis=0)
+    gp = np.fft.fft(beta, axis=-3)
 
     return gp, g0
 
 
+def _herm(A):
+
+    """
+    Conjugate transpose of (stacked) matrices
+    """
+
+    return A.conj().swapaxes(-1, -2)
+
+
 # --- End of Wilson's Algorithm ---
 
 
-def max_rel_err(A, B):
+def max_rel_err(A, B, axis=None):
 
     err = np.abs(A - B)
-    err = (err / np.abs(A)).max()
+    err = (err / np.abs(A)).max(axis=axis)
     return err
 
 
@@ -252,3 +334,63 @@ def regularize_csd(CSD, cond_max=1e3, eps_max=1e-3, nSteps=15):
 
     # regularization goal not achieved
     return CSDreg, -1, iniCondNum
+
+
+def regularize_csd_batch(CSD, cond_max=1e3, eps_max=1e-3, nSteps=15):
+
+    """
+    Brute force regularization like :func:`regularize_csd` for a
+    batch of CSD matrices stacked along leading axes. Every member
+    gets the smallest regularization factor which pushes its maximal
+    condition number below `cond_max`, members which can not be
+    regularized get the factor `-1`.
+
+    Parameters
+    ----------
+    CSD : (..., nFreq, N, N) :class:`numpy.ndarray`
+        The cross spectral density matrices,
+        any leading axes are treated as batch axes
+    cond_max : float
+        The maximal condition number after regularization
+    eps_max : float
+        The largest regularization factor to be used
+    nSteps : int
+        Number of steps between 1e-10 and `eps_max`.
+
+    Returns
+    -------
+    CSDreg : (..., nFreq, N, N) :class:`numpy.ndarray`
+        The regularized CSD matrices
+    eps : (...) :class:`numpy.ndarray`
+        The regularization factors used per member
+    iniCondNum : (...) :class:`numpy.ndarray`
+        The initial condition numbers per member
+    """
+
+    epsilons = np.logspace(-10, np.log10(eps_max), nSteps)
+    I = np.eye(CSD.shape[-1])
+
+    iniCondNum = np.linalg.cond(CSD).max(axis=-1)
+    eps = np.zeros(iniCondNum.shape)
+    CSDreg = CSD.copy()
+
+    # members still needing regularization
+    todo = iniCondNum >= cond_max
+    for epsilon in epsilons:
+        if not np.any(todo):
+            break
+        trial_reg = CSD[todo] + epsilon * I
+        ok = np.linalg.cond(trial_reg).max(axis=-1) < cond_max
+
+        # the last try is kept also if unsuccessful
+        if epsilon == epsilons[-1]:
+            CSDreg[todo] = trial_reg
+            eps[todo] = np.where(ok, epsilon, -1)
+            break
+
+        idx = tuple(ax[ok] for ax in np.nonzero(todo))
+        CSDreg[idx] = trial_reg[ok]
+        eps[idx] = epsilon
+        todo[idx] = False
+
+    return CSDreg, eps, iniCondNum
@@ -14,6 +14,7 @@ from .methods.show import *
 from .methods.copy import *
 from .methods.redefinetrial import *
 from .methods.concat import *
+from .methods.arithmetic import *
 from .util import *
 
 # Populate local __all__ namespace
@@ -28,3 +29,4 @@ __all__.extend(methods.show.__all__)
 __all__.extend(methods.copy.__all__)
 __all__.extend(methods.redefinetrial.__all__)
 __all__.extend(methods.concat.__all__)
+__all__.extend(methods.arithmetic.__all__)
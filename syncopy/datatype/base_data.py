@@ -13,7 +13,7 @@ from abc import ABC, abstractmethod
 from hashlib import blake2b
 from itertools import chain
 from types import GeneratorType
-import shutil
+from importlib.metadata import version
 import numpy as np
 import h5py
 import scipy as sp
@@ -26,6 +26,8 @@ from .methods.arithmetic import _process_operator
 from .methods.selectdata import selectdata
 from .methods.show import show
 from syncopy.shared.tools import SerializableDict
+from syncopy.shared.storage import get_storage_manager
+from syncopy.shared.storage_policy import dataset_kwargs
 from syncopy.shared.parsers import (
     array_parser,
     io_parser,
@@ -40,11 +42,7 @@ from syncopy.shared.errors import (
     SPYWarning,
 )
 from syncopy.datatype.methods.definetrial import definetrial as _definetrial
-from syncopy import __version__, __storage__, __acme__, __sessionid__
-
-if __acme__:
-    import acme
-    import dask
+from syncopy import __version__, __acme__, __sessionid__
 
 
 __all__ = []
@@ -113,8 +111,8 @@ class BaseData(ABC):
         ver=__version__,
         timestamp=time.asctime(),
         sysver=sys.version,
-        acver=acme.__version__ if __acme__ else "--",
-        daver=dask.__version__ if __acme__ else "--",
+        acver=version("esi-acme") if __acme__ else "--",
+        daver=version("dask") if __acme__ else "--",
         npver=np.__version__,
         spver=sp.__version__,
     )
@@ -344,7 +342,7 @@ class BaseData(ABC):
 
         self.filename = filename
 
-    def _set_dataset_property_with_ndarray(self, inData, propertyName, ndim):
+    def _set_dataset_property_with_ndarray(self, inData, propertyName, ndim, trialLengths=None):
         """Set a dataset property with a NumPy array
 
         If no data exists, a backing HDF5 dataset will be created.
@@ -358,6 +356,9 @@ class BaseData(ABC):
             so do not include that.
         ndim : int
             Number of expected array dimensions.
+        trialLengths : None or list
+            Extents of the trials along the stacking dimension, used
+            to align the chunks of a newly created dataset with the trials
         """
         # Ensure array has right no. of dimensions
         array_parser(inData, varname=f"{propertyName}", dims=ndim)
@@ -403,12 +404,13 @@ class BaseData(ABC):
                         actual=propertyName,
                     )
 
+            dsetKwargs = self._dataset_kwargs(propertyName, inData.shape, inData.dtype, trialLengths)
             h5f = self._get_backing_hdf5_file_handle()
             if h5f is None:
                 with h5py.File(self.filename, "w") as h5f:
-                    h5f.create_dataset(propertyName, data=inData)
+                    h5f.create_dataset(propertyName, data=inData, **dsetKwargs)
             else:
-                h5f.create_dataset(propertyName, data=inData)
+                h5f.create_dataset(propertyName, data=inData, **dsetKwargs)
 
         md = self.mode
         if md == "w":
@@ -446,6 +448,8 @@ class BaseData(ABC):
             # creates hidden attribute behind the property on the fly
             if not hasattr(self, "_" + propertyName):
                 setattr(self, "_" + propertyName, None)
+            # keep the (temporary) file of the dataset alive as long as this object
+            get_storage_manager().acquire(inData.file.filename, self)
 
         self._mode = inData.file.mode
         setattr(self, "_" + propertyName, inData)
@@ -562,7 +566,8 @@ class BaseData(ABC):
         # Finally, concatenate provided arrays and let corresponding setting method
         # perform the actual HDF magic
         data = np.concatenate(inData, axis=self._stackingDim)
-        self._set_dataset_property_with_ndarray(data, propertyName, ndim)
+        trialExtents = [val.shape[self._stackingDim] for val in inData]
+        self._set_dataset_property_with_ndarray(data, propertyName, ndim, trialLengths=trialExtents)
         self.trialdefinition = trialdefinition
 
     def _set_dataset_property_with_spy_list(self, inData, ndim):
@@ -759,7 +764,13 @@ class BaseData(ABC):
         stack_count = 0
         trlSamples = []  # for constructing the trialdefinition
         with h5py.File(self.filename, "w") as h5f:
-            dset = h5f.create_dataset(propertyName, shape=shape, maxshape=maxshape, dtype=trial1.dtype)
+            dset = h5f.create_dataset(
+                propertyName,
+                shape=shape,
+                maxshape=maxshape,
+                dtype=trial1.dtype,
+                **self._dataset_kwargs(propertyName, shape, trial1.dtype, [shape1[self._stackingDim]]),
+            )
 
             # we have to plug in the 1st trial already generated
             stack_step = trial1.shape[self._stackingDim]
@@ -880,8 +891,16 @@ class BaseData(ABC):
     def filename(self, fname):
         if not isinstance(fname, str):
             raise SPYTypeError(fname, varname="fname", expected="str")
+        oldname = self._filename
         self._filename = os.path.abspath(os.path.expanduser(str(fname)))
 
+        # Move this object's reference in the index of temporary files; the
+        # old file is kept, datasets of this object might still live there
+        storage = get_storage_manager()
+        if isinstance(oldname, str) and oldname != self._filename:
+            storage.release(oldname, self, delete=False)
+        storage.acquire(self._filename, self)
+
     @property
     def log(self):
         """str: log of previous operations on data"""
@@ -1094,6 +1113,17 @@ class BaseData(ABC):
                 if dsetProp.id.valid != 0:  # Check whether backing HDF5 file is open.
                     dsetProp.file.close()
 
+    def _dataset_kwargs(self, propertyName, shape, dtype, trialLengths=None):
+        """
+        Local helper returning chunk layout and filters of the dataset
+        `propertyName` according to `syncopy.__storagepolicy__`
+        """
+        if propertyName == "data":
+            return dataset_kwargs(
+                shape, dtype, stackingDim=self._stackingDim, trialLengths=trialLengths, dimord=self.dimord
+            )
+        return dataset_kwargs(shape, dtype)
+
     def _get_backing_hdf5_file_handle(self):
         """Get handle to `h5py.File` instance of backing HDF5 file
 
@@ -1195,7 +1225,7 @@ class BaseData(ABC):
             if self.container is None:
                 raise SPYError(
                     "Cannot create spy container in temporary "
-                    + "storage {} - please provide explicit path. ".format(__storage__)
+                    + "storage {} - please provide explicit path. ".format(get_storage_manager().storage_dir)
                 )
             overwrite = True
             filename = self.filename
@@ -1216,7 +1246,7 @@ class BaseData(ABC):
 
         fname_hsh = blake2b(digest_size=4, salt=os.urandom(blake2b.SALT_SIZE)).hexdigest()
         fname = os.path.join(
-            __storage__,
+            get_storage_manager().storage_dir,
             "spy_{sess:s}_{hash:s}{ext:s}".format(
                 sess=__sessionid__, hash=fname_hsh, ext=self._classname_to_extension()
             ),
@@ -1241,6 +1271,7 @@ class BaseData(ABC):
 
         # keep all datasets alive and open
         if self._persistent_hdf5:
+            get_storage_manager().release_all(self, delete=False)
             return
 
         # close hdf5 file
@@ -1254,10 +1285,12 @@ class BaseData(ABC):
                 except (ValueError, ImportError, TypeError, AttributeError):
                     pass
 
-        # remove from file system
-        if __storage__ in self.filename and os.path.exists(self.filename):
-            os.unlink(self.filename)
-            shutil.rmtree(os.path.splitext(self.filename)[0], ignore_errors=True)
+        # remove temporary files no other object refers to from file system
+        try:
+            get_storage_manager().release_all(self)
+        # can happen at interpreter shutdown
+        except (ImportError, TypeError, AttributeError):
+            pass
 
     # Support for basic arithmetic operations (no in-place computations supported yet)
     def __add__(self, other):
@@ -21,16 +21,13 @@ from .base_data import BaseData
 from syncopy.shared.parsers import scalar_parser, array_parser
 from syncopy.shared.errors import SPYValueError, SPYError
 from syncopy.shared.tools import best_match
-from syncopy.plotting import sp_plotting, mp_plotting
+from syncopy.shared.memmap_io import read_hyperslab
 from syncopy.io.nwb import _analog_timelocked_to_nwbfile
 from .util import TimeIndexer
 
 
 from syncopy import __pynwb__
 
-if __pynwb__:  # pragma: no cover
-    from pynwb import NWBHDF5IO
-
 
 __all__ = ["AnalogData", "SpectralData", "CrossSpectralData", "TimeLockData"]
 
@@ -255,7 +252,43 @@ class ContinuousData(BaseData, ABC):
     def _get_trial(self, trialno):
         idx = [slice(None)] * len(self.dimord)
         idx[self._stackingDim] = slice(int(self.sampleinfo[trialno, 0]), int(self.sampleinfo[trialno, 1]))
-        return self._data[tuple(idx)]
+        return read_hyperslab(self._data, tuple(idx))
+
+    # Helper function that grabs several trials at once
+    def _get_trials(self, trialnos):
+        """
+        Read the trials `trialnos`, trials which directly follow each other
+        on disk are read together in a single hyperslab
+
+        Returns
+        -------
+        trials : numpy.ndarray or list
+            Stacked array (trials along the first axis) if all trials are
+            read in one piece and have the same length, otherwise a list of
+            the single trials (views into the blocks read)
+        """
+
+        # runs of trials adjacent on disk: [start, stop, [trial lengths]]
+        runs = []
+        for trialno in trialnos:
+            start, stop = (int(smp) for smp in self.sampleinfo[trialno, :2])
+            if runs and runs[-1][1] == start:
+                runs[-1][1] = stop
+                runs[-1][2].append(stop - start)
+            else:
+                runs.append([start, stop, [stop - start]])
+
+        idx = [slice(None)] * len(self.dimord)
+        trials = []
+        for start, stop, lengths in runs:
+            idx[self._stackingDim] = slice(start, stop)
+            block = read_hyperslab(self._data, tuple(idx))
+            # equal trials stacked along the first axis are a reshape away
+            if len(runs) == 1 and self._stackingDim == 0 and len(set(lengths)) == 1:
+                return block.reshape((len(lengths), lengths[0]) + block.shape[1:])
+            bounds = np.cumsum(lengths)[:-1]
+            trials.extend(np.split(block, bounds, axis=self._stackingDim))
+        return trials
 
     def _is_empty(self):
         return super()._is_empty() or self.samplerate is None
@@ -464,11 +497,13 @@ class AnalogData(ContinuousData):
 
     # implement plotting
     def singlepanelplot(self, shifted=True, **show_kwargs):
+        from syncopy.plotting import sp_plotting
 
         figax = sp_plotting.plot_AnalogData(self, shifted, **show_kwargs)
         return figax
 
     def multipanelplot(self, **show_kwargs):
+        from syncopy.plotting import mp_plotting
 
         figax = mp_plotting.plot_AnalogData(self, **show_kwargs)
         return figax
@@ -524,6 +559,8 @@ class AnalogData(ContinuousData):
             with_trialdefinition=with_trialdefinition,
             is_raw=is_raw,
         )
+        from pynwb import NWBHDF5IO
+
         # Write the file to disk.
         with NWBHDF5IO(outpath, "w") as io:
             io.write(nwbfile)
@@ -687,11 +724,13 @@ class SpectralData(ContinuousData):
 
     # implement plotting
     def singlepanelplot(self, logscale=True, **show_kwargs):
+        from syncopy.plotting import sp_plotting
 
         figax = sp_plotting.plot_SpectralData(self, logscale, **show_kwargs)
         return figax
 
     def multipanelplot(self, **show_kwargs):
+        from syncopy.plotting import mp_plotting
 
         figax = mp_plotting.plot_SpectralData(self, **show_kwargs)
         return figax
@@ -838,6 +877,7 @@ class CrossSpectralData(ContinuousData):
             self.freq = freq
 
     def singlepanelplot(self, **show_kwargs):
+        from syncopy.plotting import sp_plotting
 
         return sp_plotting.plot_CrossSpectralData(self, **show_kwargs)
 
@@ -953,11 +993,13 @@ class TimeLockData(ContinuousData):
     # TODO - overload `time` property, as there is only one by definition!
     # implement plotting
     def singlepanelplot(self, shifted=True, **show_kwargs):
+        from syncopy.plotting import sp_plotting
 
         figax = sp_plotting.plot_AnalogData(self, shifted, **show_kwargs)
         return figax
 
     def multipanelplot(self, **show_kwargs):
+        from syncopy.plotting import mp_plotting
 
         figax = mp_plotting.plot_AnalogData(self, **show_kwargs)
         return figax
@@ -998,6 +1040,8 @@ class TimeLockData(ContinuousData):
         nwbfile = _analog_timelocked_to_nwbfile(
             self, nwbfile=None, with_trialdefinition=with_trialdefinition, is_raw=is_raw
         )
+        from pynwb import NWBHDF5IO
+
         # Write the file to disk.
         with NWBHDF5IO(outpath, "w") as io:
             io.write(nwbfile)
@@ -15,15 +15,11 @@ from .base_data import BaseData, FauxTrial
 from .methods.definetrial import definetrial
 from syncopy.shared.parsers import scalar_parser, array_parser
 from syncopy.shared.errors import SPYValueError, SPYError, SPYTypeError
-from syncopy.plotting import spike_plotting
 
 from syncopy.io.nwb import _spikedata_to_nwbfile
 
 from syncopy import __pynwb__
 
-if __pynwb__:  # pragma: no cover
-    from pynwb import NWBHDF5IO
-
 
 __all__ = ["SpikeData", "EventData"]
 
@@ -698,18 +694,22 @@ class SpikeData(DiscreteData):
             raise SPYError("NWB support is not available. Please install the 'pynwb' package.")
 
         nwbfile = _spikedata_to_nwbfile(self, nwbfile=None, with_trialdefinition=with_trialdefinition)
+        from pynwb import NWBHDF5IO
+
         # Write the file to disk.
         with NWBHDF5IO(outpath, "w") as io:
             io.write(nwbfile)
 
     # implement plotting
     def singlepanelplot(self, **show_kwargs):
+        from syncopy.plotting import spike_plotting
 
         figax = spike_plotting.plot_single_figure_SpikeData(self, **show_kwargs)
         return figax
 
     # implement plotting
     def multipanelplot(self, **show_kwargs):
+        from syncopy.plotting import spike_plotting
 
         figax = spike_plotting.plot_multi_figure_SpikeData(self, **show_kwargs)
         return figax
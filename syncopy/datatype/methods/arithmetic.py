@@ -6,7 +6,6 @@
 # Builtin/3rd party package imports
 import numpy as np
 import h5py
-import dask.distributed as dd
 
 # Local imports
 from syncopy.shared.parsers import data_parser
@@ -14,7 +13,15 @@ from syncopy.shared.errors import SPYValueError, SPYTypeError, SPYWarning
 from syncopy.shared.computational_routine import ComputationalRoutine
 from syncopy.shared.kwarg_decorators import process_io, detect_parallel_client
 
-__all__ = []
+# Use numexpr for evaluating lazy expressions if available
+try:
+    import numexpr as ne
+
+    __numexpr__ = True
+except ImportError:
+    __numexpr__ = False
+
+__all__ = ["lazy", "LazyExpression"]
 
 
 # Main entry point for overloaded operators
@@ -57,7 +64,10 @@ def _process_operator(obj1, obj2, operator):
     --------
     _parse_input : prepare objects for arithmetic operations
     _perform_computation : execute arithmetic operation
+    lazy : build arithmetic expressions evaluated in a single pass
     """
+    if isinstance(obj1, LazyExpression) or isinstance(obj2, LazyExpression):
+        return _build_expression(obj1, obj2, operator)
     baseObj, operand, operand_dat, opres_type, operand_idxs = _parse_input(obj1, obj2, operator)
     return _perform_computation(baseObj, operand, operand_dat, operand_idxs, opres_type, operator)
 
@@ -341,6 +351,8 @@ def _perform_computation(baseObj, operand, operand_dat, operand_idxs, opres_type
     SpyArithmetic : :class:`~syncopy.shared.computational_routine.ComputationalRoutine` subclass
     """
 
+    import dask.distributed as dd
+
     # Prepare logging info in dictionary: we know that `baseObj` is definitely
     # a Syncopy data object, operand may or may not be; account for this
     if "BaseData" in str(operand.__class__.__mro__):
@@ -515,3 +527,451 @@ class SpyArithmetic(ComputationalRoutine):
                 if np.issubdtype(type(selection), np.number):
                     selection = [selection]
                 setattr(out, prop, getattr(baseObj, prop)[selection])
+
+
+# Elementwise kernels of supported operators
+_operations = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.true_divide,
+    "**": np.power,
+}
+
+# Array types numexpr computes with natively
+_numexpr_types = ("bool", "int32", "int64", "float32", "float64", "complex128")
+
+
+def lazy(data):
+    """
+    Start a lazily evaluated arithmetic expression on a Syncopy data object
+
+    Parameters
+    ----------
+    data : Syncopy data object
+        Any non-empty `AnalogData`, `SpectralData` or `CrossSpectralData` object.
+        An existing in-place selection is respected.
+
+    Returns
+    -------
+    expr : :class:`LazyExpression`
+        Expression wrapping `data`. Applying ``+ - * / **`` to `expr` builds up
+        an expression tree instead of computing intermediate Syncopy objects.
+
+    Notes
+    -----
+    Chained arithmetic on Syncopy objects, e.g., ``(a - b) / b * 3``, creates
+    a full-size HDF5 dataset for every single operation. Wrapping the first term
+    via ``spy.lazy(a)`` defers all computations until the expression is evaluated,
+    which then happens in a single pass over the (selected) trials of all involved
+    objects and only writes the final result to disk. Evaluation is triggered by
+    accessing the `data` or `trials` properties of the expression or by
+    calling :meth:`LazyExpression.compute`. The same input checks as for eager
+    arithmetic are performed while the expression is built.
+
+    Examples
+    --------
+    >>> expr = (spy.lazy(a) - b) / b * 3
+    >>> res = expr.compute()
+
+    See also
+    --------
+    LazyExpression : arithmetic expression tree of Syncopy objects
+    """
+    if not "BaseData" in str(data.__class__.__mro__):
+        raise SPYTypeError(data, varname="data", expected="Syncopy data object")
+    _validate_term(data, data, "+")
+    return LazyExpression(None, data)
+
+
+class LazyExpression:
+    """
+    Arithmetic expression tree of Syncopy data objects, scalars and arrays
+
+    Instances are created by :func:`lazy` and arithmetic operators applied
+    to them and are not meant to be instantiated directly. The leftmost Syncopy
+    object of the expression is its base object, which determines the type,
+    trial definition and metadata of the result.
+
+    See also
+    --------
+    lazy : start a lazily evaluated arithmetic expression
+    """
+
+    # Let NumPy defer to our reflected operators (``arr * expr``)
+    __array_ufunc__ = None
+
+    def __init__(self, operator, left, right=None):
+        self.operator = operator
+        self.left = left
+        self.right = right
+        self._result = None
+
+    @property
+    def objects(self):
+        """List of unique Syncopy objects in the expression, base object first"""
+        objects = []
+        for term in (self.left, self.right):
+            if isinstance(term, LazyExpression):
+                candidates = term.objects
+            elif "BaseData" in str(term.__class__.__mro__):
+                candidates = [term]
+            else:
+                candidates = []
+            for obj in candidates:
+                if not any(obj is known for known in objects):
+                    objects.append(obj)
+        return objects
+
+    @property
+    def base(self):
+        """Syncopy object the expression is evaluated on"""
+        return self.objects[0]
+
+    @property
+    def data(self):
+        """Dataset of the evaluated expression"""
+        return self.compute().data
+
+    @property
+    def trials(self):
+        """list-like iterable of trials of the evaluated expression"""
+        return self.compute().trials
+
+    def compute(self):
+        """
+        Evaluate the expression in a single pass over all (selected) trials
+
+        Returns
+        -------
+        out : Syncopy data object
+            Result of the expression. The result is computed only once,
+            subsequent calls return the same object.
+        """
+        if self._result is None:
+            self._result = _evaluate_lazy(self)
+        return self._result
+
+    def _tree(self, objects):
+        """Data-free (picklable) representation of the expression"""
+        if self.operator is None:
+            return ("obj", [obj is self.left for obj in objects].index(True))
+        terms = []
+        for term in (self.left, self.right):
+            if isinstance(term, LazyExpression):
+                terms.append(term._tree(objects))
+            else:
+                terms.append(("const", term))
+        return (self.operator, *terms)
+
+    def __repr__(self):
+        if self.operator is None:
+            return self.left.__class__.__name__
+        terms = []
+        for term in (self.left, self.right):
+            if isinstance(term, LazyExpression) and term.operator is not None:
+                terms.append("({})".format(term))
+            elif isinstance(term, np.ndarray):
+                terms.append("array{}".format(term.shape))
+            else:
+                terms.append(str(term))
+        return "{} {} {}".format(terms[0], self.operator, terms[1])
+
+    def __add__(self, other):
+        return _build_expression(self, other, "+")
+
+    def __radd__(self, other):
+        return _build_expression(other, self, "+")
+
+    def __sub__(self, other):
+        return _build_expression(self, other, "-")
+
+    def __rsub__(self, other):
+        return _build_expression(other, self, "-")
+
+    def __mul__(self, other):
+        return _build_expression(self, other, "*")
+
+    def __rmul__(self, other):
+        return _build_expression(other, self, "*")
+
+    def __truediv__(self, other):
+        return _build_expression(self, other, "/")
+
+    def __rtruediv__(self, other):
+        return _build_expression(other, self, "/")
+
+    def __pow__(self, other):
+        return _build_expression(self, other, "**")
+
+    def __rpow__(self, other):
+        return _build_expression(other, self, "**")
+
+
+def _build_expression(obj1, obj2, operator):
+    """
+    Combine two terms into a new :class:`LazyExpression` node
+
+    Syncopy objects are wrapped as expression leaves, scalars and arrays are
+    kept as constants. All Syncopy objects and constants of the new node are
+    checked against the node's base object using :func:`_parse_input`.
+    """
+
+    terms = []
+    for term in (obj1, obj2):
+        if "BaseData" in str(term.__class__.__mro__):
+            term = LazyExpression(None, term)
+        elif isinstance(term, list):
+            term = np.array(term)
+        terms.append(term)
+    expr = LazyExpression(operator, *terms)
+    baseObj = expr.base
+
+    # Constants on the left-hand side are not divisors, pass on a reflected
+    # operator to skip the zero-division check
+    for tk, term in enumerate(terms):
+        if isinstance(term, LazyExpression):
+            for obj in term.objects:
+                _validate_term(baseObj, obj, operator)
+        else:
+            _validate_term(baseObj, term, operator if tk == 1 else "r" + operator)
+
+    return expr
+
+
+def _validate_term(baseObj, term, operator):
+    """
+    Local helper to check a term of a lazy expression against its base object
+    """
+    try:
+        if term is not baseObj:
+            _parse_input(baseObj, term, operator)
+        else:
+            # Only ensure the base itself is a valid non-empty continuous object
+            _parse_input(baseObj, 1, operator)
+    finally:
+        if hasattr(baseObj.selection, "_cleanup"):
+            baseObj.selection = None
+
+
+def _evaluate_lazy(expr):
+    """
+    Evaluate a :class:`LazyExpression` using a single `ComputationalRoutine` run
+
+    Parameters
+    ----------
+    expr : :class:`LazyExpression`
+        Expression to evaluate
+
+    Returns
+    -------
+    out : Syncopy data object
+        Result of the expression
+
+    Notes
+    -----
+    Trials of the expression's base object are fed through the
+    `ComputationalRoutine` as usual, the corresponding data (subsets) of all
+    other Syncopy objects are read inside :func:`expression_cF`. In contrast
+    to :func:`_perform_computation` no distributed lock is needed, since only
+    a single output dataset is written.
+
+    See also
+    --------
+    expression_cF : `computeFunction` evaluating expressions
+    SpyLazyArithmetic : :class:`~syncopy.shared.computational_routine.ComputationalRoutine` subclass
+    """
+
+    import dask.distributed as dd
+
+    objects = expr.objects
+    baseObj = objects[0]
+    tree = expr._tree(objects)
+
+    # Gather backing devices and per-trial indices of all non-base objects
+    # (this also creates the "fake" all-to-all selection of the base object)
+    operands = []
+    opndIdxs = []
+    opndTypes = []
+    for obj in objects[1:]:
+        _, _, operand_dat, _, operand_idxs = _parse_input(baseObj, obj, "+")
+        operands.append(operand_dat)
+        opndIdxs.append(operand_idxs)
+        opndTypes.append(obj.data.dtype)
+    if len(objects) == 1:
+        _parse_input(baseObj, 1, "+")
+    baseTrialList = baseObj.selection.trial_ids
+    operand_idxs = [[idxs[tk] for idxs in opndIdxs] for tk in range(len(baseTrialList))]
+
+    # Determine the result's numeric type by evaluating the expression on
+    # single elements of each object's type
+    probes = [np.ones(1, dtype=dtype) for dtype in [baseObj.data.dtype] + opndTypes]
+    with np.errstate(all="ignore"):
+        opres_type = _evaluate_tree(tree, probes).dtype
+
+    log_dct = {
+        "expression": str(expr),
+        "base": baseObj.__class__.__name__,
+        "base selection": baseObj.selection,
+        "operands": [obj.__class__.__name__ for obj in objects[1:]],
+        "operand selections": [obj.selection for obj in objects[1:]],
+    }
+
+    out = baseObj.__class__(dimord=baseObj.dimord)
+
+    parallel = False
+    try:
+        dd.get_client()
+        parallel = True
+    except ValueError:
+        parallel = False
+
+    opMethod = SpyLazyArithmetic(operand_idxs, tree=tree, operands=operands, opres_type=opres_type)
+    opMethod.initialize(baseObj, out._stackingDim, chan_per_worker=None, keeptrials=True)
+
+    # Close operand datasets before concurrently reading from them
+    if parallel:
+        for obj in objects[1:]:
+            for dsetName in obj._hdfFileDatasetProperties:
+                getattr(obj, dsetName).file.close()
+
+    try:
+        opMethod.compute(baseObj, out, parallel=parallel, log_dict=log_dct)
+    finally:
+        if parallel:
+            for obj in objects[1:]:
+                for dsetName in obj._hdfFileDatasetProperties:
+                    setattr(obj, dsetName, obj.filename)
+        if hasattr(baseObj.selection, "_cleanup"):
+            baseObj.selection = None
+
+    return out
+
+
+def _evaluate_tree(tree, arrays):
+    """
+    Evaluate a data-free expression tree on per-object `arrays`
+
+    Uses numexpr if available and all arrays are of types supported by numexpr,
+    otherwise the expression is evaluated node by node using NumPy.
+    """
+    if __numexpr__ and all(arr.dtype.name in _numexpr_types for arr in arrays):
+        local_dict = {"x{}".format(k): arr for k, arr in enumerate(arrays)}
+        return ne.evaluate(_numexpr_string(tree, local_dict), local_dict=local_dict)
+    return _numpy_evaluate(tree, arrays)
+
+
+def _numpy_evaluate(tree, arrays):
+    """
+    Local helper to recursively evaluate an expression tree using NumPy
+    """
+    if tree[0] == "obj":
+        return arrays[tree[1]]
+    if tree[0] == "const":
+        return tree[1]
+    operator, left, right = tree
+    return _operations[operator](_numpy_evaluate(left, arrays), _numpy_evaluate(right, arrays))
+
+
+def _numexpr_string(tree, local_dict):
+    """
+    Local helper to translate an expression tree into a numexpr string
+
+    Constants are added to `local_dict` under unique names.
+    """
+    if tree[0] == "obj":
+        return "x{}".format(tree[1])
+    if tree[0] == "const":
+        name = "c{}".format(len(local_dict))
+        local_dict[name] = tree[1]
+        return name
+    operator, left, right = tree
+    return "({} {} {})".format(
+        _numexpr_string(left, local_dict),
+        operator,
+        _numexpr_string(right, local_dict),
+    )
+
+
+@process_io
+def expression_cF(
+    base_dat,
+    operand_idxs,
+    tree=None,
+    operands=None,
+    opres_type=None,
+    noCompute=False,
+    chunkShape=None,
+):
+    """
+    Evaluate a lazy arithmetic expression on a single trial
+
+    Parameters
+    ----------
+    base_dat : :class:`numpy.ndarray`
+        Trial data of the expression's base object
+    operand_idxs : list
+        Indexing tuples of the current trial, one for every non-base Syncopy
+        object of the expression.
+    tree : tuple
+        Data-free expression tree as generated by :meth:`LazyExpression._tree`
+    operands : list
+        One dictionary per non-base Syncopy object holding keys `"filename"`
+        and `"dsetname"` of its HDF5 backing device.
+    opres_type : dtype
+        Numerical type of the expression's result
+    noCompute : bool
+        Preprocessing flag. If `True`, do not perform actual calculation but
+        instead return expected shape and :class:`numpy.dtype` of output
+        array.
+    chunkShape : None or tuple
+        If not `None`, represents shape of output
+
+    Returns
+    -------
+    res : :class:`numpy.ndarray`
+        Result of the expression for the current trial
+
+    Notes
+    -----
+    This method is intended to be used as :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.computeFunction`
+    inside a :class:`~syncopy.shared.computational_routine.ComputationalRoutine`.
+    Thus, input parameters are presumed to be forwarded from a parent metafunction.
+    Consequently, this function does **not** perform any error checking and operates
+    under the assumption that all inputs have been externally validated and cross-checked.
+
+    See also
+    --------
+    _evaluate_lazy : evaluate a lazy arithmetic expression
+    SpyLazyArithmetic : :class:`~syncopy.shared.computational_routine.ComputationalRoutine` subclass
+    """
+
+    if noCompute:
+        return base_dat.shape, opres_type
+
+    arrays = [base_dat]
+    for operand_dat, operand_idx in zip(operands, operand_idxs):
+        with h5py.File(operand_dat["filename"], "r") as h5f:
+            operand = h5f[operand_dat["dsetname"]][operand_idx]
+            # enforce original shape in case `operand_idx` contained scalar
+            # selections that squeezed the array
+            operand.shape = chunkShape
+        arrays.append(operand)
+
+    return np.asarray(_evaluate_tree(tree, arrays), dtype=opres_type)
+
+
+class SpyLazyArithmetic(SpyArithmetic):
+    """
+    Compute class for evaluating lazy arithmetic expressions of Syncopy objects
+
+    Sub-class of :class:`SpyArithmetic` sharing its metadata handling,
+    see :doc:`/developer/compute_kernels` for technical details on Syncopy's compute
+    classes and metafunctions.
+
+    See also
+    --------
+    _evaluate_lazy : evaluate a lazy arithmetic expression
+    """
+
+    computeFunction = staticmethod(expression_cF)
@@ -6,7 +6,6 @@
 # Builtin/3rd party package imports
 import numpy as np
 import h5py
-import dask.distributed as dd
 
 # Local imports
 from syncopy import __acme__
@@ -16,8 +15,6 @@ from syncopy.shared.errors import SPYValueError, SPYTypeError, SPYWarning, SPYIn
 from syncopy.shared.computational_routine import ComputationalRoutine
 from syncopy.shared.kwarg_decorators import process_io, detect_parallel_client
 
-import dask.distributed as dd
-
 __all__ = ["concat"]
 
 
@@ -35,6 +32,8 @@ def concat(spy_obj1, spy_obj2, dim="channel"):
        The concatenation dimension
     """
 
+    import dask.distributed as dd
+
     # -- sanity checks --
 
     if not issubclass(spy_obj1.__class__, ContinuousData):
@@ -3,11 +3,15 @@ Helpers and tools for Syncopy data classes
 """
 
 import os
+import json
+import time
+import threading
 from numbers import Number
 import numpy as np
+import psutil
 
 # Syncopy imports
-from syncopy import __storage__, __storagelimit__, __sessionid__
+from syncopy import __storage__, __storagelimit__, __sessionid__, __spydir__, __storagecheckinterval__
 from syncopy.shared.errors import SPYTypeError, SPYValueError
 
 __all__ = ["TrialIndexer"]
@@ -19,7 +23,13 @@ class TrialIndexer:
         Class to obtain an indexable trials iterable from
         an instantiated Syncopy data class `data_object`.
         Relies on the `_get_trial` method of the
-        respective `data_object`.
+        respective `data_object`, and on its `_get_trials`
+        method for reading several trials at once if present.
+
+        Trials can be indexed by a single (absolute) trial index,
+        a list or array of trial indices or a slice. Several trials
+        come as one stacked array (trials along the first axis) if they
+        all have the same shape, otherwise as a list of arrays.
 
         Parameters
         ----------
@@ -30,23 +40,45 @@ class TrialIndexer:
         """
 
         self.data_object = data_object
-        self.idx_set = set(idx_list)
-        self._len = len(idx_list)
+        self.idx_list = list(idx_list)
+        self.idx_set = set(self.idx_list)
+        self._len = len(self.idx_list)
 
     def __getitem__(self, trialno):
         # single trial access via index operator []
-        if not isinstance(trialno, Number):
-            raise SPYTypeError(trialno, "trial index", "single number to index a single trial")
-        if trialno not in self.idx_set:
-            lgl = "index of existing trials"
-            raise SPYValueError(lgl, "trial index", trialno)
-        return self.data_object._get_trial(trialno)
+        if _is_trial_index(trialno):
+            if trialno not in self.idx_set:
+                lgl = "index of existing trials"
+                raise SPYValueError(lgl, "trial index", trialno)
+            return self.data_object._get_trial(trialno)
+
+        # multiple trials: slices select the existing trials in their range
+        if isinstance(trialno, slice):
+            stop = max(self.idx_list, default=-1) + 1
+            trialnos = [i for i in range(*trialno.indices(stop)) if i in self.idx_set]
+        elif isinstance(trialno, (list, tuple, range, np.ndarray)) and np.ndim(trialno) == 1:
+            trialnos = list(trialno)
+            if not all(_is_trial_index(i) for i in trialnos):
+                raise SPYTypeError(trialno, "trial index", "number, list or slice of trial indices")
+            invalid = [i for i in trialnos if i not in self.idx_set]
+            if invalid:
+                lgl = "index of existing trials"
+                raise SPYValueError(lgl, "trial index", invalid)
+        else:
+            raise SPYTypeError(trialno, "trial index", "number, list or slice of trial indices")
+
+        trials = self._read_trials([int(i) for i in trialnos])
+        if isinstance(trials, np.ndarray):
+            return trials
+        if len(trials) > 0 and all(trl.shape == trials[0].shape for trl in trials):
+            return np.stack(trials)
+        return trials
 
     def __iter__(self):
         # this generator gets freshly created and exhausted
         # for each new iteration, with only 1 trial being in memory
         # at any given time
-        yield from (self[i] for i in self.idx_set)
+        yield from (self[i] for i in self.idx_list)
 
     def __len__(self):
         return self._len
@@ -57,6 +89,66 @@ class TrialIndexer:
     def __str__(self):
         return "{} element iterable".format(self._len)
 
+    def prefetch(self, max_mem=None, depth=8):
+        """
+        Iterate over the trials in order while a background
+        thread reads the next ones
+
+        Parameters
+        ----------
+        max_mem : int or None
+            Memory budget in bytes for the trials read ahead,
+            defaults to 10% of the available memory
+        depth : int
+            Maximal number of trials read ahead
+
+        Returns
+        -------
+        trials : iterator
+            Yields the trials in the order of iteration over
+            the `TrialIndexer` itself
+        """
+
+        if max_mem is None:
+            max_mem = 0.1 * psutil.virtual_memory().available
+        yield from _prefetch_trials(self, max_mem, depth)
+
+    def _read_trials(self, trialnos):
+        """
+        Local helper to read several trials, in a bulk read via
+        `_get_trials` if the data object supports it
+        """
+
+        if hasattr(self.data_object, "_get_trials"):
+            return self.data_object._get_trials(trialnos)
+        return [self.data_object._get_trial(i) for i in trialnos]
+
+
+def _is_trial_index(idx):
+    """
+    Local helper to tell numbers from booleans, which are numbers, too
+    """
+
+    return isinstance(idx, Number) and not isinstance(idx, (bool, np.bool_))
+
+
+def _prefetch_trials(indexer, max_mem, depth):
+    """
+    Local helper for :meth:`TrialIndexer.prefetch`: the size of the first
+    trial determines how many trials fit into the memory budget
+    """
+
+    from syncopy.shared.pipelined_io import TrialPrefetcher
+
+    if len(indexer.idx_list) == 0:
+        return
+    first = indexer[indexer.idx_list[0]]
+    nAhead = int(max_mem // max(first.nbytes, 1))
+    rest = indexer.idx_list[1:]
+    yield first
+    del first
+    yield from TrialPrefetcher(lambda n: indexer[rest[n]], len(rest), depth=max(0, min(depth, nAhead)))
+
 
 class TimeIndexer:
     def __init__(self, trialdefinition, samplerate, idx_list):
@@ -76,7 +168,8 @@ class TimeIndexer:
 
         self.trialdefinition = trialdefinition
         self.samplerate = samplerate
-        self.idx_set = set(idx_list)
+        self.idx_list = list(idx_list)
+        self.idx_set = set(self.idx_list)
         self._len = len(idx_list)
 
     def construct_time_array(self, trialno):
@@ -97,7 +190,7 @@ class TimeIndexer:
         # this generator gets freshly created and exhausted
         # for each new iteration, with only 1 time array being in memory
         # at any given time
-        yield from (self[i] for i in self.idx_set)
+        yield from (self[i] for i in self.idx_list)
 
     def __len__(self):
         return self._len
@@ -137,12 +230,9 @@ def get_dir_size(start_path=".", out="byte"):
 
 def setup_storage(storage_dir=__storage__):
     """
-    Create temporary storage dir if needed, and report on its size.
+    Create temporary storage dir if needed.
 
-    Returns
-    -------
-    storage_size: Size of files in temporary storage directory, in GB.
-    storage_num_files: Number of files in temporary storage directory.
+    The size of its contents is not assessed here, see :func:`check_storage`.
     """
 
     # Create package-wide tmp directory if not already present
@@ -156,4 +246,141 @@ def setup_storage(storage_dir=__storage__):
             )
             raise IOError(err.format(storage_dir, str(exc)))
 
-    return get_dir_size(storage_dir, out="GB")
+
+def storage_census(storage_dir=__storage__, spy_dir=__spydir__):
+    """
+    Compute size and number of files in temporary storage and Syncopy config folder.
+
+    If the temporary storage dir is located inside the config folder (the default),
+    both get assessed in a single walk of the config folder.
+
+    Returns
+    -------
+    census : dict
+        Dictionary with keys `"storage_size_gb"`, `"storage_num_files"`,
+        `"spydir_size_gb"`, `"spydir_num_files"` and `"timestamp"` (in seconds
+        since the epoch).
+    """
+
+    storage_dir = os.path.abspath(storage_dir)
+    spy_dir = os.path.abspath(spy_dir)
+    census = {"timestamp": time.time()}
+
+    if os.path.commonpath([storage_dir, spy_dir]) == spy_dir:
+        storage_bytes, storage_num_files = 0, 0
+        spydir_bytes, spydir_num_files = 0, 0
+        for dirpath, _, filenames in os.walk(spy_dir):
+            inStorage = os.path.commonpath([dirpath, storage_dir]) == storage_dir
+            for f in filenames:
+                fp = os.path.join(dirpath, f)
+                try:
+                    if not os.path.islink(fp):
+                        size = os.path.getsize(fp)
+                        spydir_bytes += size
+                        spydir_num_files += 1
+                        if inStorage:
+                            storage_bytes += size
+                            storage_num_files += 1
+                except Exception as ex:  # Ignore issues from several parallel cleanup processes.
+                    pass
+        census["storage_size_gb"] = storage_bytes / 1e9
+        census["storage_num_files"] = storage_num_files
+        census["spydir_size_gb"] = spydir_bytes / 1e9
+        census["spydir_num_files"] = spydir_num_files
+    else:
+        census["storage_size_gb"], census["storage_num_files"] = get_dir_size(storage_dir, out="GB")
+        census["spydir_size_gb"], census["spydir_num_files"] = get_dir_size(spy_dir, out="GB")
+
+    return census
+
+
+def check_storage(block=False, max_age=__storagecheckinterval__):
+    """
+    Warn if temporary storage or Syncopy config folder exceed the storage limit.
+
+    Walking large storage directories (in particular on network file systems)
+    is slow, thus results of :func:`storage_census` are cached in the Syncopy
+    config folder. If the cached census is older than `max_age` hours, it is
+    refreshed in a background thread (or right away if `block` is `True`) and
+    the warning is issued once the new census is available.
+
+    Parameters
+    ----------
+    block : bool
+        If `True`, do not use a background thread for refreshing the census.
+    max_age : float
+        Maximum age of the cached census in hours. Set to 0 to always refresh.
+
+    Returns
+    -------
+    census : dict or None
+        The (cached) census, `None` if it is refreshed in the background.
+
+    Notes
+    -----
+    On ``import syncopy`` this check runs in the background. Set the environment
+    variable `SPYSTORAGECHECK` to ``"sync"`` to run it synchronously or to
+    ``"off"`` to skip it.
+    """
+
+    cacheFile = os.path.join(__spydir__, ".storage_census.json")
+    census = None
+    try:
+        with open(cacheFile, "r") as fid:
+            census = json.load(fid)
+        if census.get("storage") != __storage__ or time.time() - census["timestamp"] > max_age * 3600:
+            census = None
+    except Exception:  # Missing or corrupted cache, outdated layout
+        census = None
+
+    if census is not None:
+        _warn_storage(census)
+        return census
+
+    def _refresh():
+        census = storage_census()
+        census["storage"] = __storage__
+        try:
+            with open(cacheFile, "w") as fid:
+                json.dump(census, fid)
+        except OSError:
+            pass
+        _warn_storage(census)
+        return census
+
+    if block:
+        return _refresh()
+    threading.Thread(target=_refresh, name="spy-storage-census", daemon=True).start()
+    return None
+
+
+def _warn_storage(census):
+    """
+    Local helper to print the storage warning for a given census
+    """
+
+    from syncopy import startup_print_once
+
+    storage_msg = (
+        "\nSyncopy <core> WARNING: {folder_desc}:s '{tmpdir:s}' "
+        + "contains {nfs:d} files taking up a total of {sze:4.2f} GB on disk. \n"
+        + "Please run `spy.cleanup()` and/or manually free up disk space."
+    )
+    if census["storage_size_gb"] > __storagelimit__:
+        msg_formatted = storage_msg.format(
+            folder_desc="Temporary storage folder",
+            tmpdir=__storage__,
+            nfs=census["storage_num_files"],
+            sze=census["storage_size_gb"],
+        )
+        startup_print_once(msg_formatted, force=True)
+    else:
+        # We also check the size of the whole Syncopy cfg folder, as older Syncopy versions placed files directly into it.
+        if census["spydir_size_gb"] > __storagelimit__:
+            msg_formatted = storage_msg.format(
+                folder_desc="User config folder",
+                tmpdir=__spydir__,
+                nfs=census["spydir_num_files"],
+                sze=census["spydir_size_gb"],
+            )
+            startup_print_once(msg_formatted, force=True)
@@ -283,7 +283,13 @@ def _read_hdf_structure(h5Group, h5File, mem_use, include_fields=None):
     # with the default dimord ['time', 'channel']
     # and our default data type np.float32 -> implicit casting!
     with h5py.File(AData.filename, mode="w") as h5FileOut:
-        ADset = h5FileOut.create_dataset("data", dtype=np.float32, shape=[nTotalSamples, nChannels])
+        shape = [nTotalSamples, nChannels]
+        ADset = h5FileOut.create_dataset(
+            "data",
+            dtype=np.float32,
+            shape=shape,
+            **AData._dataset_kwargs("data", shape, np.float32, trlSamples),
+        )
 
         pbar = tqdm(trl_refs, desc=f"{struct_name} - loading {nTrials} trials", disable=None)
 
@@ -405,7 +411,14 @@ def _read_dict_structure(structure, include_fields=None):
 
     with h5py.File(AData._filename, "w") as h5file:
 
-        dset = h5file.create_dataset("data", dtype=np.float32, shape=[nTotalSamples, nChannels])
+        shape = [nTotalSamples, nChannels]
+        trlSamples = [trl.shape[1] for trl in structure["trial"]]
+        dset = h5file.create_dataset(
+            "data",
+            dtype=np.float32,
+            shape=shape,
+            **AData._dataset_kwargs("data", shape, np.float32, trlSamples),
+        )
 
         stack_count = 0
         for trl in structure["trial"]:
@@ -27,10 +27,6 @@ from syncopy import __pynwb__
 __all__ = ["load_nwb"]
 
 
-if __pynwb__:
-    import pynwb
-
-
 def _is_valid_nwb_file(filename):
     try:
         this_python = os.path.join(os.path.dirname(sys.executable), "python")
@@ -76,6 +72,8 @@ def load_nwb(
     """
     if not __pynwb__:
         raise SPYError("NWB support is not available. Please install the 'pynwb' package.")
+    import pynwb
+    import pynwb.ecephys
 
     # Check if file exists
     nwbPath, nwbBaseName = io_parser(filename, varname="filename", isfile=True, exists=True)
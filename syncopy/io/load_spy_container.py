@@ -22,6 +22,7 @@ from syncopy.shared.errors import (
     SPYWarning,
 )
 from syncopy.io.utils import hash_file, startInfoDict
+from syncopy.shared.storage_policy import register_filters
 import syncopy.datatype as spd
 import syncopy as spy
 
@@ -250,6 +251,9 @@ def _load(filename, checksum, mode, out):
     with open(jsonFile, "r") as file:
         jsonDict = json.load(file)
 
+    # the container may have been compressed with one of the filters of hdf5plugin
+    register_filters()
+
     if "dataclass" not in jsonDict.keys():
         raise SPYError("Info file {} does not contain a dataclass field".format(jsonFile))
 
@@ -761,8 +761,12 @@ class ESI_TDTdata:
                 data = np.vstack(data).T
                 if start == 0:
                     # this is the actual dataset for the AnalogData
+                    shape = (data.shape[0], len(Files))
                     target = combined_data_file.create_dataset(
-                        "data", shape=(data.shape[0], len(Files)), dtype="single"
+                        "data",
+                        shape=shape,
+                        dtype="single",
+                        **AData._dataset_kwargs("data", shape, np.float32),
                     )
                 if self.subtract_median:
                     data -= np.median(data, keepdims=True).astype(data.dtype)
@@ -21,16 +21,7 @@ import pytz
 import os
 import shutil
 
-from syncopy import __pynwb__
-
-
-if __pynwb__:
-    import pynwb
-    from pynwb import NWBFile
-    from pynwb.ecephys import LFP, ElectricalSeries
-    from hdmf.common import (
-        DynamicTableRegion,
-    )  # hdmf is a dependency of pynwb, so this should be available.
+# Note: pynwb is only imported by the functions below that need it
 
 # Local imports
 
@@ -50,6 +41,8 @@ def _get_nwbfile_template(channels=None):
     the correct amount of electrodes for the data's channel count must already exist, or be added later before
     adding data.
     """
+    from pynwb import NWBFile
+
     start_time_no_tz = datetime.now()
     tz = pytz.timezone("Europe/Berlin")
     start_time = tz.localize(start_time_no_tz)
@@ -172,6 +165,8 @@ def _analog_timelocked_to_nwbfile(
     """
     # See https://pynwb.readthedocs.io/en/stable/tutorials/domain/ecephys.html
     # It is also worth veryfying that the web tool nwbexplorer can read the produced files, see http://nwbexplorer.opensourcebrain.org/.
+    from pynwb.ecephys import LFP, ElectricalSeries
+    from hdmf.common import DynamicTableRegion  # hdmf is a dependency of pynwb, so this should be available.
 
     if nwbfile is None:
         nwbfile = _get_nwbfile_template(atdata.channel)
@@ -18,6 +18,7 @@ from syncopy.shared.parsers import filename_parser, data_parser
 from syncopy.shared.errors import SPYIOError, SPYTypeError, SPYError, SPYWarning
 from syncopy.io.utils import hash_file, startInfoDict
 from syncopy import __storage__
+from syncopy.datatype.continuous_data import ContinuousData
 
 __all__ = ["save"]
 
@@ -202,7 +203,13 @@ def save(out, container=None, tag=None, filename=None, overwrite=False):
                     f"Writing dataset '{datasetName}' ({len(out._hdfFileDatasetProperties)} datasets total) to HDF5 file '{dataFile}'.",
                     level="DEBUG",
                 )
-                dat = h5f.create_dataset(datasetName, data=dataset)
+                # align chunks with the trials of continuous data (`sampleinfo` of
+                # `DiscreteData` does not refer to rows of the dataset)
+                trialLengths = None
+                if datasetName == "data" and isinstance(out, ContinuousData) and out.sampleinfo is not None:
+                    trialLengths = np.diff(out.sampleinfo, axis=1).ravel().tolist()
+                dsetKwargs = out._dataset_kwargs(datasetName, dataset.shape, dataset.dtype, trialLengths)
+                dat = h5f.create_dataset(datasetName, data=dataset, **dsetKwargs)
             else:
                 spy.log(
                     f"Not writing 'None 'dataset '{datasetName}' ({len(out._hdfFileDatasetProperties)} datasets total) to HDF5 file '{dataFile}'.",
@@ -6,13 +6,10 @@
 # Builtin/3rd party package imports
 import os
 import sys
-import shutil
 import inspect
 import numpy as np
 from datetime import datetime
-from glob import glob
 from collections import OrderedDict
-from tqdm import tqdm
 
 if sys.platform == "win32":
     # tqdm breaks term colors on Windows - fix that (tqdm issue #446)
@@ -22,9 +19,9 @@ if sys.platform == "win32":
     colorama.init(strip=False)
 
 # Local imports
-from syncopy import __storage__, __sessionid__, __checksum_algorithm__, __spydir__
+from syncopy import __checksum_algorithm__
 from syncopy.datatype.base_data import BaseData
-from syncopy.datatype.util import get_dir_size
+from syncopy.shared.storage import get_storage_manager
 from syncopy.shared.parsers import scalar_parser
 from syncopy.shared.errors import SPYTypeError, log
 from syncopy.shared.queries import user_input
@@ -65,17 +62,22 @@ def cleanup(older_than=24, interactive=True, only_current_session=False):
     Delete old files in temporary Syncopy folder
 
     The location of the temporary folder is stored in `syncopy.__storage__`.
+    Files are looked up in the index of temporary files every Syncopy session
+    keeps, files still used by Syncopy objects of running sessions are never
+    removed.
 
     Parameters
     ----------
     older_than : int
-        Files older than `older_than` hours will be removed
+        Files of sessions on other hosts whose index did not change for
+        `older_than` hours as well as files not found in any index which are
+        older than `older_than` hours will be removed
     interactive : bool
         Set to `False` to remove all (sessions and dangling files) at once
         without a prompt asking for confirmation
     only_current_session : bool
         Set to `True` to only remove dangling files associated to *this*
-        Syncopy instance
+        Syncopy instance, i.e., files not referenced by any object anymore
 
     Examples
     --------
@@ -88,12 +90,14 @@ def cleanup(older_than=24, interactive=True, only_current_session=False):
 
     # For clarification: show location of storage folder that is scanned here
     funcName = "Syncopy <{}>".format(inspect.currentframe().f_code.co_name)
-    storage_size_gb, storage_num_files = get_dir_size(__storage__, out="GB")
+    manager = get_storage_manager()
+    sessions = manager.sessions(max_age=older_than)
+    storage_size_gb, storage_num_files = _indexed_usage(manager, sessions)
     dirInfo = "\n{name:s} Analyzing temporary storage folder '{dir:s}' containing {numf:d} files with total size {sizegb:.2f} GB...\n"
     log(
         dirInfo.format(
             name=funcName,
-            dir=__storage__,
+            dir=manager.storage_dir,
             numf=storage_num_files,
             sizegb=storage_size_gb,
         ),
@@ -104,25 +108,32 @@ def cleanup(older_than=24, interactive=True, only_current_session=False):
     if not isinstance(interactive, bool):
         raise SPYTypeError(interactive, varname="interactive", expected="bool")
 
-    # Also check for dangling data (not associated to any session)
-    data = glob(os.path.join(__storage__, "spy_*"))
-    dangling = []
-    for dat in data:
-        sessid = os.path.splitext(os.path.basename(dat))[0].split("_")[1]
-        if not only_current_session:
-            dangling.append(dat)
-        elif sessid == __sessionid__:
-            dangling.append(dat)
+    # Collect dangling data: files of this session not referenced by any object,
+    # files of sessions which are not running anymore and files not found in any
+    # index (e.g., left behind by earlier Syncopy versions)
+    dangling = manager.files(referenced=False)
+    if not only_current_session:
+        for info in sessions:
+            if not info["alive"]:
+                dangling.update({fname: entry.get("size", 0) for fname, entry in info["entries"].items()})
+        indexed = set(manager.files())
+        for info in sessions:
+            indexed.update(info["entries"])
+        indexed.update([os.path.splitext(fname)[0] for fname in indexed])
+        cutoff = datetime.now().timestamp() - older_than * 3600
+        with os.scandir(manager.storage_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("spy_") and entry.path not in indexed:
+                    try:
+                        if entry.stat().st_mtime <= cutoff:
+                            dangling[entry.path] = entry.stat().st_size if entry.is_file() else 0
+                    except OSError:
+                        pass
 
     # Farewell if nothing's to do here
     if not dangling:
         ext = "Did not find any dangling data or Syncopy session remains " + "older than {age:d} hours."
         log(ext.format(name=funcName, age=older_than), caller=cleanup)
-        spydir_size_gb, spydir_num_files = get_dir_size(__spydir__, out="GB")
-        log(
-            f"Note: {spydir_num_files} files with total size of {spydir_size_gb:.2f} GB left in spy dir '{__spydir__}'.",
-            caller=cleanup,
-        )
         return
 
     # Prepare info prompt for dangling files
@@ -131,26 +142,8 @@ def cleanup(older_than=24, interactive=True, only_current_session=False):
             "Found {numdang:d} dangling files not associated to any session "
             + "using {szdang:4.1f} GB of disk space. \n"
         )
-        numdang = 0
-        szdang = 0.0
-        for file in dangling:
-            try:
-                if os.path.isfile(file):
-                    szdang += os.path.getsize(file) / 1024**3
-                    numdang += 1
-                elif os.path.isdir(file):
-                    szdang += sum(
-                        os.path.getsize(os.path.join(dirpth, fname)) / 1024**3
-                        for dirpth, _, fnames in os.walk(file)
-                        for fname in fnames
-                    )
-                    numdang += 1
-
-            except OSError as ex:
-                log(
-                    f"Dangling file {file} no longer exists: {ex}. (Maybe already deleted.)",
-                    caller=cleanup,
-                )
+        numdang = len(dangling)
+        szdang = sum(dangling.values()) / 1024**3
         dangInfo = dangInfo.format(numdang=numdang, szdang=szdang)
 
         dangOptions = (
@@ -183,29 +176,18 @@ def cleanup(older_than=24, interactive=True, only_current_session=False):
     else:
         choice = "R"
 
-    # Deleate all dangling files at once
-    if choice == "D":
-        for dat in tqdm(dangling, desc="Deleting dangling data...", disable=None):
-            _rm_session([dat])
-
-    # Delete everything
-    elif choice == "R":
-        for contents in tqdm([[dat] for dat in dangling], desc="Deleting temporary data...", disable=None):
-            _rm_session(contents)
+    # Delete all dangling files at once (this also updates the indices)
+    if choice in ["D", "R"]:
+        manager.remove(list(dangling), sessions=sessions)
 
     # Don't do anything for now, continue w/dangling data
     else:
         print(f"Aborting...")
 
     # Report on remaining data
-    storage_size_gb, storage_num_files = get_dir_size(__storage__, out="GB")
+    storage_size_gb, storage_num_files = _indexed_usage(manager, sessions)
     log(
-        f"{storage_num_files} files with total size of {storage_size_gb:.2f} GB left in storage dir '{__storage__}'.",
-        caller="cleanup",
-    )
-    spydir_size_gb, spydir_num_files = get_dir_size(__spydir__, out="GB")
-    log(
-        f"{spydir_num_files} files with total size of {spydir_size_gb:.2f} GB left in spy dir '{__spydir__}'.",
+        f"{storage_num_files} indexed files with total size of {storage_size_gb:.2f} GB left in storage dir '{manager.storage_dir}'.",
         caller="cleanup",
     )
 
@@ -248,14 +230,13 @@ def clear():
     return
 
 
-def _rm_session(session_files):
+def _indexed_usage(manager, sessions):
     """
-    Local helper for deleting tmp data of a given spy session
+    Local helper summing up size (in GB) and number of indexed temporary files
     """
-    for file in session_files:
-        try:
-            os.unlink(file) if os.path.isfile(file) else shutil.rmtree(file)
-        except Exception as ex:
-            pass
-
-    return
+    size = manager.usage()
+    numFiles = len(manager.files())
+    for info in sessions:
+        size += sum(entry.get("size", 0) for entry in info["entries"].values())
+        numFiles += len(info["entries"])
+    return size / 1e9, numFiles
@@ -7,8 +7,12 @@
 # Builtin/3rd party package imports
 import numpy as np
 import scipy.signal as sci
+import h5py
 import logging, platform
 from inspect import signature
+from abc import abstractmethod
+from time import perf_counter
+from tqdm.auto import tqdm
 
 # syncopy imports
 from syncopy.shared.computational_routine import (
@@ -16,11 +20,14 @@ from syncopy.shared.computational_routine import (
     propagate_properties,
 )
 from syncopy.shared.const_def import spectralConversions, spectralDTypes
+from syncopy.shared.errors import SPYWarning
 from syncopy.shared.kwarg_decorators import process_io
+from syncopy.shared.pipelined_io import BlockWriter
 
 # backend imports
-from .firws import design_wsinc, apply_fir, minphaserceps
-from .resampling import downsample, resample
+from .firws import apply_fir, stream_fir
+from .filter_cache import get_wsinc, get_butter_sos
+from .resampling import downsample, resample, resample_stream, anti_alias_window, _get_updn
 
 
 @process_io
@@ -32,6 +39,7 @@ def sinc_filtering_cF(
     order=None,
     window="hamming",
     direction="onepass",
+    fkernel=None,
     polyremoval=None,
     timeAxis=0,
     noCompute=False,
@@ -68,6 +76,10 @@ def sinc_filtering_cF(
        `'twopass'` - zero-phase forward and reverse filter, IIR and FIR
        `'onepass'` - forward filter, introduces group delays for IIR, zerophase for FIR
        `'onepass-minphase' - forward causal/minimum phase filter, FIR only
+    fkernel : 1D :class:`numpy.ndarray` or None
+        The filter kernel designed by the frontend, see
+        :func:`~syncopy.preproc.filter_cache.get_wsinc`. If `None` the kernel
+        gets designed from the parameters above (once per process).
     polyremoval : int or None
         Order of polynomial used for de-trending data in the time domain prior
         to filtering. A value of 0 corresponds to subtracting the mean
@@ -113,18 +125,21 @@ def sinc_filtering_cF(
     elif polyremoval == 1:
         dat = sci.detrend(dat, type="linear", axis=0, overwrite_data=True)
 
-    # max order is signal length
-    if order is None:
-        order = dat.shape[0]
-
     # construct the filter
-    fkernel = design_wsinc(window, order, freq / samplerate, filter_type)
+    if fkernel is None:
+        # max order is signal length
+        if order is None:
+            order = dat.shape[0]
+        fkernel = get_wsinc(
+            window, order, np.asarray(freq) / samplerate, filter_type, minphase=direction == "onepass-minphase"
+        )
 
     # switch to time-domain convolutions if NaNs present
     if np.any(np.isnan(dat)):
         method = "direct"
     else:
-        method = "fft"
+        # overlap-add with filter sized FFTs
+        method = "oa"
     # to pass info to user
     metadata = {"has_nan": np.array(method == "direct")}
 
@@ -139,14 +154,141 @@ def sinc_filtering_cF(
         filtered = apply_fir(filtered, fkernel, method)
 
     elif direction == "onepass-minphase":
-        # 0-phase transform
-        fkernel = minphaserceps(fkernel)
+        # the kernel already got transformed to minimum phase
         filtered = apply_fir(dat, fkernel, method)
 
     return filtered, metadata
 
 
-class SincFiltering(ComputationalRoutine):
+class StreamingRoutine(ComputationalRoutine):
+
+    """
+    Compute class base for operations along the time axis which can
+    process a single trial block by block
+
+    Sub-classes implement `_stream_trial`, which maps the blocks of
+    one trial to the blocks of its result.
+    """
+
+    # trials larger than this (in bytes) get processed block-wise
+    # in sequential computations, see `compute_sequential`
+    streamMem = 512 * 1024**2
+    # size of the blocks (in bytes) read at once when streaming
+    streamBlockMem = 64 * 1024**2
+
+    def compute_sequential(self, data, out):
+        """
+        Sequential computing kernel, streaming large trials
+
+        If any trial exceeds `self.streamMem` bytes, all trials are processed
+        in blocks of about `self.streamBlockMem` bytes read directly from the
+        source HDF5 dataset and the results get written block-wise to `out`.
+        Memory usage hence does not depend on the trial length.
+
+        Otherwise, see
+        :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.compute_sequential`
+        """
+
+        if not self._streaming(data):
+            return super().compute_sequential(data, out)
+
+        readTime = 0
+
+        sourceObj = h5py.File(data.filename, mode="r")[data.data.name]
+        try:
+            with BlockWriter(out.filename, self.outDatasetName, max_queue=2) as writer:
+                for nblock in tqdm(range(self.numTrials), bar_format=self.tqdmFormat, disable=None):
+
+                    ingrid = self.sourceLayout[nblock]
+                    trlShape = self.sourceShapes[nblock]
+                    tStart = ingrid[0].start
+                    rowBytes = max(1, np.prod(trlShape[1:]) * sourceObj.dtype.itemsize)
+
+                    def read(start, stop):
+                        nonlocal readTime
+                        t0 = perf_counter()
+                        arr = np.array(sourceObj[(slice(tStart + start, tStart + stop),) + tuple(ingrid[1:])])
+                        arr.shape = (stop - start,) + tuple(trlShape[1:])
+                        readTime += perf_counter() - t0
+                        return arr
+
+                    # the last block gets held back to attach the metadata
+                    outgrid = self.targetLayout[nblock]
+                    oStart = outgrid[0].start
+                    pending = None
+                    pos = 0
+                    details = {}
+                    for res in self._stream_trial(read, trlShape, rowBytes, details):
+                        if res.shape[0] == 0:
+                            continue
+                        if pending is not None:
+                            writer.put(*pending)
+                        grid = (slice(oStart + pos, oStart + pos + res.shape[0]),) + tuple(outgrid[1:])
+                        pending = (grid, res.astype(self.dtype, copy=False))
+                        pos += res.shape[0]
+
+                    trial_idx = data.selection.trial_ids[nblock] if data.selection is not None else nblock
+                    writer.put(*pending, {trial_idx: details} if details else None)
+        finally:
+            sourceObj.file.close()
+
+        self.writerStats = writer.stats
+        # blocks are read synchronously, there is no read-ahead to wait for
+        self.readerStats = {"read_time": readTime}
+
+    @abstractmethod
+    def _stream_trial(self, read, trlShape, rowBytes, details):
+        """
+        Generator yielding the result of one trial block by block
+
+        Parameters
+        ----------
+        read : callable
+            ``read(start, stop)`` returns the samples ``start:stop`` of the trial
+        trlShape : tuple
+            Shape of the trial
+        rowBytes : int
+            Size of a single sample (all channels) in bytes
+        details : dict
+            Gets filled with the metadata of the trial
+        """
+        pass
+
+    def _streaming(self, data):
+        """
+        Whether the trials get processed block-wise, only possible
+        for plain time slices without fancy indexing and
+        without fused `pre_stages` acting on entire trials
+        """
+
+        if not self.keeptrials or self.useFancyIdx or self.cfg["timeAxis"] != 0:
+            return False
+        if self.numBlocksPerTrial != 1:
+            return False
+        if any(not isinstance(grid[0], slice) or grid[0].step not in (None, 1) for grid in self.sourceLayout):
+            return False
+        if not self._large_trials(data):
+            return False
+        if self.cfg.get("pre_stages"):
+            msg = (
+                f"Trials exceed {self.streamMem / 1024**2:.0f} MB but the fused pre-stages "
+                + "act on entire trials, hence these are processed in memory"
+            )
+            SPYWarning(msg)
+            return False
+        return True
+
+    def _large_trials(self, data):
+        """
+        Whether any trial exceeds `self.streamMem` bytes, requires
+        the routine to be initialized
+        """
+
+        itemsize = np.dtype(data.data.dtype).itemsize
+        return max(np.prod(shape) for shape in self.sourceShapes) * itemsize > self.streamMem
+
+
+class SincFiltering(StreamingRoutine):
 
     """
     Compute class that performs filtering with windowed sinc filters
@@ -156,6 +298,10 @@ class SincFiltering(ComputationalRoutine):
     see :doc:`/developer/compute_kernels` for technical details on Syncopy's compute
     classes and metafunctions.
 
+    Large trials get filtered block-wise with the filter state carried over
+    between blocks (see :class:`~syncopy.preproc.firws.FIRStream`), the results
+    are identical to filtering the whole trial at once.
+
     See also
     --------
     syncopy.preprocessing : parent metafunction
@@ -166,11 +312,83 @@ class SincFiltering(ComputationalRoutine):
     # 1st argument,the data, gets omitted
     valid_kws = list(signature(sinc_filtering_cF).parameters.keys())[1:]
 
+    def _stream_trial(self, read, trlShape, rowBytes, details):
+
+        cfg = self.cfg
+        npass = 2 if cfg["direction"] == "twopass" else 1
+        nSamples = trlShape[0]
+
+        fkernel = cfg["fkernel"]
+        if fkernel is None:
+            # max order is signal length
+            order = cfg["order"] if cfg["order"] is not None else nSamples
+            fkernel = get_wsinc(
+                cfg["window"],
+                order,
+                np.asarray(cfg["freq"]) / cfg["samplerate"],
+                cfg["filter_type"],
+                minphase=cfg["direction"] == "onepass-minphase",
+            )
+
+        blockLen = int(max(len(fkernel), self.streamBlockMem // rowBytes))
+        bounds = [(start, min(start + blockLen, nSamples)) for start in range(0, nSamples, blockLen)]
+        trend = _stream_trend(read, bounds, cfg["polyremoval"])
+
+        hasNan = False
+
+        def blocks():
+            nonlocal hasNan
+            for start, stop in bounds:
+                arr = read(start, stop)
+                if trend is not None:
+                    arr = arr - trend(start, stop)
+                hasNan |= bool(np.isnan(arr).any())
+                yield arr
+
+        yield from stream_fir(blocks(), fkernel, npass)
+        details["has_nan"] = np.array(hasNan)
+
     def process_metadata(self, data, out):
 
         propagate_properties(data, out)
 
 
+def _stream_trend(read, bounds, polyremoval):
+    """
+    Fits the constant (``polyremoval=0``) or linear (``polyremoval=1``)
+    trend of a trial read block-wise via ``read(start, stop)``
+    within the sample `bounds` of the blocks
+
+    Returns
+    -------
+    trend : callable or None
+        ``trend(start, stop)`` gives the trend of the respective block,
+        `None` if `polyremoval` is `None`
+    """
+
+    if polyremoval not in (0, 1):
+        return None
+
+    # accumulate the sums for the least squares fit
+    nSamples = bounds[-1][1]
+    sumX, sumTX = 0, 0
+    for start, stop in bounds:
+        arr = read(start, stop)
+        sumX = sumX + arr.sum(axis=0)
+        if polyremoval == 1:
+            sumTX = sumTX + np.arange(start, stop) @ arr
+
+    mean = sumX / nSamples
+    if polyremoval == 0:
+        return lambda start, stop: mean
+
+    # centered sample times
+    tMean = (nSamples - 1) / 2
+    sumTT = nSamples * (nSamples**2 - 1) / 12
+    slope = (sumTX - tMean * sumX) / sumTT
+    return lambda start, stop: mean + (np.arange(start, stop) - tMean)[:, np.newaxis] * slope
+
+
 @process_io
 def but_filtering_cF(
     dat,
@@ -179,6 +397,7 @@ def but_filtering_cF(
     freq=None,
     order=6,
     direction="twopass",
+    sos=None,
     polyremoval=None,
     timeAxis=0,
     noCompute=False,
@@ -208,6 +427,10 @@ def but_filtering_cF(
        Filter direction:
        `'twopass'` - zero-phase forward and reverse filter
        `'onepass'` - forward filter, introduces group delays
+    sos : (n_sections, 6) :class:`numpy.ndarray` or None
+        The second-order sections designed by the frontend, see
+        :func:`~syncopy.preproc.filter_cache.get_butter_sos`. If `None` the
+        filter gets designed from the parameters above (once per process).
     polyremoval : int or None
         Order of polynomial used for de-trending data in the time domain prior
         to filtering. A value of 0 corresponds to subtracting the mean
@@ -262,7 +485,10 @@ def but_filtering_cF(
         dat = sci.detrend(dat, type="linear", axis=0, overwrite_data=True)
 
     # design the butterworth filter with "second-order-sections" output
-    sos = sci.butter(order, freq, filter_type, fs=samplerate, output="sos")
+    if sos is None:
+        sos = get_butter_sos(order, freq, filter_type, samplerate)
+    # SciPy's sosfilt needs a writeable copy of the shared sections
+    sos = np.array(sos)
 
     # do the filtering
     if direction == "twopass":
@@ -544,6 +770,7 @@ def resample_cF(
     new_samplerate=1,
     lpfreq=None,
     order=None,
+    window=None,
     timeAxis=0,
     chunkShape=None,
     noCompute=False,
@@ -572,6 +799,10 @@ def resample_cF(
         Order (length) of the firws anti-aliasing filter.
         The default `None` will create a filter of
         maximal order which is the number of samples in the trial.
+    window : None or 1D :class:`numpy.ndarray`, optional
+        The anti-aliasing filter designed by the frontend, see
+        :func:`~syncopy.preproc.resampling.anti_alias_window`.
+        If `None` it gets designed here (once per process).
     timeAxis : int, optional
         Index of running time axis in `dat` (0 or 1)
 
@@ -609,12 +840,12 @@ def resample_cF(
         f"Resampling data chunk with shape {dat.shape} from samplerate {samplerate} to {new_samplerate} with lpfreq={lpfreq}, order={order}."
     )
 
-    resampled = resample(dat, samplerate, new_samplerate, lpfreq=lpfreq, order=order)
+    resampled = resample(dat, samplerate, new_samplerate, lpfreq=lpfreq, order=order, window=window)
 
     return resampled
 
 
-class Resample(ComputationalRoutine):
+class Resample(StreamingRoutine):
 
     """
     Compute class that performs resampling (up-fir-down)
@@ -624,6 +855,10 @@ class Resample(ComputationalRoutine):
     see :doc:`/developer/compute_kernels` for technical details on Syncopy's compute
     classes and metafunctions.
 
+    Large trials get resampled block-wise with a fixed anti-aliasing
+    filter (see :func:`~syncopy.preproc.resampling.resample_stream`),
+    the results are identical to resampling the whole trial at once.
+
     See also
     --------
     syncopy.preprocessing : parent metafunction
@@ -632,7 +867,22 @@ class Resample(ComputationalRoutine):
     computeFunction = staticmethod(resample_cF)
 
     # 1st argument,the data, gets omitted
-    valid_kws = list(signature(downsample_cF).parameters.keys())[1:]
+    valid_kws = list(signature(resample_cF).parameters.keys())[1:]
+
+    def _stream_trial(self, read, trlShape, rowBytes, details):
+
+        cfg = self.cfg
+        nSamples = trlShape[0]
+        up, down = _get_updn(cfg["samplerate"], cfg["new_samplerate"])
+
+        window = cfg["window"]
+        if window is None:
+            window = anti_alias_window(
+                cfg["samplerate"], cfg["new_samplerate"], nSamples, cfg["lpfreq"], cfg["order"]
+            )
+
+        blockLen = int(max(down, self.streamBlockMem // rowBytes))
+        yield from resample_stream(read, nSamples, up, down, window, blockLen)
 
     def process_metadata(self, data, out):
 
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# Process-local cache for designed FIR/IIR filters
+# and resampling kernels
+#
+
+# Builtin/3rd party package imports
+from functools import lru_cache
+import numpy as np
+import scipy.signal as sci
+
+# local imports
+from .firws import design_wsinc, minphaserceps
+
+# Maximal number of different filters kept per process and filter class
+filter_cache_size = 64
+
+
+def get_wsinc(window, order, f_c, filter_type="lp", minphase=False):
+    """
+    Returns the windowed sinc filter kernel, either freshly designed
+    or from the process-local LRU cache.
+
+    All trials filtered with the same settings use the identical kernel,
+    hence it gets designed only once per process. The frontends
+    design the kernel up front and pass it on to the workers.
+
+    Parameters
+    ----------
+    window : str
+        One of `scipy.signal.windows`
+    order : int
+       The order, or simply length, of the filter
+    f_c : float or array_like
+       Cut-off frequenc(ies) in sampling units
+    filter_type : {'lp', 'hp', 'bp, 'bs'}, optional
+        Low-pass `'lp'`, high-pass `'hp'`, band-pass `'bp'` or band-stop `'bs'`
+    minphase : bool
+        Transform to a minimum phase (causal) filter,
+        see :func:`~syncopy.preproc.firws.minphaserceps`
+
+    Returns
+    -------
+    kernel : 1D :class:`numpy.ndarray`
+        The filter kernel, the array is read-only
+        as it is shared between all callers!
+    """
+
+    return _cached_wsinc(window, int(order), _freq_key(f_c), filter_type, bool(minphase))
+
+
+def get_butter_sos(order, freq, filter_type, samplerate):
+    """
+    Returns the second-order sections of a Butterworth filter,
+    either freshly designed or from the process-local LRU cache.
+
+    Parameters
+    ----------
+    order : int
+        Order of the filter
+    freq : float or array_like
+        Cut-off frequenc(ies) in Hz
+    filter_type : {'lp', 'hp', 'bp, 'bs'}
+        Type of the filter
+    samplerate : float
+        Sampling frequency in Hz
+
+    Returns
+    -------
+    sos : (n_sections, 6) :class:`numpy.ndarray`
+        The read-only second-order sections
+    """
+
+    return _cached_butter_sos(int(order), _freq_key(freq), filter_type, float(samplerate))
+
+
+def get_resampling_window(up, order, f_c):
+    """
+    Returns the anti-aliasing filter for the polyphase resampling
+    with upsampling factor `up`, either freshly designed or
+    from the process-local LRU cache.
+
+    Parameters
+    ----------
+    up : int
+        Upsampling factor
+    order : int
+        Order (length) of the filter
+    f_c : float or None
+        Cut-off frequency in units of the original sampling rate, set to `None`
+        for SciPy's default kaiser windowed FIR
+
+    Returns
+    -------
+    window : 1D :class:`numpy.ndarray` or tuple
+        The read-only filter kernel to be applied to the upsampled
+        data, or the window specification for SciPy's filter design
+    """
+
+    if not f_c:
+        return ("kaiser", 5.0)
+    return _cached_wsinc("hamming", int(order), float(f_c) / up, "lp", False)
+
+
+def filter_cache_info():
+    """
+    Hit and miss statistics of the process-local filter caches.
+
+    To inspect the caches of all workers of a dask cluster use
+    ``client.run(filter_cache_info)``.
+
+    Returns
+    -------
+    info : dict
+        With keys `'wsinc'` and `'butter'`, each holding
+        a dict with keys `'hits'`, `'misses'`, `'maxsize'` and `'currsize'`
+    """
+
+    return {
+        "wsinc": _cached_wsinc.cache_info()._asdict(),
+        "butter": _cached_butter_sos.cache_info()._asdict(),
+    }
+
+
+def clear_filter_cache():
+    """
+    Empties the process-local filter caches and resets their statistics
+    """
+
+    _cached_wsinc.cache_clear()
+    _cached_butter_sos.cache_clear()
+
+
+def _freq_key(freq):
+    # hashable representation of scalar or sequence frequencies
+    if np.ndim(freq) == 0:
+        return float(freq)
+    return tuple(float(f) for f in np.ravel(freq))
+
+
+@lru_cache(maxsize=filter_cache_size)
+def _cached_wsinc(window, order, f_c, filter_type, minphase):
+
+    f_c = np.array(f_c) if isinstance(f_c, tuple) else f_c
+    kernel = design_wsinc(window, order, f_c, filter_type)
+    if minphase:
+        kernel = minphaserceps(kernel)
+    kernel.flags.writeable = False
+
+    return kernel
+
+
+@lru_cache(maxsize=filter_cache_size)
+def _cached_butter_sos(order, freq, filter_type, samplerate):
+
+    freq = list(freq) if isinstance(freq, tuple) else freq
+    sos = sci.butter(order, freq, filter_type, fs=samplerate, output="sos")
+    sos.flags.writeable = False
+
+    return sos
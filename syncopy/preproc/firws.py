@@ -7,7 +7,7 @@
 # Builtin/3rd party package imports
 import numpy as np
 import scipy.signal.windows as sci_win
-from scipy.signal import convolve
+from scipy.signal import convolve, oaconvolve
 
 
 def apply_fir(data, fkernel, method="fft"):
@@ -24,9 +24,10 @@ def apply_fir(data, fkernel, method="fft"):
         columns represent individual channels.
     fkernel : (N,) :class:`numpy.ndarray`
         The time domain representation of the FIR filter
-    method : ('direct', 'fft')
-        Direct convolution in the time-domain or fft based
-        convolution
+    method : ('direct', 'fft', 'oa')
+        Direct convolution in the time-domain, fft based
+        convolution over the whole signal or overlap-add
+        with FFTs sized by the filter length
 
     Returns
     -------
@@ -39,10 +40,137 @@ def apply_fir(data, fkernel, method="fft"):
     slices[0] = slice(None)
     slices = tuple(slices)
 
-    filtered = convolve(data, fkernel[slices], mode="same", method=method)
+    if method == "oa":
+        filtered = oaconvolve(data, fkernel[slices], mode="same", axes=0)
+    else:
+        filtered = convolve(data, fkernel[slices], mode="same", method=method)
     return filtered
 
 
+class FIRStream:
+
+    """
+    Streaming FIR filter for signals which get processed in consecutive
+    blocks along the time axis, e.g. read chunk-wise from disk.
+
+    The last ``len(fkernel) - 1`` input samples are carried over between
+    blocks, such that the concatenated output is identical to
+    ``apply_fir(data, fkernel)`` on the whole signal (``mode='same'``
+    with zero padding at both ends). Each block gets convolved with
+    FFTs sized by the filter length (overlap-add), blocks containing
+    NaNs are convolved directly in the time-domain.
+
+    Parameters
+    ----------
+    fkernel : (M,) :class:`numpy.ndarray`
+        The time domain representation of the FIR filter
+
+    Examples
+    --------
+    >>> stream = FIRStream(fkernel)
+    >>> filtered = [stream.process(block) for block in blocks]
+    >>> filtered.append(stream.flush())
+    """
+
+    def __init__(self, fkernel):
+
+        self.fkernel = np.asarray(fkernel)
+        self.has_nan = False
+        self._history = None
+        # 'same' convolution drops the first (M - 1) // 2 samples
+        # of the full convolution, and appends that many at the end
+        self._delay = (len(self.fkernel) - 1) // 2
+        self._skip = self._delay
+
+    def process(self, block):
+
+        """
+        Filter the next `block` of samples
+
+        Parameters
+        ----------
+        block : (n, K) :class:`numpy.ndarray`
+            The next samples of the signal, time runs along the 1st axis
+
+        Returns
+        -------
+        filtered : (m, K) :class:`numpy.ndarray`
+            The filtered samples which are complete, lagging behind
+            the input by half the filter length
+        """
+
+        nTaps = len(self.fkernel)
+        if self._history is None:
+            self._history = np.zeros((nTaps - 1,) + block.shape[1:], dtype=np.result_type(block, self.fkernel))
+
+        if block.shape[0] == 0:
+            return block[:0]
+
+        extended = np.concatenate([self._history, block])
+        self._history = extended[extended.shape[0] - nTaps + 1 :]
+
+        slices = (slice(None),) + (None,) * (block.ndim - 1)
+        self.has_nan |= bool(np.isnan(block).any())
+        # NaNs still in the carried over samples have to stay local as well
+        if np.isnan(extended).any():
+            filtered = convolve(extended, self.fkernel[slices], mode="valid", method="direct")
+        else:
+            filtered = oaconvolve(extended, self.fkernel[slices], mode="valid", axes=0)
+
+        skip = min(self._skip, filtered.shape[0])
+        self._skip -= skip
+        return filtered[skip:]
+
+    def flush(self):
+
+        """
+        Returns the remaining filtered samples at the end of the signal
+        """
+
+        if self._history is None:
+            return np.empty((0,))
+        zeros = np.zeros((self._delay,) + self._history.shape[1:], dtype=self._history.dtype)
+        return self.process(zeros)
+
+
+def stream_fir(blocks, fkernel, npass=1):
+
+    """
+    Filter a signal given as an iterable of consecutive blocks
+    with bounded memory, see :class:`FIRStream`
+
+    Parameters
+    ----------
+    blocks : iterable of (n, K) :class:`numpy.ndarray`
+        The consecutive blocks of the signal
+    fkernel : (M,) :class:`numpy.ndarray`
+        The time domain representation of the FIR filter
+    npass : int
+        Number of times the filter gets applied, 2 for
+        a two-pass filter
+
+    Yields
+    ------
+    filtered : (m, K) :class:`numpy.ndarray`
+        Consecutive blocks of the filtered signal, in total
+        as many samples as the input
+    """
+
+    streams = [FIRStream(fkernel) for _ in range(npass)]
+
+    def cascade(block, first):
+        for stream in streams[first:]:
+            block = stream.process(block)
+        return block
+
+    for block in blocks:
+        yield cascade(block, 0)
+
+    # flush the stages one after another through the remaining ones
+    for idx, stream in enumerate(streams):
+        yield cascade(stream.flush(), idx + 1)
+
+
 def design_wsinc(window, order, f_c, filter_type="lp"):
 
     """
@@ -10,7 +10,7 @@ import numpy as np
 from syncopy import AnalogData
 from syncopy.shared.parsers import data_parser, scalar_parser, array_parser
 from syncopy.shared.tools import get_defaults, get_frontend_cfg
-from syncopy.shared.errors import SPYValueError, SPYInfo, SPYWarning
+from syncopy.shared.errors import SPYValueError, SPYTypeError, SPYInfo, SPYWarning
 from syncopy.shared.metadata import metadata_from_hdf5_file
 from syncopy.shared.kwarg_decorators import (
     unwrap_cfg,
@@ -22,7 +22,9 @@ from syncopy.shared.input_processors import (
     check_passed_kwargs,
 )
 
+from .filter_cache import get_wsinc, get_butter_sos
 from .compRoutines import (
+    StreamingRoutine,
     ButFiltering,
     SincFiltering,
     Rectify,
@@ -137,6 +139,201 @@ def preprocessing(
 
     new_cfg = get_frontend_cfg(defaults, lcls, kwargs)
 
+    routines, log_dict = _preprocessing_routines(data, defaults, lcls)
+
+    # -------------------------------------------------------
+    # Call the fused ComputationalRoutines, all stages of a group
+    # get applied in memory and only its final result is stored
+    # -------------------------------------------------------
+
+    groups = _fusion_groups(
+        data, routines, chan_per_worker=kwargs.get("chan_per_worker"), parallel=kwargs.get("parallel")
+    )
+
+    nan_trials = []
+    preprocessed = data
+    for ngroup, group in enumerate(groups):
+        source = preprocessed
+        preprocCR = fuse_routines(group)
+
+        preprocessed = AnalogData(dimord=data.dimord)
+        preprocCR.initialize(
+            source,
+            source._stackingDim,
+            chan_per_worker=kwargs.get("chan_per_worker"),
+            keeptrials=True,
+        )
+        preprocCR.compute(source, preprocessed, parallel=kwargs.get("parallel"), log_dict=log_dict)
+
+        # record NaNs encountered while filtering or detrending
+        if not any(isinstance(routine, (ButFiltering, SincFiltering, Detrending)) for routine in group):
+            continue
+        for key, value in metadata_from_hdf5_file(preprocessed.filename).items():
+            if "has_nan" in key and value:
+                # try to also record the trial numbers
+                trl_num = int(key.split("__")[-1].split("_")[0])
+                # intermediate results hold the selected trials only
+                if ngroup > 0 and data.selection is not None:
+                    trl_num = data.selection.trial_ids[trl_num]
+                nan_trials.append(trl_num)
+
+    # give warnings if NaNs were present while filtering or detrending
+    if any(isinstance(routine, (ButFiltering, SincFiltering, Detrending)) for routine in routines):
+        nan_trials = sorted(set(nan_trials))
+
+        if len(nan_trials) != 0:
+            msg = "Data contains NaNs! See `.info['nan_trials']` for the offending trials"
+            if filter_class == "but":
+                msg += "\n\t\t try using a 'onepass' FIR filter of low order.."
+            SPYWarning(msg)
+        preprocessed.info["nan_trials"] = nan_trials
+
+    # attach potential older cfg's from the input
+    # to support chained frontend calls..
+    preprocessed.cfg.update(data.cfg)
+    preprocessed.cfg.update({"preprocessing": new_cfg})
+    return preprocessed
+
+
+def fuse_routines(routines):
+    """
+    Fuses a sequence of shape-preserving ComputationalRoutines
+    into a single one, processing each trial in one pass
+
+    The computeFunctions of all but the last routine become the `pre_stages`
+    of the last one (see :func:`~syncopy.shared.kwarg_decorators.process_io`),
+    hence no intermediate results get written to disk.
+
+    Parameters
+    ----------
+    routines : list of :class:`~syncopy.shared.computational_routine.ComputationalRoutine`
+        The routines in the order of application
+
+    Returns
+    -------
+    fused : :class:`~syncopy.shared.computational_routine.ComputationalRoutine`
+        Instance of the class of the last routine
+    """
+
+    *pre, last = routines
+    if not pre:
+        return last
+
+    _, cfg = last.as_stage()
+    return type(last)(*last.argv, pre_stages=[routine.as_stage() for routine in pre], **cfg)
+
+
+def _fusion_groups(data, routines, chan_per_worker=None, parallel=False):
+    """
+    Groups the `routines` into runs getting fused by :func:`fuse_routines`
+
+    In sequential computations, a :class:`~syncopy.preproc.compRoutines.StreamingRoutine`
+    facing trials too large to be held in memory is not fused with any other
+    routine, such that it can process the trials block-wise. Parallel
+    computations don't stream, hence all routines get fused.
+
+    Returns
+    -------
+    groups : list of lists
+        The routines in the order of application
+    """
+
+    if parallel:
+        return [routines]
+
+    groups = [[]]
+    for routine in routines:
+        if len(routines) > 1 and isinstance(routine, StreamingRoutine):
+            # all routines preserve the shape of the (selected) trials
+            routine.initialize(data, data._stackingDim, chan_per_worker=chan_per_worker, keeptrials=True)
+            if routine._large_trials(data):
+                groups.extend([[routine], []])
+                continue
+        groups[-1].append(routine)
+
+    return [group for group in groups if group]
+
+
+def preprocessing_stages(data, settings):
+    """
+    Sets up the fused preprocessing as `pre_stages` of another
+    ComputationalRoutine, e.g. the spectral estimation of
+    :func:`~syncopy.freqanalysis`
+
+    Parameters
+    ----------
+    data : `~syncopy.AnalogData`
+        The data to be preprocessed
+    settings : dict
+        Keyword arguments of :func:`preprocessing`, only real valued
+        Hilbert transform outputs are supported
+
+    Returns
+    -------
+    pre_stages : list
+        ``(computeFunction, kwargs)`` pairs in the order of application
+    log_dict : dict
+        The effective settings for logging
+    """
+
+    if not isinstance(settings, dict):
+        raise SPYTypeError(settings, varname="preprocess", expected="dict")
+
+    defaults = get_defaults(preprocessing)
+    for key in settings:
+        if key not in defaults:
+            lgl = f"one of {list(defaults.keys())}"
+            raise SPYValueError(lgl, varname="preprocess", actual=key)
+
+    if settings.get("hilbert") == "complex":
+        lgl = "real valued Hilbert transform output"
+        raise SPYValueError(lgl, varname="preprocess['hilbert']", actual="complex")
+
+    lcls = {**defaults, **settings}
+    routines, log_dict = _preprocessing_routines(data, defaults, lcls)
+
+    return [routine.as_stage() for routine in routines], log_dict
+
+
+def _preprocessing_routines(data, defaults, lcls):
+    """
+    Checks the preprocessing settings and sets up the
+    ComputationalRoutines in the order of application
+
+    Parameters
+    ----------
+    data : `~syncopy.AnalogData`
+        The data to be preprocessed
+    defaults : dict
+        The default settings of :func:`preprocessing`
+    lcls : dict
+        The actual settings, all keys of `defaults` are required
+
+    Returns
+    -------
+    routines : list of :class:`~syncopy.shared.computational_routine.ComputationalRoutine`
+        See :func:`fuse_routines`
+    log_dict : dict
+        The effective settings for logging
+    """
+
+    timeAxis = data.dimord.index("time")
+    filter_class, filter_type, freq, order, direction, window, polyremoval, zscore, rectify, hilbert = (
+        lcls[key]
+        for key in (
+            "filter_class",
+            "filter_type",
+            "freq",
+            "order",
+            "direction",
+            "window",
+            "polyremoval",
+            "zscore",
+            "rectify",
+            "hilbert",
+        )
+    )
+
     # filter specific settings
     if filter_class is not None:
         if filter_class not in availableFilters:
@@ -220,21 +417,11 @@ def preprocessing(
     # Prepare keyword dict for logging
     log_dict = {"polyremoval": polyremoval, "zscore": zscore}
 
+    routines = []
+
     # pre-processing
     if zscore:
-
-        std_data = AnalogData(dimord=data.dimord)
-        stdCR = Standardize(polyremoval=polyremoval, timeAxis=timeAxis)
-        stdCR.initialize(
-            data,
-            data._stackingDim,
-            chan_per_worker=kwargs.get("chan_per_worker"),
-            keeptrials=True,
-        )
-
-        stdCR.compute(data, std_data, parallel=kwargs.get("parallel"), log_dict=log_dict)
-
-        data = std_data
+        routines.append(Standardize(polyremoval=polyremoval, timeAxis=timeAxis))
 
     if filter_class == "but":
 
@@ -265,12 +452,14 @@ def preprocessing(
 
         check_effective_parameters(ButFiltering, defaults, lcls, besides=("hilbert", "rectify", "zscore"))
 
+        # the filter gets designed only once for all trials
         filterMethod = ButFiltering(
             samplerate=data.samplerate,
             filter_type=filter_type,
             freq=freq,
             order=order,
             direction=direction,
+            sos=get_butter_sos(order, freq, filter_type, data.samplerate),
             polyremoval=polyremoval,
             timeAxis=timeAxis,
         )
@@ -308,6 +497,14 @@ def preprocessing(
             besides=["filter_class", "hilbert", "rectify", "zscore"],
         )
 
+        # the filter gets designed only once for all trials
+        fkernel = get_wsinc(
+            window,
+            order,
+            np.asarray(freq) / data.samplerate,
+            filter_type,
+            minphase=direction == "onepass-minphase",
+        )
         filterMethod = SincFiltering(
             samplerate=data.samplerate,
             filter_type=filter_type,
@@ -315,6 +512,7 @@ def preprocessing(
             order=order,
             window=window,
             direction=direction,
+            fkernel=fkernel,
             polyremoval=polyremoval,
             timeAxis=timeAxis,
         )
@@ -335,77 +533,18 @@ def preprocessing(
     else:
         filterMethod = None
 
-    # -------------------------------------------
-    # Call the chosen filter ComputationalRoutine
-    # -------------------------------------------
-
-    # unlikely but possible: post-processing without filtering
-    if filterMethod is None:
-        filtered = data
-    else:
-        filtered = AnalogData(dimord=data.dimord)
-        # Perform actual computation
-        filterMethod.initialize(
-            data,
-            data._stackingDim,
-            chan_per_worker=kwargs.get("chan_per_worker"),
-            keeptrials=True,
-        )
-        filterMethod.compute(data, filtered, parallel=kwargs.get("parallel"), log_dict=log_dict)
-
-        # give warnings if NaNs were present
-        nan_trials = []
-        for key, value in metadata_from_hdf5_file(filtered.filename).items():
-            if "has_nan" in key and value:
-                # try to also record the trial numbers
-                trl_num = key.split("__")[-1].split("_")[0]
-                nan_trials.append(int(trl_num))
-
-        if len(nan_trials) != 0:
-            msg = "Data contains NaNs! See `.info['nan_trials']` for the offending trials"
-            if filter_class == "but":
-                msg += "\n\t\t try using a 'onepass' FIR filter of low order.."
-            SPYWarning(msg)
-        filtered.info["nan_trials"] = nan_trials
+    if filterMethod is not None:
+        routines.append(filterMethod)
 
     # -- check for post-processing flags --
 
     if rectify:
         log_dict["rectify"] = rectify
-        rectified = AnalogData(dimord=data.dimord)
-        rectCR = Rectify()
-        rectCR.initialize(
-            filtered,
-            data._stackingDim,
-            chan_per_worker=kwargs.get("chan_per_worker"),
-            keeptrials=True,
-        )
-        rectCR.compute(filtered, rectified, parallel=kwargs.get("parallel"), log_dict=log_dict)
-        del filtered
-        rectified.cfg.update(data.cfg)
-        rectified.cfg.update({"preprocessing": new_cfg})
-        return rectified
+        routines.append(Rectify())
 
     elif hilbert:
         log_dict["hilbert"] = hilbert
-        htrafo = AnalogData(dimord=data.dimord)
-        hilbertCR = Hilbert(output=hilbert, timeAxis=timeAxis)
-        hilbertCR.initialize(
-            filtered,
-            data._stackingDim,
-            chan_per_worker=kwargs.get("chan_per_worker"),
-            keeptrials=True,
-        )
-        hilbertCR.compute(filtered, htrafo, parallel=kwargs.get("parallel"), log_dict=log_dict)
-        del filtered
-        htrafo.cfg.update(data.cfg)
-        htrafo.cfg.update({"preprocessing": new_cfg})
-        return htrafo
+        routines.append(Hilbert(output=hilbert, timeAxis=timeAxis))
+
+    return routines, log_dict
 
-    # no post-processing
-    else:
-        # attach potential older cfg's from the input
-        # to support chained frontend calls..
-        filtered.cfg.update(data.cfg)
-        filtered.cfg.update({"preprocessing": new_cfg})
-        return filtered
@@ -21,6 +21,8 @@ from syncopy.shared.kwarg_decorators import (
 from syncopy.shared.input_processors import check_passed_kwargs
 
 from .compRoutines import Downsample, Resample, SincFiltering
+from .filter_cache import get_wsinc
+from .resampling import anti_alias_window
 
 availableMethods = ("downsample", "resample")
 
@@ -155,6 +157,7 @@ def resampledata(data, resamplefs=1.0, method="resample", lpfreq=None, order=Non
                 freq=lpfreq,
                 order=order,
                 direction="twopass",
+                fkernel=get_wsinc("hamming", order, lpfreq / data.samplerate),
                 timeAxis=timeAxis,
             )
             # keyword dict for logging
@@ -187,12 +190,14 @@ def resampledata(data, resamplefs=1.0, method="resample", lpfreq=None, order=Non
             SPYWarning(msg)
 
         # has anti-alias filtering included
-        # configured by lpfreq and order
+        # configured by lpfreq and order, the filter
+        # gets designed only once for all trials
         resampleMethod = Resample(
             samplerate=data.samplerate,
             new_samplerate=resamplefs,
             lpfreq=lpfreq,
             order=order,
+            window=anti_alias_window(data.samplerate, resamplefs, int(lenTrials.min()), lpfreq, order),
             timeAxis=timeAxis,
         )
         # keyword dict for logging
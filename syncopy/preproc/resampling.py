@@ -6,13 +6,14 @@
 
 # Builtin/3rd party package imports
 import fractions
+import numpy as np
 import scipy.signal as sci_sig
 
 # Syncopy imports
-from syncopy.preproc import firws
+from syncopy.preproc.filter_cache import get_resampling_window
 
 
-def resample(data, orig_fs, new_fs, lpfreq=None, order=None):
+def resample(data, orig_fs, new_fs, lpfreq=None, order=None, window=None):
 
     """
     Uses SciPy's polyphase method for the implementation
@@ -41,6 +42,10 @@ def resample(data, orig_fs, new_fs, lpfreq=None, order=None):
         The default `None` will create a filter of
         maximal order which is the number of samples times the upsampling
         factor of the trial, or 10 000 if that is smaller
+    window : None or 1D :class:`numpy.ndarray`, optional
+        The anti-aliasing filter designed beforehand by
+        :func:`anti_alias_window`, the default `None` designs
+        it here (once per process)
 
     Returns
     -------
@@ -53,17 +58,49 @@ def resample(data, orig_fs, new_fs, lpfreq=None, order=None):
     syncopy.preproc.compRoutines.downsample_cF : Straightforward and cheap downsampling
     """
 
-    nSamples = data.shape[0]
-
     # get up/down sampling factors
     up, down = _get_updn(orig_fs, new_fs)
-    fs_ratio = new_fs / orig_fs
 
-    # -- design firws low-pass filter --
+    if window is None:
+        window = anti_alias_window(orig_fs, new_fs, data.shape[0], lpfreq, order)
+
+    resampled = sci_sig.resample_poly(data, up, down, window=window, axis=0)
+
+    return resampled
+
+
+def anti_alias_window(orig_fs, new_fs, nSamples, lpfreq=None, order=None):
+    """
+    Designs the firws low-pass filter applied to the upsampled data
+    by :func:`resample`, identical filters are only designed once per process
+    (see :func:`~syncopy.preproc.filter_cache.get_resampling_window`).
+
+    Parameters
+    ----------
+    orig_fs : float
+        The original sampling rate
+    new_fs : float
+        The target sampling rate after resampling
+    nSamples : int
+        Number of samples of the trial, only used to
+        determine the default filter `order`
+    lpfreq : None or float, optional
+        Cut-off frequency in Hz, see :func:`resample`
+    order : None or int, optional
+        Order (length) of the filter, see :func:`resample`
+
+    Returns
+    -------
+    window : 1D :class:`numpy.ndarray` or tuple
+        The read-only filter kernel, or SciPy's default
+        filter specification if ``lpfreq=-1``
+    """
+
+    up, _ = _get_updn(orig_fs, new_fs)
 
     # default cuts at new Nyquist
     if lpfreq is None:
-        f_c = 0.5 * fs_ratio
+        f_c = 0.5 * new_fs / orig_fs
     # for backend tests only,
     # negative values don't pass the frontend
     elif lpfreq == -1:
@@ -71,20 +108,107 @@ def resample(data, orig_fs, new_fs, lpfreq=None, order=None):
     # explicit cut-off
     else:
         f_c = lpfreq / orig_fs
-    if order is None:
-        order = nSamples * up
-        # limit maximal order
-        order = 10000 if order > 10000 else order
-
-    if f_c:
-        # filter has to be applied to the upsampled data
-        window = firws.design_wsinc("hamming", order=order, f_c=f_c / up)
+
+    return get_resampling_window(up, _default_order(nSamples, up, order), f_c)
+
+
+def _default_order(nSamples, up, order=None):
+    """
+    The maximal filter order is the number of samples
+    times the upsampling factor, limited to 10 000
+    """
+
+    if order is not None:
+        return order
+    return min(nSamples * up, 10000)
+
+
+def resample_stream(read, nSamples, up, down, window, blockLen):
+    """
+    Polyphase resampling of a signal which gets read block-wise,
+    the concatenated output blocks are identical to
+    ``scipy.signal.resample_poly(data, up, down, window=window, axis=0)``
+
+    The input blocks are aligned to multiples of `down` samples, the filter
+    history of each block (about ``len(window) / up`` samples) gets re-read
+    from the preceding signal. Memory usage hence only depends on `blockLen`
+    and the filter length, not on the signal length.
+
+    Parameters
+    ----------
+    read : callable
+        ``read(start, stop)`` returns the samples ``start:stop`` of the signal
+        as (n, K) :class:`numpy.ndarray`, time runs along the 1st axis
+    nSamples : int
+        Number of samples of the signal
+    up : int
+        Upsampling factor
+    down : int
+        Downsampling factor
+    window : 1D :class:`numpy.ndarray` or tuple
+        The anti-aliasing filter, see :func:`anti_alias_window`
+    blockLen : int
+        Number of input samples read at once, gets rounded
+        up to a multiple of `down`
+
+    Yields
+    ------
+    resampled : (m, K) :class:`numpy.ndarray`
+        Consecutive blocks of the resampled signal
+    """
+
+    # the filter and output offsets as in `scipy.signal.resample_poly`
+    h, nPreRemove = _polyphase_filter(window, up, down)
+    nOut = -(-nSamples * up // down)
+
+    blockLen = -(-max(blockLen, 1) // down) * down
+    # input history needed for the first output sample of a block
+    nHistory = -(-(len(h) - 1) // up)
+    nHistory = -(-nHistory // down) * down
+
+    for start in range(0, nSamples, blockLen):
+        stop = min(start + blockLen, nSamples)
+        last = stop == nSamples
+
+        # full output indices of this block: all depending on inputs before `stop`
+        j0 = start * up // down
+        j1 = nPreRemove + nOut if last else stop * up // down
+        # keep only the samples of the final output
+        k0, k1 = max(j0, nPreRemove), min(j1, nPreRemove + nOut)
+        if k1 <= k0:
+            continue
+
+        # the history starts at a multiple of `down` such that the
+        # upfirdn output grid is aligned with the full output grid
+        first = start - nHistory
+        block = read(max(first, 0), stop)
+        padding = [(max(-first, 0), len(h) // up + 1 if last else 0)] + [(0, 0)] * (block.ndim - 1)
+        block = np.pad(block, padding)
+
+        res = sci_sig.upfirdn(h, block, up, down, axis=0)
+        offset = first * up // down
+        yield res[k0 - offset : k1 - offset]
+
+
+def _polyphase_filter(window, up, down):
+    """
+    Zero padded and scaled filter of `scipy.signal.resample_poly`
+    and the number of leading output samples it discards
+    """
+
+    if isinstance(window, np.ndarray):
+        half_len = (window.size - 1) // 2
+        h = window * up
     else:
-        window = ("kaiser", 5.0)  # triggers SciPy default filter design
+        max_rate = max(up, down)
+        half_len = 10 * max_rate
+        h = sci_sig.firwin(2 * half_len + 1, 1 / max_rate, window=window) * up
 
-    resampled = sci_sig.resample_poly(data, up, down, window=window, axis=0)
+    nPrePad = down - half_len % down
+    nPreRemove = (half_len + nPrePad) // down
+    h = np.concatenate([np.zeros(nPrePad), h])
 
-    return resampled
+    return h, nPreRemove
 
 
 def downsample(
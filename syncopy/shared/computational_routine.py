@@ -6,6 +6,7 @@
 # Builtin/3rd party package imports
 import os
 import sys
+import shutil
 import psutil
 import h5py
 import numpy as np
@@ -21,9 +22,6 @@ if sys.platform == "win32":
     colorama.deinit()
     colorama.init(strip=False)
 
-import dask.distributed as dd
-import dask_jobqueue as dj
-
 # Local imports
 import syncopy as spy
 from .tools import get_defaults
@@ -36,14 +34,15 @@ from syncopy.shared.errors import (
     SPYWarning,
 )
 
-if __acme__:
-    from acme import ParallelMap
-
-    # # In case of problems w/worker-stealing, uncomment the following lines
-    # import dask
-    # dask.config.set(distributed__scheduler__work_stealing=False)
+# ACME's `ParallelMap` is imported in `compute_parallel` when needed
+# # In case of problems w/worker-stealing, uncomment the following lines
+# import dask
+# dask.config.set(distributed__scheduler__work_stealing=False)
 
 from syncopy.shared.metadata import parse_cF_returns, h5_add_metadata
+from syncopy.shared.pipelined_io import BlockWriter, TrialPrefetcher
+from syncopy.shared.memmap_io import read_hyperslab
+from syncopy.shared.storage_policy import dataset_kwargs
 
 __all__ = []
 
@@ -123,7 +122,10 @@ class ComputationalRoutine(ABC):
         *argv : tuple
            Tuple of positional arguments passed on to :meth:`computeFunction`
         **kwargs : dict
-           Keyword arguments passed on to :meth:`computeFunction`
+           Keyword arguments passed on to :meth:`computeFunction`. The
+           keyword `pre_stages` takes a sequence of ``(computeFunction, kwargs)``
+           pairs (see :meth:`as_stage`) applied in memory to every trial
+           before :meth:`computeFunction`, see :func:`~syncopy.shared.kwarg_decorators.process_io`
 
         Returns
         -------
@@ -143,12 +145,20 @@ class ComputationalRoutine(ABC):
         for key in set(self.cfg.keys()).intersection(kwargs.keys()):
             self.cfg[key] = kwargs[key]
 
+        # shape-preserving computeFunctions fused in front of `computeFunction`
+        if kwargs.get("pre_stages"):
+            self.cfg["pre_stages"] = tuple(kwargs["pre_stages"])
+
         # binary flag: if `True`, average across trials, do nothing otherwise
         self.keeptrials = None
 
         # full shape of final output dataset (all trials, all chunks, etc.)
         self.outputShape = None
 
+        # trial stacking dimension of the output and extents of all trials along it
+        self.stackingDim = None
+        self.trialLengths = None
+
         # numerical type of output dataset
         self.dtype = None
 
@@ -227,6 +237,36 @@ class ComputationalRoutine(ABC):
         # if `True`, enforces use of single-threaded scheduler in `compute_parallel`
         self.parallelDebug = False
 
+        # number of partial results combined per task in the tree
+        # reduction for trial-averaging in `reduce_parallel`
+        self.reduceFanIn = 8
+
+        # maximal number of result blocks waiting to be written to disk
+        # in `write_parallel` and `compute_sequential`, and the I/O statistics of the last run
+        self.writerQueueSize = 8
+        self.writerStats = None
+
+        # number of trials read ahead in `compute_sequential`, its I/O statistics
+        # and the memory budget (bytes) for all trials in flight
+        self.prefetchDepth = 2
+        self.readerStats = None
+        self.pipelineMem = None
+
+        # fraction of available memory usable by the computation
+        self.mem_thresh = 0.5
+
+        # number of calls of `computeFunction` processed by a single dask task,
+        # if `None` it gets derived from the cluster size (aiming at `tasksPerWorker`
+        # tasks per worker) and the worker memory; list of call indices per task
+        self.trialsPerTask = None
+        self.tasksPerWorker = 4
+        self.taskBatches = None
+
+        # minimal number of by-chunk files of a virtual output dataset for which
+        # consolidation into a single file is advised, on local and network file systems
+        self.consolidateMinFiles = 1000
+        self.consolidateMinFilesNetwork = 64
+
         # format string for tqdm progress bars in sequential computation
         self.tqdmFormat = "{desc}: {percentage:3.0f}% |{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]"
 
@@ -237,6 +277,23 @@ class ComputationalRoutine(ABC):
         self._callMax = 10000
         self._callCount = 0
 
+    def as_stage(self):
+        """
+        The :meth:`computeFunction` together with its keywords, to be
+        fused in front of another ComputationalRoutine via its `pre_stages`
+
+        Returns
+        -------
+        stage : tuple
+            ``(computeFunction, kwargs)``
+        """
+
+        cfg = dict(self.cfg)
+        for key in ["noCompute", "chunkShape", "pre_stages"]:
+            cfg.pop(key, None)
+
+        return self.computeFunction, cfg
+
     def initialize(self, data, out_stackingdim, chan_per_worker=None, keeptrials=True):
         """
         Perform dry-run of calculation to determine output shape
@@ -326,6 +383,8 @@ class ComputationalRoutine(ABC):
 
         # Save determined shapes and data type
         self.outputShape = tuple(outputShape)
+        self.stackingDim = stackingDim
+        self.trialLengths = [cShape[stackingDim] for cShape in chk_list]
         self.cfg["chunkShape"] = chunkShape
         self.dtype = np.dtype(dtp_list[0])
 
@@ -520,6 +579,8 @@ class ComputationalRoutine(ABC):
         mem_thresh=0.5,
         log_dict=None,
         parallel_debug=False,
+        consolidate=None,
+        trials_per_task=None,
     ):
         """
         Central management and processing method
@@ -545,8 +606,9 @@ class ComputationalRoutine(ABC):
            processing, results are written in a fully concurrent
            manner (each worker saves its own local result segment on disk as
            soon as it is done with its part of the computation). If `parallel_store`
-           is `False` and `parallel` is `True` the processing result is saved
-           sequentially using a mutex. If both `parallel` and `parallel_store`
+           is `False` and `parallel` is `True` the processing results are handed
+           back and saved by a single local writer thread (see :meth:`write_parallel`).
+           If both `parallel` and `parallel_store`
            are `False` standard single-process HDF5 writing is employed for
            saving the result of the (sequential) computation.
         method : None or str
@@ -574,6 +636,21 @@ class ComputationalRoutine(ABC):
            Note that enabling parallel debugging effectively runs the given computation
            on the calling machine locally thereby requiring sufficient memory and
            CPU capacity.
+        consolidate : None or bool
+           Only relevant for parallel storage (see `parallel_store`). If `True`,
+           the virtual output dataset gets rewritten into a single contiguous
+           HDF5 dataset after the computation (see :meth:`consolidate_output`),
+           subsequent reads then no longer have to open one source file per
+           trial. If `None`, consolidation is performed if many source files
+           were written or these reside on a network file system
+           (see :meth:`consolidation_advised`).
+        trials_per_task : None or int
+           Number of trials (trial-channel blocks) processed by a single dask
+           task in parallel computations. Batching many short trials into one
+           task reduces scheduling overhead and reads trials stored next to each
+           other in a single HDF5 read. If `None`, the batch size is chosen such
+           that every worker gets about `self.tasksPerWorker` tasks, as far as
+           the worker memory allows (see :meth:`task_batches`).
 
         Returns
         -------
@@ -628,6 +705,9 @@ class ComputationalRoutine(ABC):
         # Create HDF5 dataset of appropriate dimension
         self.preallocate_output(out, parallel_store=parallel_store)
 
+        if trials_per_task is not None:
+            self.trialsPerTask = trials_per_task
+
         log_dict = {} if log_dict is None else log_dict
         log_dict["used_parallel"] = str(parallel)
 
@@ -669,6 +749,7 @@ class ComputationalRoutine(ABC):
                     "outgrid": self.targetLayout[chk],
                     "outshape": self.targetShapes[chk],
                     "dtype": self.dtype,
+                    "dsetkwargs": self._dataset_kwargs(out, self.targetShapes[chk]),
                     "call_id": unique_key[chk],
                 }
                 for chk in range(self.numCalls)
@@ -709,6 +790,9 @@ class ComputationalRoutine(ABC):
         # Now for the sequential processing case.
         else:
 
+            # store mem_thresh
+            self.mem_thresh = mem_thresh
+
             # We only check memory
             memSize = psutil.virtual_memory().available
             if self.chunkMem >= mem_thresh * memSize:
@@ -737,6 +821,13 @@ class ComputationalRoutine(ABC):
         # Perform actual computation
         computeMethod(data, out)
 
+        # Stitch the by-chunk files of a virtual dataset together
+        if self.virtualDatasetDir is not None:
+            if consolidate is None:
+                consolidate = self.consolidation_advised()
+            if consolidate:
+                self.consolidate_output(out)
+
         # Reset data access mode
         data.mode = self.dataMode
 
@@ -799,7 +890,12 @@ class ComputationalRoutine(ABC):
             else:
                 shp = self.outputShape
             with h5py.File(out.filename, mode="w") as h5f:
-                h5f.create_dataset(name=self.outDatasetName, dtype=self.dtype, shape=shp)
+                h5f.create_dataset(
+                    name=self.outDatasetName,
+                    dtype=self.dtype,
+                    shape=shp,
+                    **self._dataset_kwargs(out, shp, self.trialLengths if self.keeptrials else None),
+                )
             self.outFileName = out.filename
             self.tmpDsetName = self.outDatasetName
 
@@ -825,6 +921,10 @@ class ComputationalRoutine(ABC):
         -----
         The actual reading of source data and writing of results is managed by
         the decorator :func:`syncopy.shared.kwarg_decorators.process_io`.
+        Trial-averaging computations are handed over to :meth:`reduce_parallel`,
+        computations with sequential storage to :meth:`write_parallel`.
+        Unless ACME manages the computation, several calls of :meth:`computeFunction`
+        get processed by a single dask task, see :meth:`task_batches`.
 
         See also
         --------
@@ -832,9 +932,13 @@ class ComputationalRoutine(ABC):
         compute_sequential : serial processing counterpart of this method
         """
 
+        import dask.distributed as dd
+        import dask_jobqueue as dj
+
         # Let ACME take care of argument distribution and memory checks: note
         # that `cfg` is trial-independent, i.e., we can simply throw it in here!
         if __acme__ and check_slurm_available():
+            from acme import ParallelMap
 
             self.pmap = ParallelMap(
                 self.computeFunction,
@@ -878,6 +982,7 @@ class ComputationalRoutine(ABC):
 
         # --- some sanity checks before computations ---
 
+        workerMemMax = None
         if isinstance(client.cluster, (dd.LocalCluster, dj.SLURMCluster)):
             workerMem = [w["memory_limit"] for w in client.cluster.scheduler_info["workers"].values()]
             if len(workerMem) == 0:
@@ -893,8 +998,22 @@ class ComputationalRoutine(ABC):
                 )
                 raise SPYParallelError(msg.format(2 * self.chunkMem, workerMemMax))
 
+        self.taskBatches = self.task_batches(client, workerMemMax)
+
         # --- trigger actual computation ---
 
+        # trial-averaging sums up the trial results in worker memory,
+        # sequential storage hands them over to a local writer thread
+        if not self.keeptrials or self.virtualDatasetDir is None:
+            collect = self.reduce_parallel if not self.keeptrials else self.write_parallel
+            if self.pmap is not None:
+                # only use the client of the ACME managed cluster
+                with self.pmap:
+                    collect(client, out)
+            else:
+                collect(client, out)
+            return
+
         if self.pmap is not None:
             # Let ACME do the heavy lifting
             with self.pmap as pm:
@@ -902,28 +1021,7 @@ class ComputationalRoutine(ABC):
 
         # use our own client and map over workerdicts + cfg
         else:
-            # we have to prepare a well behaved iterable where for each call n
-            # we have a tuple like (wdict[n], argv1_seq[n], argv2) passed to the cF
-            # by the Dask client mapping
-            workerDicts = self.inargs[0]
-            if len(self.inargs) > 1:
-                iterables = []
-                ArgV = self.inargs[1:]
-                for nblock, wdict in enumerate(workerDicts):
-                    argv = tuple(
-                        arg[nblock]
-                        if isinstance(arg, (list, tuple, np.ndarray))
-                        and len(arg)  # these are the argv_seq
-                        == len(workerDicts)  # each call gets one element of a sequence type argv
-                        else arg
-                        for arg in ArgV
-                    )
-                    iterables.append((wdict, *argv))
-            # no *args for the cF
-            else:
-                iterables = workerDicts
-
-            futures = client.map(self.computeFunction, iterables, **self.cfg)
+            futures = client.map(self.computeFunction, self._worker_iterables(), **self.cfg)
             # similar to tqdm progress bar
             dd.progress(futures)
             # actual results get handled by hdf5 operations inside `process_io`
@@ -931,15 +1029,254 @@ class ComputationalRoutine(ABC):
 
         # When writing concurrently, now's the time to finally create the virtual dataset
         # by referencing the individual hdf5 datasets created by the IO decorator
-        if self.virtualDatasetDir is not None:
-            with h5py.File(out.filename, mode="w") as h5f:
-                h5f.create_virtual_dataset(self.outDatasetName, self.VirtualDatasetLayout)
+        with h5py.File(out.filename, mode="w") as h5f:
+            h5f.create_virtual_dataset(self.outDatasetName, self.VirtualDatasetLayout)
 
-        # If trial-averaging was requested, normalize computed sum to get mean
-        if not self.keeptrials:
-            with h5py.File(out.filename, mode="r+") as h5f:
-                h5f[self.outDatasetName][()] /= self.numTrials
-                h5f.flush()
+    def reduce_parallel(self, client, out):
+        """
+        Lock-free trial-averaging via a tree reduction
+
+        The results of the individual calls of :meth:`computeFunction`
+        are kept in worker memory and get summed up in groups of
+        `self.reduceFanIn` partial sums on the workers, until only the final
+        sum is left. This gets normalized and written to disk exactly once.
+
+        Parameters
+        ----------
+        client : :class:`dask.distributed.Client`
+           Client connected to the cluster to compute on
+        out : syncopy data object
+           Empty object for holding results
+
+        Returns
+        -------
+        Nothing : None
+
+        See also
+        --------
+        compute_parallel : concurrent processing invoking this method
+        """
+
+        import dask.distributed as dd
+
+        # each future holds a `(res, {call_id: details})` tuple
+        futures = client.map(self.computeFunction, self._worker_iterables(), **self.cfg)
+        completed = dd.as_completed(futures)
+
+        # combine partial sums on the workers as soon as they are available,
+        # the summation order is fixed by the tree
+        while len(futures) > 1:
+            futures = [
+                client.submit(_sum_partials, *futures[idx : idx + self.reduceFanIn])
+                for idx in range(0, len(futures), self.reduceFanIn)
+            ]
+
+        for _ in tqdm(completed, total=len(self.taskBatches), bar_format=self.tqdmFormat, disable=None):
+            pass
+        res, details = futures[0].result()
+
+        # normalize computed sum to get mean
+        res /= self.numTrials
+        with h5py.File(out.filename, mode="r+") as h5f:
+            h5f[self.outDatasetName][()] = res
+            for call_id, metadata in details.items():
+                h5_add_metadata(h5f, metadata, unique_key_suffix=call_id)
+
+    def write_parallel(self, client, out):
+        """
+        Parallel computing with sequential storage via a write-behind writer
+
+        The workers only compute and hand back their results, which get
+        written by a single local :class:`~syncopy.shared.pipelined_io.BlockWriter`
+        thread keeping the output file open. The bounded writer queue
+        (`self.writerQueueSize` blocks) throttles the collection of results
+        if the disk can't keep up. The I/O statistics of the writer get
+        stored in `self.writerStats`.
+
+        Parameters
+        ----------
+        client : :class:`dask.distributed.Client`
+           Client connected to the cluster to compute on
+        out : syncopy data object
+           Empty object for holding results
+
+        Returns
+        -------
+        Nothing : None
+
+        See also
+        --------
+        compute_parallel : concurrent processing invoking this method
+        """
+
+        import dask.distributed as dd
+
+        # each future holds a list of `(res, {call_id: details})` tuples
+        futures = client.map(self.computeFunction, self._worker_iterables(), **self.cfg)
+        batch_idx = {future.key: batch for batch, future in zip(self.taskBatches, futures)}
+        completed = dd.as_completed(futures, with_results=True)
+        del futures
+
+        with BlockWriter(out.filename, self.outDatasetName, max_queue=self.writerQueueSize) as writer:
+            for future, results in tqdm(
+                completed, total=len(self.taskBatches), bar_format=self.tqdmFormat, disable=None
+            ):
+                for chk, (res, details) in zip(batch_idx[future.key], results):
+                    writer.put(self.targetLayout[chk], res, details)
+        self.writerStats = writer.stats
+
+    def task_batches(self, client, workerMem=None):
+        """
+        Partitions the calls of :meth:`computeFunction` into dask tasks
+
+        Parameters
+        ----------
+        client : :class:`dask.distributed.Client`
+           Client connected to the cluster to compute on
+        workerMem : None or int
+           Memory limit of the workers in bytes, if known
+
+        Returns
+        -------
+        batches : list of lists
+           Indices of the calls processed by the individual tasks, every
+           task processes a contiguous run of calls
+        """
+
+        if self.trialsPerTask is not None:
+            batchSize = int(self.trialsPerTask)
+        else:
+            nWorkers = max(1, len(client.scheduler_info()["workers"]))
+            batchSize = self.numCalls // (self.tasksPerWorker * nWorkers)
+            # input and output of all calls of a task have to fit into worker memory
+            if workerMem is not None and self.chunkMem > 0:
+                batchSize = min(batchSize, int(self.mem_thresh * workerMem / (2 * self.chunkMem)))
+        batchSize = max(1, batchSize)
+
+        return [list(range(idx, min(idx + batchSize, self.numCalls))) for idx in range(0, self.numCalls, batchSize)]
+
+    def _worker_iterables(self):
+        """
+        Local helper to assemble the inputs for mapping :meth:`computeFunction`
+        over the task batches (see :meth:`task_batches`) with a dask client
+        """
+
+        # we have to prepare a well behaved iterable where for each call n
+        # we have a tuple like (wdict[n], argv1_seq[n], argv2) passed to the cF
+        # by the Dask client mapping
+        workerDicts = self.inargs[0]
+
+        # no *args for the cF
+        if len(self.inargs) == 1:
+            iterables = workerDicts
+
+        else:
+            iterables = []
+            ArgV = self.inargs[1:]
+            for nblock, wdict in enumerate(workerDicts):
+                argv = tuple(
+                    arg[nblock]
+                    if isinstance(arg, (list, tuple, np.ndarray))
+                    and len(arg)  # these are the argv_seq
+                    == len(workerDicts)  # each call gets one element of a sequence type argv
+                    else arg
+                    for arg in ArgV
+                )
+                iterables.append((wdict, *argv))
+
+        # each task gets a list of calls, see `process_io`
+        return [[iterables[chk] for chk in batch] for batch in self.taskBatches]
+
+    def consolidation_advised(self):
+        """
+        Heuristic deciding whether to keep the virtual output dataset or
+        to consolidate it into a single contiguous dataset
+
+        Reading from a virtual dataset requires opening every source file,
+        which is costly if there are many of them or if they reside on a
+        network file system (NFS, Lustre, GPFS, ...), where each file
+        open is a round trip to the metadata server.
+
+        Returns
+        -------
+        advised : bool
+           `True` if more than `self.consolidateMinFiles` source files
+           were written, or more than `self.consolidateMinFilesNetwork` on
+           a network file system
+        """
+
+        if self.virtualDatasetDir is None:
+            return False
+        if self.numCalls >= self.consolidateMinFiles:
+            return True
+        if self.numCalls >= self.consolidateMinFilesNetwork:
+            return _filesystem_type(self.virtualDatasetDir) in _networkFileSystems
+        return False
+
+    def consolidate_output(self, out):
+        """
+        Rewrites the virtual output dataset into a single contiguous dataset
+
+        The by-chunk source files get copied block-wise into a new HDF5
+        file, which then replaces the virtual dataset at `out.filename`.
+        The meta-data stored in the source files is merged into the
+        `metadata` group of the new file and the directory holding the
+        source files gets deleted.
+
+        Parameters
+        ----------
+        out : syncopy data object
+           Object holding the results, its data must not be attached yet
+
+        Returns
+        -------
+        Nothing : None
+
+        See also
+        --------
+        consolidation_advised : heuristic for automatic consolidation
+        """
+
+        tmpName = out.filename + ".consolidate"
+        with h5py.File(tmpName, mode="w") as h5fout:
+            target = h5fout.create_dataset(
+                self.outDatasetName,
+                shape=self.outputShape,
+                dtype=self.dtype,
+                **self._dataset_kwargs(out, self.outputShape, self.trialLengths),
+            )
+            for k, outgrid in enumerate(self.targetLayout):
+                fname = self.outFileName.format(k)
+                # empty selections are not part of the layout
+                if not os.path.isfile(fname):
+                    continue
+                with h5py.File(fname, mode="r") as h5src:
+                    target[outgrid] = h5src[self.virtualDatasetNames][()]
+                    if "metadata" in h5src:
+                        mdgrp = h5fout.require_group("metadata")
+                        for key, value in h5src["metadata"].attrs.items():
+                            mdgrp.attrs[key] = value
+
+        os.replace(tmpName, out.filename)
+        shutil.rmtree(self.virtualDatasetDir)
+        self.virtualDatasetDir = None
+        self.VirtualDatasetLayout = None
+
+    def _dataset_kwargs(self, out, shape, trialLengths=None):
+        """
+        Local helper returning chunk layout and filters of an output dataset
+        of `shape` according to `syncopy.__storagepolicy__`, by default
+        `shape` is taken as a single trial
+        """
+        if trialLengths is None:
+            trialLengths = [shape[self.stackingDim]]
+        return dataset_kwargs(
+            shape,
+            self.dtype,
+            stackingDim=self.stackingDim,
+            trialLengths=trialLengths,
+            dimord=getattr(out, "dimord", None),
+        )
 
     def compute_sequential(self, data, out):
         """
@@ -965,6 +1302,14 @@ class ComputationalRoutine(ABC):
         is immediately stored on disk, propagation of arrays across routines
         is avoided and memory usage is kept to a minimum.
 
+        Disk I/O is pipelined with the computations: a
+        :class:`~syncopy.shared.pipelined_io.TrialPrefetcher` thread reads up to
+        `self.prefetchDepth` trials ahead and a
+        :class:`~syncopy.shared.pipelined_io.BlockWriter` thread writes the
+        results behind. The number of trials in flight is further limited by
+        `self.pipelineMem` (in bytes, defaults to `mem_thresh` times the available
+        memory). Set ``prefetchDepth = 0`` to read synchronously.
+
         See also
         --------
         compute : management routine invoking parallel/sequential compute kernels
@@ -972,67 +1317,101 @@ class ComputationalRoutine(ABC):
         """
         sourceObj = h5py.File(data.filename, mode="r")[data.data.name]
 
-        # Iterate over (selected) trials and write directly to target HDF5 dataset
-        with h5py.File(out.filename, "r+") as h5fout:
-            target = h5fout[self.outDatasetName]
+        def read_block(nblock):
+            ingrid = self.sourceLayout[nblock]
+            # Catch empty source-array selections; this workaround is not
+            # necessary for h5py version 2.10+ (see https://github.com/h5py/h5py/pull/1174)
+            if any([not sel for sel in ingrid]):
+                return None
+            # Get source data as NumPy array: contiguous sources are mapped
+            # into memory (one copy-on-write map per trial, i.e., no copies and
+            # in-place changes by `computeFunction` neither reach the file nor
+            # overlapping trials)
+            if self.useFancyIdx:
+                arr = read_hyperslab(sourceObj, tuple(ingrid))[np.ix_(*self.sourceSelectors[nblock])]
+            else:
+                arr = read_hyperslab(sourceObj, tuple(ingrid))
+            # Ensure input array shape was not inflated by scalar selection
+            # tuple, e.g., ``e=np.ones((2,2)); e[0,:].shape = (2,)`` not ``(1,2)``
+            # (`reshape` keeps views into the memory map intact)
+            return arr.reshape(self.sourceShapes[nblock])
 
-            for nblock in tqdm(range(self.numTrials), bar_format=self.tqdmFormat, disable=None):
+        prefetchDepth, writerDepth = self._pipeline_depths()
+        reader = TrialPrefetcher(read_block, self.numTrials, depth=prefetchDepth)
 
-                # Extract respective indexing tuples from constructed lists
-                ingrid = self.sourceLayout[nblock]
-                sigrid = self.sourceSelectors[nblock]
-                outgrid = self.targetLayout[nblock]
-                argv = tuple(
-                    arg[nblock]
-                    if isinstance(arg, (list, tuple, np.ndarray)) and len(arg) == self.numTrials
-                    else arg
-                    for arg in self.argv
-                )
+        # trial-averaging sums up in memory, the mean gets written once
+        if not self.keeptrials:
+            accumulator = np.zeros(self.cfg["chunkShape"], dtype=self.dtype)
+            metadata = {}
 
-                # Catch empty source-array selections; this workaround is not
-                # necessary for h5py version 2.10+ (see https://github.com/h5py/h5py/pull/1174)
-                if any([not sel for sel in ingrid]):
-                    res = np.empty(self.targetShapes[nblock], dtype=self.dtype)
-                else:
-                    # Get source data as NumPy array
-                    if self.useFancyIdx:
-                        arr = np.array(sourceObj[tuple(ingrid)])[np.ix_(*sigrid)]
-                    else:
-                        arr = np.array(sourceObj[tuple(ingrid)])
-                    sourceObj.flush()
+        # Iterate over (selected) trials and write behind to target HDF5 dataset
+        blocks = iter(reader)
+        try:
+            with BlockWriter(out.filename, self.outDatasetName, max_queue=writerDepth) as writer:
+
+                for nblock, arr in enumerate(
+                    tqdm(blocks, total=self.numTrials, bar_format=self.tqdmFormat, disable=None)
+                ):
 
-                    # Ensure input array shape was not inflated by scalar selection
-                    # tuple, e.g., ``e=np.ones((2,2)); e[0,:].shape = (2,)`` not ``(1,2)``
-                    # (use an explicit `shape` assignment here to avoid copies)
-                    arr.shape = self.sourceShapes[nblock]
+                    argv = tuple(
+                        arg[nblock]
+                        if isinstance(arg, (list, tuple, np.ndarray)) and len(arg) == self.numTrials
+                        else arg
+                        for arg in self.argv
+                    )
 
-                    # Perform computation
-                    res, details = parse_cF_returns(self.computeFunction(arr, *argv, **self.cfg))
+                    if arr is None:
+                        res, details = np.empty(self.targetShapes[nblock], dtype=self.dtype), None
+                    else:
+                        # Perform computation
+                        res, details = parse_cF_returns(self.computeFunction(arr, *argv, **self.cfg))
 
-                    # In case scalar selections have been performed, explicitly assign
-                    # desired output shape to re-create "lost" singleton dimensions
-                    # (use an explicit `shape` assignment here to avoid copies)
-                    res.shape = self.targetShapes[nblock]
+                        # In case scalar selections have been performed, explicitly assign
+                        # desired output shape to re-create "lost" singleton dimensions
+                        # (use an explicit `shape` assignment here to avoid copies)
+                        res.shape = self.targetShapes[nblock]
 
                     trial_idx = data.selection.trial_ids[nblock] if data.selection is not None else nblock
 
-                    h5_add_metadata(h5fout, details, unique_key_suffix=trial_idx)
+                    # Either write result to `outgrid` location in `target` or add it up
+                    if self.keeptrials:
+                        writer.put(self.targetLayout[nblock], res, {trial_idx: details})
+                    else:
+                        accumulator += res
+                        metadata[trial_idx] = details
 
-                # Either write result to `outgrid` location in `target` or add it up
-                if self.keeptrials:
-                    target[outgrid] = res
-                else:
-                    target[()] += res
+                # If trial-averaging was requested, normalize computed sum to get mean
+                if not self.keeptrials:
+                    accumulator /= self.numTrials
+                    writer.put(tuple(slice(None) for _ in accumulator.shape), accumulator, metadata)
 
-                # Flush every iteration to avoid memory leakage
-                h5fout.flush()
+        finally:
+            # stops the prefetching also in case of errors
+            blocks.close()
+            # If source was HDF5 file, close it to prevent access errors
+            sourceObj.file.close()
 
-            # If trial-averaging was requested, normalize computed sum to get mean
-            if not self.keeptrials:
-                target[()] /= self.numTrials
+        self.writerStats = writer.stats
+        self.readerStats = reader.stats
 
-        # If source was HDF5 file, close it to prevent access errors
-        sourceObj.file.close()
+    def _pipeline_depths(self):
+        """
+        Local helper to determine the number of blocks to read ahead
+        and to queue for writing, respecting the memory budget
+        """
+
+        budget = self.pipelineMem
+        if budget is None:
+            budget = self.mem_thresh * psutil.virtual_memory().available
+
+        # one input and one output block per trial in flight
+        outMem = max(np.prod(shp) for shp in self.targetShapes) * self.dtype.itemsize
+        nInFlight = int(budget // max(self.chunkMem + outMem, 1))
+
+        # the block currently computed on is always in memory
+        prefetchDepth = max(0, min(self.prefetchDepth, nInFlight - 2))
+        writerDepth = max(1, min(self.writerQueueSize, nInFlight - 1 - prefetchDepth))
+        return prefetchDepth, writerDepth
 
     def write_log(self, data, out, log_dict=None):
         """
@@ -1067,6 +1446,7 @@ class ComputationalRoutine(ABC):
         cfg = dict(self.cfg)
         for key in ["noCompute", "chunkShape"]:
             cfg.pop(key)
+        cfg.pop("pre_stages", None)
 
         # Write log and store `cfg` constructed above in corresponding prop of `out`
         if log_dict is None:
@@ -1229,3 +1609,61 @@ def propagate_properties(in_data, out_data, keeptrials=True, time_axis=False):
     if selection_cleanup:
         in_data.selection = None
         in_data.cfg.pop("selectdata")
+
+
+# file system types (as reported by `psutil.disk_partitions`) mounted over the network
+_networkFileSystems = (
+    "nfs",
+    "nfs4",
+    "cifs",
+    "smbfs",
+    "smb3",
+    "lustre",
+    "gpfs",
+    "beegfs",
+    "ceph",
+    "fuse.sshfs",
+    "panfs",
+)
+
+
+def _filesystem_type(path):
+    """
+    Returns the type of the file system `path` resides on,
+    an empty string if it can't be determined
+    """
+
+    path = os.path.realpath(path)
+    fstype = ""
+    mountLen = -1
+    try:
+        partitions = psutil.disk_partitions(all=True)
+    except Exception:
+        return fstype
+    # the longest mount point containing `path` is the relevant one
+    for part in partitions:
+        mount = part.mountpoint
+        try:
+            contained = os.path.commonpath([path, mount]) == mount
+        # different drives on Windows
+        except ValueError:
+            contained = False
+        if contained and len(mount) > mountLen:
+            fstype = part.fstype.lower()
+            mountLen = len(mount)
+    return fstype
+
+
+def _sum_partials(*partials):
+    """
+    Sums up the `(res, {call_id: details})` tuples of
+    trial-averaging computations during the tree reduction
+    """
+
+    res = np.array(partials[0][0], copy=True)
+    details = dict(partials[0][1])
+    for partial_res, partial_details in partials[1:]:
+        res += partial_res
+        details.update(partial_details)
+
+    return res, details
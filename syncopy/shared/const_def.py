@@ -56,4 +56,5 @@ generalParameters = (
     "polyremoval",
     "out",
     "pad",
+    "preprocess",
 )
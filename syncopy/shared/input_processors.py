@@ -13,7 +13,6 @@ import numbers
 from inspect import signature
 from scipy.signal import windows
 
-from syncopy.specest.mtmfft import _get_dpss_pars
 from syncopy.shared.errors import SPYValueError, SPYWarning, SPYInfo
 from syncopy.shared.parsers import scalar_parser, array_parser
 from syncopy.shared.const_def import (
@@ -343,6 +342,8 @@ def process_taper(
 
         # --------------------------------------------------------------
         # set parameters for scipy.signal.windows.dpss
+        from syncopy.specest.mtmfft import _get_dpss_pars
+
         NW, Kmax = _get_dpss_pars(tapsmofrq, nSamples, samplerate)
         # --------------------------------------------------------------
 
@@ -8,7 +8,6 @@ import functools
 import h5py
 import inspect
 import numpy as np
-import dask.distributed as dd
 
 
 import syncopy as spy
@@ -21,6 +20,9 @@ from syncopy.shared.errors import (
 )
 from syncopy.shared.tools import StructDict
 from syncopy.shared.metadata import h5_add_metadata, parse_cF_returns
+from syncopy.shared.pipelined_io import _adjacent_axis
+from syncopy.shared.storage_policy import register_filters
+from syncopy.shared.memmap_io import memmap_dataset, read_hyperslab
 
 # Local imports
 from .dask_helpers import check_slurm_available, check_workers_available
@@ -476,6 +478,8 @@ def detect_parallel_client(func):
     @functools.wraps(func)
     def parallel_client_detector(*args, **kwargs):
 
+        import dask.distributed as dd
+
         logger = get_logger()
 
         # Extract `parallel` keyword: if `parallel` is `False`, nothing happens
@@ -608,7 +612,14 @@ def process_io(func):
           and contains information for parallel workers (particularly, paths and
           dataset indices of HDF5 files for reading source data and writing results).
           Nothing is returned (the output of the wrapped `computeFunction` is
-          directly written to disk).
+          directly written to disk), except for sequential storage and trial
+          averaging (see Notes).
+        * `trl_dat` : list
+          A batch of several worker dicts (or ``(dict, *argv)`` tuples) processed
+          by a single task: the input file is opened once and directly adjacent
+          trials are read in a single HDF5 read. For trial-averaging the summed up
+          result is returned as ``(res, {call_id: details, ...})``, for sequential
+          storage a list of ``(res, {call_id: details})`` tuples.
         * `trl_dat` : :class:`numpy.ndarray` or :class:`~syncopy.datatype.base_data.FauxTrial` object
           Wrapped `computeFunction` is executed sequentially (either during dry-
           run phase or in purely sequential computations); `trl_dat` is directly
@@ -620,9 +631,17 @@ def process_io(func):
 
     Notes
     -----
+    A keyword `pre_stages` holding a sequence of ``(computeFunction, kwargs)`` pairs
+    (see :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.as_stage`)
+    gets removed from the keywords of the wrapped `computeFunction`. Instead,
+    these shape-preserving computeFunctions get applied one after the other to
+    the input array in memory, before the wrapped `computeFunction` gets called.
+    The `details` of all stages are merged. This fuses several processing steps
+    into one pass over the data without intermediate results on disk.
+
     Parallel execution supports two writing modes: concurrent storage of results
     in multiple HDF5 files or sequential writing of array blocks in a single
-    output HDF5 file. In both situations, the output array returned by
+    output HDF5 file. In the first case, the output array returned by
     :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.computeFunction`
     is immediately written to disk and **not** propagated back to the caller to
     avoid inter-worker network communication.
@@ -633,9 +652,12 @@ def process_io(func):
     dataset inside a newly created HDF5 file (located in Syncopy's temporary
     storage folder).
 
-    Conversely, in case of sequential writing, each resulting array is written
-    sequentially to an existing single output HDF5 file using  a distributed mutex
-    for access control to prevent write collisions.
+    Conversely, in case of sequential writing or if trial-averaging is requested
+    (``keeptrials = False``), nothing is written to disk by the workers. Instead
+    the result is returned together with its metadata as ``(res, {call_id: details})``
+    to be either written by a single writer thread keeping the output file open or
+    summed up in a tree reduction, see
+    :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.compute_parallel`.
 
     See also
     --------
@@ -645,13 +667,24 @@ def process_io(func):
     @functools.wraps(func)
     def wrapper_io(trl_dat, *wrkargs, **kwargs):
 
+        # computeFunctions of preceding stages get applied in memory
+        pre_stages = kwargs.pop("pre_stages", None)
+        cF = functools.partial(_staged_call, func, pre_stages) if pre_stages else func
+
         # `trl_dat` is a NumPy array or `FauxTrial` object: execute the wrapped
         # function and return its result
-        if not isinstance(trl_dat, (dict, tuple)):
+        if not isinstance(trl_dat, (dict, tuple, list)):
             # Adding the metadata is done in compute_sequential(), nothing to do here.
             # Note that the return value of 'func' in the next line may be a tuple containing
             # both the ndarray for 'data', and the 'details'.
-            return func(trl_dat, *wrkargs, **kwargs)
+            return cF(trl_dat, *wrkargs, **kwargs)
+
+        # Workers may read or write datasets compressed with the filters of hdf5plugin
+        register_filters()
+
+        # `trl_dat` is a list: a batch of several calls processed by a single task
+        if isinstance(trl_dat, list):
+            return _process_batch(cF, trl_dat, wrkargs, kwargs)
 
         # compatibility to adhere to the inargs the CRs produces: ill-formatted tuples
         # which mix dicts, lists and even slices
@@ -660,83 +693,186 @@ def process_io(func):
             trl_dat = trl_dat[0]
 
         # The fun part: `trl_dat` is a dictionary holding components for parallelization
-        keeptrials = trl_dat["keeptrials"]
-        infilename = trl_dat["infile"]
-        indset = trl_dat["indset"]
-        ingrid = trl_dat["ingrid"]
-        inshape = trl_dat["inshape"]
-        sigrid = trl_dat["sigrid"]
-        fancy = trl_dat["fancy"]
-        vdsdir = trl_dat["vdsdir"]
-        outfilename = trl_dat["outfile"]
-        outdset = trl_dat["outdset"]
-        outgrid = trl_dat["outgrid"]
-        outshape = trl_dat["outshape"]
-        outdtype = trl_dat["dtype"]
-        call_id = trl_dat["call_id"]
-
         # === STEP 1 === read data into memory
         # Catch empty source-array selections; this workaround is not
         # necessary for h5py version 2.10+ (see https://github.com/h5py/h5py/pull/1174)
-        if any([not sel for sel in ingrid]):
-            res, details = np.empty(outshape, dtype=outdtype), {}
+        if any([not sel for sel in trl_dat["ingrid"]]):
+            arr = None
         else:
-            with h5py.File(infilename, mode="r") as h5fin:
-                if fancy:
-                    arr = np.array(h5fin[indset][ingrid])[np.ix_(*sigrid)]
-                else:
-                    arr = np.array(h5fin[indset][ingrid])
-
-            # === STEP 2 === perform computation
-            # Ensure input array shape was not inflated by scalar selection
-            # tuple, e.g., ``e=np.ones((2,2)); e[0,:].shape = (2,)`` not ``(1,2)``
-            # (use an explicit `shape` assignment here to avoid copies)
-            arr.shape = inshape
-
-            # Now, actually call wrapped function
-            # Put new outputs here!
-            res, details = parse_cF_returns(func(arr, *wrkargs, **kwargs))
-            # User-supplied cFs may return a single numpy.ndarray, or a 2-tuple of type (ndarray, sdict) where
-            # 'ndarray' is a numpy.ndarray containing computation results to be stored in the Syncopy
-            # data type (like AnalogData),
-            #  and 'sdict' is a shallow dictionary containing meta data that will be temporarily
-            # attached to the hdf5 container(s)
-            # during the compute run, but removed/collected and returned as separate return values
-            # to the user in the frontend.
-
-            # In case scalar selections have been performed, explicitly assign
-            # desired output shape to re-create "lost" singleton dimensions
-            # (use an explicit `shape` assignment here to avoid copies)
-            res.shape = outshape
+            with h5py.File(trl_dat["infile"], mode="r") as h5fin:
+                arr = read_hyperslab(h5fin[trl_dat["indset"]], tuple(trl_dat["ingrid"]))
+
+        # === STEP 2 === perform computation
+        res, details = _compute_block(cF, arr, trl_dat, wrkargs, kwargs)
 
         # === STEP 3 === write result to disk
-        # Write result to multiple stand-alone HDF files or use a mutex to write to a
-        # common single file (sequentially)
-        if vdsdir is not None:
-            with h5py.File(outfilename, "w") as h5fout:
-                h5fout.create_dataset(outdset, data=res)
-                h5_add_metadata(h5fout, details, unique_key_suffix=call_id)
-                h5fout.flush()
-        else:
+        # For trial-averaging or sequential storage the result stays in worker memory,
+        # it gets either summed up by a tree reduction or written by a single writer
+        if not trl_dat["keeptrials"] or trl_dat["vdsdir"] is None:
+            return res, {trl_dat["call_id"]: details}
+
+        _write_source(trl_dat, res, details)
+        return None  # result has already been written to disk
+
+    return wrapper_io
+
+
+def _staged_call(func, pre_stages, arr, *args, noCompute=False, **kwargs):
+    """
+    Local helper of :func:`process_io` applying the computeFunctions
+    of `pre_stages` to `arr` before calling `func`
+
+    The stages preserve the shape of the data, hence for dry-runs
+    (`noCompute`) only `func` needs to be called.
+    """
+
+    if noCompute:
+        return func(arr, *args, noCompute=noCompute, **kwargs)
+
+    details = {}
+    for stageFunc, stageKwargs in pre_stages:
+        arr, stageDetails = parse_cF_returns(stageFunc(arr, **stageKwargs))
+        details.update(stageDetails or {})
+
+    res, funcDetails = parse_cF_returns(func(arr, *args, **kwargs))
+    details.update(funcDetails or {})
+
+    return res, details
+
+
+def _compute_block(func, arr, trl_dat, wrkargs, kwargs):
+    """
+    Local helper of :func:`process_io` calling the wrapped `computeFunction`
+    on the block `arr` read via `trl_dat["ingrid"]` (`None` for empty selections)
+    """
 
-            # Create distributed lock (use unique name so it's synced across workers)
-            lock = dd.lock.Lock(name="sequential_write")
-            # Either (continue to) compute average or write current chunk
-            lock.acquire()
-            with h5py.File(outfilename, "r+") as h5fout:
-                main_dset = h5fout[outdset]
-                if keeptrials:
-                    main_dset[outgrid] = res
+    if arr is None:
+        return np.empty(trl_dat["outshape"], dtype=trl_dat["dtype"]), {}
+
+    if trl_dat["fancy"]:
+        arr = arr[np.ix_(*trl_dat["sigrid"])]
+
+    # Ensure input array shape was not inflated by scalar selection
+    # tuple, e.g., ``e=np.ones((2,2)); e[0,:].shape = (2,)`` not ``(1,2)``
+    # (use an explicit `shape` assignment here to avoid copies)
+    arr.shape = trl_dat["inshape"]
+
+    # Now, actually call wrapped function
+    # Put new outputs here!
+    res, details = parse_cF_returns(func(arr, *wrkargs, **kwargs))
+    # User-supplied cFs may return a single numpy.ndarray, or a 2-tuple of type (ndarray, sdict) where
+    # 'ndarray' is a numpy.ndarray containing computation results to be stored in the Syncopy
+    # data type (like AnalogData),
+    #  and 'sdict' is a shallow dictionary containing meta data that will be temporarily
+    # attached to the hdf5 container(s)
+    # during the compute run, but removed/collected and returned as separate return values
+    # to the user in the frontend.
+
+    # In case scalar selections have been performed, explicitly assign
+    # desired output shape to re-create "lost" singleton dimensions
+    # (use an explicit `shape` assignment here to avoid copies)
+    res.shape = trl_dat["outshape"]
+
+    return res, details
+
+
+def _write_source(trl_dat, res, details):
+    """
+    Local helper of :func:`process_io` writing a result to a
+    stand-alone HDF file, a source of the virtual dataset
+    """
+
+    with h5py.File(trl_dat["outfile"], "w") as h5fout:
+        h5fout.create_dataset(trl_dat["outdset"], data=res, **trl_dat.get("dsetkwargs", {}))
+        h5_add_metadata(h5fout, details, unique_key_suffix=trl_dat["call_id"])
+        h5fout.flush()
+
+
+def _process_batch(func, batch, wrkargs, kwargs):
+    """
+    Local helper of :func:`process_io` processing a list of calls in one task
+
+    The input file is opened once, trials directly following each other
+    on disk are read in a single HDF5 read. The results get summed up for
+    trial-averaging, returned as list of ``(res, {call_id: details})`` tuples
+    for sequential storage or written to their virtual sources.
+    """
+
+    # entries are worker dicts or `(wdict, *argv)` tuples
+    items = [(item[0], item[1:]) if isinstance(item, tuple) else (item, wrkargs) for item in batch]
+    keeptrials = items[0][0]["keeptrials"]
+    vdsdir = items[0][0]["vdsdir"]
+
+    total = None
+    results = []
+    with h5py.File(items[0][0]["infile"], mode="r") as h5fin:
+        dset = h5fin[items[0][0]["indset"]]
+        for arr, (trl_dat, argv) in zip(_read_runs(dset, [item[0]["ingrid"] for item in items]), items):
+            res, details = _compute_block(func, arr, trl_dat, argv, kwargs)
+            if not keeptrials:
+                if total is None:
+                    total = (np.array(res, copy=True), {})
                 else:
-                    main_dset[()] += res
+                    total[0][...] += res
+                total[1][trl_dat["call_id"]] = details
+            elif vdsdir is None:
+                results.append((res, {trl_dat["call_id"]: details}))
+            else:
+                _write_source(trl_dat, res, details)
+
+    if not keeptrials:
+        return total
+    if vdsdir is None:
+        return results
+    return None
 
-                h5_add_metadata(h5fout, details, unique_key_suffix=call_id)
-                h5fout.flush()
-            lock.release()
 
-        return None  # result has already been written to disk
+def _read_runs(dset, grids):
+    """
+    Yields the blocks `dset[grid]` for all `grids`, blocks which directly
+    follow each other along one axis are read together in a single read.
+    Empty selections yield `None`. Contiguous datasets are memory mapped
+    instead, see :func:`~syncopy.shared.memmap_io.memmap_dataset`.
+    """
 
-    return wrapper_io
+    if memmap_dataset(dset) is not None:
+        for grid in grids:
+            yield None if any([not sel for sel in grid]) else read_hyperslab(dset, tuple(grid))
+        return
+
+    def plain(grid):
+        return all(isinstance(sl, slice) and sl.step in (None, 1) for sl in grid)
+
+    idx = 0
+    while idx < len(grids):
+        grid = grids[idx]
+        if any([not sel for sel in grid]):
+            yield None
+            idx += 1
+            continue
+
+        # extend the run as long as the next block is adjacent along the same axis
+        end = idx + 1
+        axis = None
+        if plain(grid):
+            while end < len(grids) and plain(grids[end]):
+                adj_axis = _adjacent_axis(grids[end - 1], grids[end])
+                if adj_axis is None or axis not in (None, adj_axis):
+                    break
+                axis = adj_axis
+                end += 1
+
+        if axis is None:
+            yield np.array(dset[grid])
+        else:
+            run = list(grid)
+            run[axis] = slice(grid[axis].start, grids[end - 1][axis].stop)
+            block = np.array(dset[tuple(run)])
+            for nxt in grids[idx:end]:
+                local = [slice(None)] * block.ndim
+                local[axis] = slice(nxt[axis].start - grid[axis].start, nxt[axis].stop - grid[axis].start)
+                yield np.ascontiguousarray(block[tuple(local)])
+        idx = end
 
 
 def _append_docstring(func, supplement, insert_in="Parameters", at_end=True):
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Zero-copy reads of contiguous HDF5 datasets via memory maps
+#
+
+# Builtin/3rd party package imports
+import h5py
+import numpy as np
+
+__all__ = []
+
+# HDF5 file drivers storing the file as-is on disk
+_mappableDrivers = ("sec2", "stdio")
+
+
+def memmap_dataset(dset):
+    """
+    Map the HDF5 dataset `dset` into memory
+
+    Only contiguous, uncompressed datasets with fixed-size numerical
+    type of files opened read-only can be mapped. Reading from the map
+    does not go through HDF5: the operating system's page cache serves
+    repeated reads and slicing returns views instead of copies.
+
+    The map is copy-on-write: arrays taken from it can be modified in
+    place without altering the file.
+
+    Parameters
+    ----------
+    dset : h5py.Dataset
+        Dataset to map
+
+    Returns
+    -------
+    mapped : None or numpy.ndarray
+        Array backed by the mapped file, `None` if `dset` is no HDF5
+        dataset or chunked,
+        compressed, virtual, stored externally, not yet allocated, empty
+        or its file is open for writing
+    """
+
+    if not isinstance(dset, h5py.Dataset):
+        return None
+    try:
+        if dset.file.mode != "r" or dset.file.driver not in _mappableDrivers:
+            return None
+        if dset.is_virtual or dset.chunks is not None or dset.external is not None:
+            return None
+        if dset.dtype.kind not in "biufc" or dset.size == 0:
+            return None
+        offset = dset.id.get_offset()
+        if offset is None:
+            return None
+        mapped = np.memmap(dset.file.filename, dtype=dset.dtype, mode="c", offset=offset, shape=dset.shape)
+    except (OSError, ValueError, TypeError):
+        return None
+    return mapped.view(np.ndarray)
+
+
+def read_hyperslab(dset, idx):
+    """
+    Return ``dset[idx]``, without copying if `dset` can be memory mapped
+
+    Parameters
+    ----------
+    dset : h5py.Dataset or numpy.ndarray
+        Source dataset
+    idx : tuple
+        Index with at most one list or array of (increasing) indices, all
+        other entries are slices or integers (as supported by h5py)
+
+    Returns
+    -------
+    arr : numpy.ndarray
+        A view into the memory map of `dset` or ``dset[idx]`` if `dset`
+        cannot be mapped
+
+    See also
+    --------
+    memmap_dataset : conditions for zero-copy reads
+    """
+
+    idx = idx if isinstance(idx, tuple) else (idx,)
+    mapped = memmap_dataset(dset)
+    if mapped is None:
+        return dset[idx]
+    return mapped[idx]
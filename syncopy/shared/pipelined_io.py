@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+#
+# Background threads decoupling HDF5 I/O from the computations
+# of the ComputationalRoutines
+#
+
+# Builtin/3rd party package imports
+import queue
+import threading
+from time import perf_counter
+import h5py
+import numpy as np
+
+# Local imports
+from syncopy.shared.metadata import h5_add_metadata
+from syncopy.shared.log import get_logger
+
+__all__ = []
+
+
+class BlockWriter:
+    """
+    Write-behind writer for result blocks of a
+    :class:`~syncopy.shared.computational_routine.ComputationalRoutine`
+
+    A single background thread keeps the output HDF5 file open and
+    writes all blocks handed over via :meth:`put`. Blocks waiting in
+    the queue which are contiguous along one axis of the target dataset
+    get merged into a single write. The queue is bounded: if the disk
+    can not keep up, :meth:`put` blocks until there is room again.
+
+    Use as a context manager, leaving the context waits for all
+    pending writes and closes the file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the existing output HDF5 file
+    dset_name : str
+        Name of the pre-allocated target dataset
+    max_queue : int
+        Maximal number of blocks waiting to be written
+
+    Attributes
+    ----------
+    stats : dict
+        I/O statistics, available after the writer got closed:
+        'blocks', 'writes', 'MB', 'write_time' (seconds),
+        'throughput' (MB/s), 'max_queue_depth' and 'mean_queue_depth'
+    """
+
+    def __init__(self, filename, dset_name, max_queue=8):
+
+        self.filename = filename
+        self.dset_name = dset_name
+        self.queue = queue.Queue(maxsize=max_queue)
+
+        # queue depth gets sampled at every hand over
+        self._depths = []
+        self._nBlocks = 0
+        self._nWrites = 0
+        self._nBytes = 0
+        self._writeTime = 0
+        self._error = None
+        self.stats = None
+
+        self._thread = threading.Thread(target=self._run, name="spy-block-writer", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # an error raised within the context takes precedence
+        self.close(reraise=exc_type is None)
+
+    def put(self, outgrid, res, metadata=None):
+        """
+        Hand over a result block to be written to `outgrid`
+
+        Parameters
+        ----------
+        outgrid : tuple of slices
+            Location of the block in the target dataset
+        res : :class:`numpy.ndarray`
+            The result block
+        metadata : dict or None
+            Maps call ids to the `details` returned by the computeFunction,
+            these get attached to the output file as metadata
+        """
+
+        if self._error is not None:
+            raise self._error
+        self._depths.append(self.queue.qsize())
+        self.queue.put((outgrid, res, metadata))
+
+    def close(self, reraise=True):
+        """
+        Wait until all blocks are on disk and compile the statistics
+
+        Parameters
+        ----------
+        reraise : bool
+            If `True`, an error of the writer thread gets raised here
+        """
+
+        if self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join()
+
+        MB = self._nBytes / 1024**2
+        self.stats = {
+            "blocks": self._nBlocks,
+            "writes": self._nWrites,
+            "MB": MB,
+            "write_time": self._writeTime,
+            "throughput": MB / self._writeTime if self._writeTime > 0 else np.nan,
+            "max_queue_depth": max(self._depths, default=0),
+            "mean_queue_depth": np.mean(self._depths) if self._depths else 0,
+        }
+        get_logger().debug(
+            f"BlockWriter: {self._nBlocks} blocks in {self._nWrites} writes, "
+            f"{MB:.1f} MB at {self.stats['throughput']:.1f} MB/s, "
+            f"queue depth max {self.stats['max_queue_depth']} mean {self.stats['mean_queue_depth']:.1f}"
+        )
+
+        if reraise and self._error is not None:
+            raise self._error
+
+    def _run(self):
+
+        try:
+            with h5py.File(self.filename, mode="r+") as h5fout:
+                target = h5fout[self.dset_name]
+                done = False
+                while not done:
+                    # block for the next item, then take everything already waiting
+                    items = [self.queue.get()]
+                    while True:
+                        try:
+                            items.append(self.queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    if items[-1] is None:
+                        done = True
+                        items = items[:-1]
+
+                    t0 = perf_counter()
+                    for outgrid, res in _merge_blocks([item[:2] for item in items]):
+                        target[outgrid] = res
+                        self._nWrites += 1
+                        self._nBytes += res.nbytes
+                    for _, _, metadata in items:
+                        for call_id, details in (metadata or {}).items():
+                            h5_add_metadata(h5fout, details, unique_key_suffix=call_id)
+                    self._writeTime += perf_counter() - t0
+                    self._nBlocks += len(items)
+
+        # the error gets re-raised in the main thread
+        except Exception as exc:
+            self._error = exc
+            # unblock any waiting producer
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+
+
+class TrialPrefetcher:
+    """
+    Read-ahead iterator over the input blocks of a
+    :class:`~syncopy.shared.computational_routine.ComputationalRoutine`
+
+    A background thread calls ``read_func(nblock)`` for all blocks in order
+    and keeps up to `depth` of them ready, such that reading the next
+    trials from disk overlaps with the computation on the current one.
+    With ``depth = 0`` the blocks get read synchronously.
+
+    Parameters
+    ----------
+    read_func : callable
+        Returns the input of block `nblock`
+    nBlocks : int
+        Number of blocks to iterate over
+    depth : int
+        Maximal number of blocks read ahead
+
+    Attributes
+    ----------
+    stats : dict
+        'read_time' and 'wait_time' in seconds, the latter is
+        the time the consumer had to wait for the next block
+    """
+
+    def __init__(self, read_func, nBlocks, depth=2):
+
+        self.read_func = read_func
+        self.nBlocks = nBlocks
+        self.depth = depth
+        self.stats = {"read_time": 0, "wait_time": 0}
+
+    def __len__(self):
+        return self.nBlocks
+
+    def __iter__(self):
+
+        if self.depth == 0:
+            for nblock in range(self.nBlocks):
+                t0 = perf_counter()
+                arr = self.read_func(nblock)
+                self.stats["read_time"] += perf_counter() - t0
+                yield arr
+            return
+
+        blocks = queue.Queue(maxsize=self.depth)
+        stop = threading.Event()
+        reader = threading.Thread(target=self._run, args=(blocks, stop), name="spy-prefetcher", daemon=True)
+        reader.start()
+
+        try:
+            for _ in range(self.nBlocks):
+                t0 = perf_counter()
+                arr, exc = blocks.get()
+                self.stats["wait_time"] += perf_counter() - t0
+                if exc is not None:
+                    raise exc
+                yield arr
+        finally:
+            # also stops the reader if the consumer bailed out early
+            stop.set()
+            reader.join()
+
+    def _run(self, blocks, stop):
+
+        for nblock in range(self.nBlocks):
+            try:
+                t0 = perf_counter()
+                item = (self.read_func(nblock), None)
+                self.stats["read_time"] += perf_counter() - t0
+            except Exception as exc:
+                item = (None, exc)
+            # wait for a free slot, but don't hang if the consumer is gone
+            while not stop.is_set():
+                try:
+                    blocks.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            if stop.is_set() or item[1] is not None:
+                return
+
+
+def _merge_blocks(blocks):
+    """
+    Merges `(outgrid, res)` blocks whose index tuples of slices
+    only differ along one axis, on which they are adjacent
+    """
+
+    blocks = sorted(blocks, key=lambda blk: [_start(sl) for sl in blk[0]])
+
+    # entries are [outgrid, list of arrays, merge axis]
+    merged = []
+    for outgrid, res in blocks:
+        if merged:
+            prev_grid, arrays, axis = merged[-1]
+            adj_axis = _adjacent_axis(prev_grid, outgrid)
+            if adj_axis is not None and axis in (None, adj_axis):
+                new_grid = list(prev_grid)
+                new_grid[adj_axis] = slice(prev_grid[adj_axis].start, outgrid[adj_axis].stop)
+                merged[-1] = [tuple(new_grid), arrays + [res], adj_axis]
+                continue
+        merged.append([outgrid, [res], None])
+
+    return [(grid, arrays[0] if axis is None else np.concatenate(arrays, axis=axis)) for grid, arrays, axis in merged]
+
+
+def _start(sl):
+    return sl.start if isinstance(sl, slice) and sl.start is not None else 0
+
+
+def _adjacent_axis(grid1, grid2):
+    """
+    Returns the axis along which the block `grid2` directly follows
+    `grid1`, `None` if they can't be merged
+    """
+
+    if len(grid1) != len(grid2):
+        return None
+    axis = None
+    for ax, (sl1, sl2) in enumerate(zip(grid1, grid2)):
+        if sl1 == sl2:
+            continue
+        # only plain contiguous slices can be merged
+        if not isinstance(sl1, slice) or not isinstance(sl2, slice) or axis is not None:
+            return None
+        if sl1.step not in (None, 1) or sl2.step not in (None, 1):
+            return None
+        if sl1.stop is None or sl1.stop != sl2.start:
+            return None
+        axis = ax
+    return axis
@@ -0,0 +1,482 @@
+# -*- coding: utf-8 -*-
+#
+# Index of Syncopy's temporary files with reference counting and disk quota
+#
+
+# Builtin/3rd party package imports
+import os
+import json
+import time
+import glob
+import atexit
+import shutil
+import socket
+import threading
+import psutil
+
+# Local imports
+import syncopy
+from syncopy.shared.errors import SPYWarning
+
+__all__ = []
+
+# The managers of the current session (one per storage folder), see `get_storage_manager`
+_managers = {}
+_managerLock = threading.Lock()
+
+
+def get_storage_manager(storage_dir=None):
+    """
+    Return the :class:`StorageManager` of the current Syncopy session
+    for `storage_dir`, by default `syncopy.__storage__`
+    """
+    if storage_dir is None:
+        storage_dir = syncopy.__storage__
+    storage_dir = os.path.abspath(storage_dir)
+    with _managerLock:
+        if storage_dir not in _managers:
+            _managers[storage_dir] = StorageManager(storage_dir, syncopy.__sessionid__)
+    return _managers[storage_dir]
+
+
+class StorageManager:
+    """
+    Index of the temporary files of a Syncopy session in `syncopy.__storage__`
+
+    Every Syncopy data object backed by a file in the temporary storage folder
+    acquires a reference to that file, also for datasets it uses from files
+    of other objects. If the last object referring to a file releases it (i.e.,
+    it is garbage collected), the file and its directory of virtual dataset
+    sources get deleted. Files released without deletion (e.g., by objects
+    with `_persistent_hdf5` set) stay in the index as unreferenced files.
+
+    The index of each session is kept in memory and mirrored to a small JSON
+    file in the `.spy_index` folder of the storage directory, such that
+    :func:`syncopy.cleanup` and other sessions can find the files of a session
+    without scanning the storage folder. The JSON file gets written at most
+    every `indexInterval` seconds.
+
+    If `syncopy.__storagequota__` (in GB) is set, adding a new file evicts
+    unreferenced files of this session and files of sessions which are not
+    running anymore, least recently used first, until the indexed files fit
+    into the quota. The size of this session's files is kept as a running
+    total, the indices of the other sessions get re-read at most every
+    `sessionsInterval` seconds unless the quota is exceeded.
+
+    Parameters
+    ----------
+    storage_dir : str
+        Temporary storage folder
+    session : str
+        Session ID
+
+    Attributes
+    ----------
+    evictions : int
+        Number of files removed to keep the quota
+    """
+
+    indexFolder = ".spy_index"
+    # minimal time (seconds) between two writes of the index file
+    indexInterval = 1.0
+    # maximal age (seconds) of the other sessions' indices used for the quota
+    sessionsInterval = 60.0
+
+    def __init__(self, storage_dir, session):
+
+        self.storage_dir = os.path.abspath(storage_dir)
+        self.session = session
+        self.indexDir = os.path.join(self.storage_dir, self.indexFolder)
+        self.indexFile = os.path.join(self.indexDir, "{}.json".format(session))
+        self.host = socket.gethostname()
+        self.pid = os.getpid()
+        self.evictions = 0
+
+        # filename -> {"created", "accessed", "size"} and filename -> owner ids;
+        # objects release their files when garbage collected, which can happen
+        # in the middle of any method on this thread, so iterate over copies
+        self._entries = {}
+        self._owners = {}
+        self._lock = threading.RLock()
+        self._quotaWarned = False
+
+        # running total of the entries' sizes and files which got written
+        # to since the last quota check, their sizes are outdated
+        self._nBytes = 0
+        self._unsized = set()
+        self._unreferenced = set()
+        # cached indices of the other sessions and their total size
+        self._sessions = []
+        self._sessionsBytes = 0
+        self._sessionsRead = -float("inf")
+        # pending deferred write of the index file
+        self._lastWrite = -float("inf")
+        self._writeTimer = None
+        atexit.register(self.flush)
+
+    def manages(self, filename):
+        """`True` if `filename` is located in the temporary storage folder"""
+        if not isinstance(filename, str) or len(filename) == 0:
+            return False
+        filename = os.path.abspath(filename)
+        try:
+            return os.path.commonpath([filename, self.storage_dir]) == self.storage_dir
+        except ValueError:  # different drives on Windows
+            return False
+
+    def acquire(self, filename, owner):
+        """
+        Record that `owner` uses `filename`
+
+        Files outside of the temporary storage folder are ignored.
+        """
+        if not self.manages(filename):
+            return
+        filename = os.path.abspath(filename)
+        now = time.time()
+        with self._lock:
+            isNew = filename not in self._entries
+            if isNew:
+                self._entries[filename] = {"created": now, "accessed": now, "size": 0}
+            else:
+                self._entries[filename]["accessed"] = now
+            self._owners.setdefault(filename, set()).add(id(owner))
+            self._unsized.add(filename)
+            self._unreferenced.discard(filename)
+            if isNew:
+                self._write_index()
+        if isNew:
+            self.enforce_quota()
+
+    def release(self, filename, owner, delete=True):
+        """
+        Drop the reference of `owner` to `filename`
+
+        Returns `True` if the file got deleted, i.e., `owner` was the last
+        object referring to it and `delete` is `True`.
+        """
+        if not isinstance(filename, str):
+            return False
+        filename = os.path.abspath(filename)
+        with self._lock:
+            owners = self._owners.get(filename)
+            if owners is None or id(owner) not in owners:
+                return False
+            owners.discard(id(owner))
+            if owners:
+                return False
+            del self._owners[filename]
+            if delete:
+                _remove_file(filename)
+                self._drop_entry(filename)
+            elif filename in self._entries:
+                self._update_size(filename)
+                self._unreferenced.add(filename)
+            self._write_index()
+            return delete
+
+    def release_all(self, owner, delete=True):
+        """
+        Drop all references of `owner`, returns the list of deleted files
+        """
+        with self._lock:
+            owned = [fname for fname, owners in self._owners.copy().items() if id(owner) in owners]
+            return [fname for fname in owned if self.release(fname, owner, delete=delete)]
+
+    def files(self, referenced=None):
+        """
+        Indexed files of this session
+
+        Parameters
+        ----------
+        referenced : None or bool
+            If `True` (`False`) only return files (not) referenced by any
+            object, by default all files are returned.
+
+        Returns
+        -------
+        files : dict
+            Last known sizes (in bytes) of the files
+        """
+        with self._lock:
+            return {
+                fname: entry["size"]
+                for fname, entry in self._entries.copy().items()
+                if referenced is None or (fname in self._owners) == referenced
+            }
+
+    def usage(self):
+        """
+        Update file sizes and return the size of this session's files in bytes
+        """
+        with self._lock:
+            for fname in list(self._entries):
+                self._update_size(fname)
+            self._unsized.clear()
+            return self._nBytes
+
+    def sessions(self, max_age=24):
+        """
+        Indices of all other sessions found in the storage folder
+
+        Parameters
+        ----------
+        max_age : float
+            Sessions on other hosts count as alive if their index got updated
+            within the last `max_age` hours.
+
+        Returns
+        -------
+        sessions : list of dict
+            Contents of the JSON index files of the other sessions, with the
+            additional key `"alive"` (`True` if the session might still use its files)
+        """
+        sessions = []
+        for indexFile in glob.glob(os.path.join(self.indexDir, "*.json")):
+            if indexFile == self.indexFile:
+                continue
+            try:
+                with open(indexFile, "r") as fid:
+                    info = json.load(fid)
+            except (OSError, ValueError):
+                continue
+            info["indexFile"] = indexFile
+            info["alive"] = self._session_alive(info, max_age)
+            sessions.append(info)
+        return sessions
+
+    def remove(self, filenames, sessions=None):
+        """
+        Delete `filenames` and drop them from this session's index and the
+        indices of `sessions` (as returned by :meth:`sessions`)
+        """
+        filenames = set(os.path.abspath(fname) for fname in filenames)
+        for fname in filenames:
+            _remove_file(fname)
+        with self._lock:
+            for fname in filenames:
+                self._drop_entry(fname)
+                self._owners.pop(fname, None)
+            self._write_index(now=True)
+        for info in sessions if sessions is not None else []:
+            entries = info.get("entries", {})
+            if not filenames.intersection(entries):
+                continue
+            cached = any(info is cachedInfo for cachedInfo in self._sessions)
+            for fname in filenames:
+                entry = entries.pop(fname, None)
+                if entry is not None and cached:
+                    self._sessionsBytes -= entry.get("size", 0)
+            _write_session_index(info)
+
+    def enforce_quota(self, quota=None):
+        """
+        Evict unreferenced files LRU-first until the indexed files fit into `quota`
+
+        Parameters
+        ----------
+        quota : None or float
+            Disk quota in GB, by default `syncopy.__storagequota__` is used.
+            Nothing is done if no quota is set.
+
+        Returns
+        -------
+        evicted : list
+            Deleted files
+        """
+        if quota is None:
+            quota = getattr(syncopy, "__storagequota__", None)
+        if quota is None:
+            return []
+
+        with self._lock:
+            # only the files written to since the last check changed their size
+            for fname in self._unsized.copy():
+                self._update_size(fname)
+            self._unsized.clear()
+            total = self._nBytes
+        # evictions need recent indices of the other sessions
+        age = time.time() - self._sessionsRead
+        if age > self.sessionsInterval or (total + self._sessionsBytes > quota * 1e9 and age > self.indexInterval):
+            self._read_sessions()
+        total += self._sessionsBytes
+        if total <= quota * 1e9:
+            return []
+
+        with self._lock:
+            candidates = [
+                (self._entries[fname]["accessed"], fname, None)
+                for fname in self._unreferenced.copy()
+                if fname in self._entries
+            ]
+        for info in self._sessions:
+            if not info["alive"]:
+                for fname, entry in info.get("entries", {}).items():
+                    candidates.append((entry.get("accessed", 0), fname, info))
+
+        evicted = []
+        affected = []
+        for _, fname, info in sorted(candidates, key=lambda cand: cand[0]):
+            if total <= quota * 1e9:
+                break
+            if info is None:
+                size = self._entries.get(fname, {}).get("size", 0)
+            else:
+                size = info["entries"][fname].get("size", 0)
+                if not any(info is other for other in affected):
+                    affected.append(info)
+            total -= size
+            evicted.append(fname)
+        # all indices get updated once
+        if evicted:
+            self.remove(evicted, sessions=affected)
+        self.evictions += len(evicted)
+
+        if total > quota * 1e9 and not self._quotaWarned:
+            msg = (
+                "Temporary storage quota of {:.2f} GB exceeded by files still in use "
+                + "({:.2f} GB), consider deleting Syncopy objects which are not needed anymore"
+            )
+            SPYWarning(msg.format(quota, total / 1e9))
+            self._quotaWarned = True
+
+        return evicted
+
+    def flush(self):
+        """
+        Write a pending update of the index file right away
+        """
+        with self._lock:
+            if self._writeTimer is not None:
+                self._write_index(now=True)
+
+    def _read_sessions(self):
+        """
+        Local helper caching the indices of the other sessions and their total size
+        """
+        sessions = self.sessions()
+        self._sessions = sessions
+        self._sessionsBytes = sum(
+            entry.get("size", 0) for info in sessions for entry in info.get("entries", {}).values()
+        )
+        self._sessionsRead = time.time()
+
+    def _update_size(self, filename):
+        """
+        Local helper re-reading the size of an indexed file, keeps the running total
+        """
+        entry = self._entries.get(filename)
+        if entry is not None:
+            size = _file_size(filename)
+            self._nBytes += size - entry["size"]
+            entry["size"] = size
+
+    def _drop_entry(self, filename):
+        """
+        Local helper removing `filename` from the index, keeps the running total
+        """
+        entry = self._entries.pop(filename, None)
+        if entry is not None:
+            self._nBytes -= entry["size"]
+        self._unsized.discard(filename)
+        self._unreferenced.discard(filename)
+
+    def _session_alive(self, info, max_age):
+        """
+        Local helper: sessions on this host are alive if their process exists,
+        sessions on other hosts if their index got updated within `max_age` hours
+        """
+        if info.get("host") == self.host:
+            return psutil.pid_exists(info.get("pid", -1))
+        return time.time() - info.get("updated", 0) < max_age * 3600
+
+    def _write_index(self, now=False):
+        """
+        Local helper mirroring the in-memory index to this session's JSON file,
+        unless `now` is `True` writes within `indexInterval` get deferred
+        """
+        with self._lock:
+            wait = self._lastWrite + self.indexInterval - time.time()
+            if not now and wait > 0:
+                # the deferred write picks up all changes until then
+                if self._writeTimer is None:
+                    self._writeTimer = threading.Timer(wait, self._write_index, kwargs={"now": True})
+                    self._writeTimer.daemon = True
+                    self._writeTimer.start()
+                return
+            if self._writeTimer is not None:
+                self._writeTimer.cancel()
+                self._writeTimer = None
+            self._lastWrite = time.time()
+            self._dump_index()
+
+    def _dump_index(self):
+        """
+        Local helper writing the in-memory index to this session's JSON file
+        """
+        entries = {}
+        for fname, entry in self._entries.copy().items():
+            entries[fname] = dict(entry, owners=len(self._owners.get(fname, ())))
+        info = {
+            "session": self.session,
+            "host": self.host,
+            "pid": self.pid,
+            "updated": time.time(),
+            "entries": entries,
+            "indexFile": self.indexFile,
+        }
+        _write_session_index(info)
+
+
+def _write_session_index(info):
+    """
+    Local helper atomically writing a session index, empty indices get removed
+    """
+    indexFile = info["indexFile"]
+    try:
+        if not info.get("entries"):
+            if os.path.exists(indexFile):
+                os.unlink(indexFile)
+            return
+        os.makedirs(os.path.dirname(indexFile), exist_ok=True)
+        contents = {key: value for key, value in info.items() if key not in ("indexFile", "alive")}
+        tmpFile = "{}.{}.tmp".format(indexFile, os.getpid())
+        with open(tmpFile, "w") as fid:
+            json.dump(contents, fid)
+        os.replace(tmpFile, indexFile)
+    except Exception:  # the index is a cache, never fail because of it (e.g., at shutdown)
+        pass
+
+
+def _file_size(filename):
+    """
+    Local helper: size of `filename` and its folder of virtual dataset sources in bytes
+    """
+    size = 0
+    try:
+        size += os.path.getsize(filename)
+    except OSError:
+        pass
+    vdsDir = os.path.splitext(filename)[0]
+    if os.path.isdir(vdsDir):
+        for dirpath, _, fnames in os.walk(vdsDir):
+            for fname in fnames:
+                try:
+                    size += os.path.getsize(os.path.join(dirpath, fname))
+                except OSError:
+                    pass
+    return size
+
+
+def _remove_file(filename):
+    """
+    Local helper deleting `filename` and its folder of virtual dataset sources
+    """
+    try:
+        if os.path.isfile(filename):
+            os.unlink(filename)
+        elif os.path.isdir(filename):
+            shutil.rmtree(filename, ignore_errors=True)
+    except OSError:
+        pass
+    shutil.rmtree(os.path.splitext(filename)[0], ignore_errors=True)
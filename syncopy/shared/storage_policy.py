@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+#
+# Chunk layout and compression of the HDF5 datasets written by Syncopy
+#
+
+# Builtin/3rd party package imports
+import math
+import importlib
+from functools import reduce
+from importlib.util import find_spec
+import numpy as np
+
+# Local imports
+import syncopy
+from syncopy.shared.errors import SPYValueError, SPYTypeError
+
+__all__ = []
+
+# hdf5plugin provides the blosc and zstd filters, importing it registers them with HDF5
+__hdf5plugin__ = find_spec("hdf5plugin") is not None
+
+_filters = (None, "lzf", "gzip", "blosc", "zstd")
+
+
+class StoragePolicy:
+    """
+    Layout and filters of the HDF5 datasets holding Syncopy data
+
+    Chunked datasets are stored in blocks aligned with the trials
+    along the stacking dimension and with blocks of channels: reading
+    or writing a trial touches only the chunks of that trial, which is
+    also the prerequisite for compressing datasets.
+
+    Parameters
+    ----------
+    chunked : bool
+        If `False`, datasets are stored contiguously (no filters possible)
+    compression : None or str
+        Lossless filter, one of `"lzf"`, `"gzip"` or, if `hdf5plugin`
+        is installed, `"blosc"` and `"zstd"`
+    level : None or int
+        Compression level of `"gzip"` (0-9, default 4), `"blosc"`
+        (0-9, default 5) and `"zstd"` (1-22, default 3)
+    shuffle : bool
+        Apply the byte shuffle filter before compression, which typically
+        increases compression ratios of numerical data
+    chunk_mb : float
+        Upper bound of the size of a single chunk in MB
+
+    Examples
+    --------
+    Store all datasets created from now on trial-wise with the lzf filter:
+
+    >>> spy.__storagepolicy__ = "lzf"
+
+    or with a custom policy:
+
+    >>> spy.__storagepolicy__ = spy.shared.storage_policy.StoragePolicy(compression="gzip", level=6)
+    """
+
+    def __init__(self, chunked=True, compression=None, level=None, shuffle=True, chunk_mb=4):
+
+        if compression not in _filters:
+            lgl = "one of {}".format(_filters)
+            raise SPYValueError(legal=lgl, varname="compression", actual=compression)
+        if compression is not None and not chunked:
+            lgl = "chunked storage for compressed datasets"
+            raise SPYValueError(legal=lgl, varname="chunked", actual=chunked)
+        if compression in ("blosc", "zstd") and not __hdf5plugin__:
+            lgl = "installed hdf5plugin package for '{}' compression".format(compression)
+            raise SPYValueError(legal=lgl, varname="compression", actual=compression)
+        if level is not None and not isinstance(level, int):
+            raise SPYTypeError(level, varname="level", expected="int or None")
+        if chunk_mb <= 0:
+            raise SPYValueError(legal="positive chunk size", varname="chunk_mb", actual=chunk_mb)
+
+        self.chunked = chunked
+        self.compression = compression
+        self.level = level
+        self.shuffle = shuffle
+        self.chunk_mb = chunk_mb
+
+    def __repr__(self):
+        return "{}(chunked={}, compression={}, level={}, shuffle={}, chunk_mb={})".format(
+            self.__class__.__name__,
+            self.chunked,
+            repr(self.compression),
+            self.level,
+            self.shuffle,
+            self.chunk_mb,
+        )
+
+    def dataset_kwargs(self, shape, dtype, stackingDim=None, trialLengths=None, dimord=None):
+        """
+        Keyword arguments for :meth:`h5py.Group.create_dataset`
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the dataset
+        dtype : numpy.dtype
+            Data type of the dataset
+        stackingDim : None or int
+            Axis along which the trials are stacked
+        trialLengths : None or list
+            Extents of the trials along `stackingDim`
+        dimord : None or list
+            Dimension labels, axes labelled `"channel..."` get blocked
+
+        Returns
+        -------
+        kwargs : dict
+            `chunks` and the filter options, empty for contiguous storage
+        """
+
+        shape = tuple(int(ext) for ext in shape)
+        if not self.chunked or len(shape) == 0 or 0 in shape:
+            return {}
+
+        channelAxes = []
+        if dimord is not None and len(dimord) == len(shape):
+            channelAxes = [ax for ax, label in enumerate(dimord) if str(label).startswith("channel")]
+        chunks = chunk_shape(
+            shape,
+            np.dtype(dtype).itemsize,
+            stackingDim=stackingDim,
+            trialLengths=trialLengths,
+            channelAxes=channelAxes,
+            chunkBytes=self.chunk_mb * 1024**2,
+        )
+
+        kwargs = {"chunks": chunks}
+        if self.compression in ("lzf", "gzip"):
+            kwargs["compression"] = self.compression
+            kwargs["shuffle"] = self.shuffle
+            if self.compression == "gzip":
+                kwargs["compression_opts"] = 4 if self.level is None else self.level
+        elif self.compression == "blosc":
+            hdf5plugin = importlib.import_module("hdf5plugin")
+            shuffle = hdf5plugin.Blosc.SHUFFLE if self.shuffle else hdf5plugin.Blosc.NOSHUFFLE
+            kwargs.update(
+                hdf5plugin.Blosc(cname="lz4", clevel=5 if self.level is None else self.level, shuffle=shuffle)
+            )
+        elif self.compression == "zstd":
+            hdf5plugin = importlib.import_module("hdf5plugin")
+            kwargs.update(hdf5plugin.Zstd(clevel=3 if self.level is None else self.level))
+            kwargs["shuffle"] = self.shuffle
+        return kwargs
+
+
+# Named policies available via `syncopy.__storagepolicy__`
+storagePolicies = {
+    "contiguous": StoragePolicy(chunked=False),
+    "chunked": StoragePolicy(),
+    "lzf": StoragePolicy(compression="lzf"),
+    "gzip": StoragePolicy(compression="gzip"),
+}
+if __hdf5plugin__:
+    storagePolicies["blosc"] = StoragePolicy(compression="blosc")
+    storagePolicies["zstd"] = StoragePolicy(compression="zstd")
+
+
+def get_storage_policy(policy=None):
+    """
+    Return the :class:`StoragePolicy` named `policy`, by default `syncopy.__storagepolicy__`
+    """
+    if policy is None:
+        policy = getattr(syncopy, "__storagepolicy__", "contiguous")
+    if isinstance(policy, StoragePolicy):
+        return policy
+    if policy not in storagePolicies:
+        lgl = "StoragePolicy or one of {}".format(list(storagePolicies.keys()))
+        raise SPYValueError(legal=lgl, varname="storage policy", actual=policy)
+    if policy in ("blosc", "zstd"):
+        register_filters()
+    return storagePolicies[policy]
+
+
+def dataset_kwargs(shape, dtype, stackingDim=None, trialLengths=None, dimord=None, policy=None):
+    """
+    Keyword arguments for :meth:`h5py.Group.create_dataset` according to
+    the current storage policy, see :meth:`StoragePolicy.dataset_kwargs`
+    """
+    return get_storage_policy(policy).dataset_kwargs(
+        shape, dtype, stackingDim=stackingDim, trialLengths=trialLengths, dimord=dimord
+    )
+
+
+def register_filters():
+    """
+    Make the filters of hdf5plugin available for reading, if it is installed
+    """
+    if __hdf5plugin__:
+        importlib.import_module("hdf5plugin")
+
+
+def chunk_shape(shape, itemsize, stackingDim=None, trialLengths=None, channelAxes=(), chunkBytes=4 * 1024**2):
+    """
+    Chunk shape aligned with trials and channel blocks
+
+    Along `stackingDim` a chunk spans a whole trial if all trials have
+    the same length, otherwise the greatest common divisor of the
+    lengths (such that every trial boundary is a chunk boundary) or,
+    if that is too short, the median trial length. Without trials, as many
+    entries along `stackingDim` as fit into `chunkBytes`. Chunks larger than
+    `chunkBytes` are first split into blocks of channels and then into
+    equal parts of the trial (preferring divisors of the trial length).
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of the dataset (no zero extents)
+    itemsize : int
+        Size of a single element in bytes
+    stackingDim : None or int
+        Trial stacking axis, if `None` the first axis is split
+    trialLengths : None or list
+        Extents of the trials along `stackingDim`
+    channelAxes : list
+        Axes holding channels
+    chunkBytes : float
+        Upper bound of the chunk size in bytes
+
+    Returns
+    -------
+    chunks : tuple
+        Chunk shape with `0 < chunks[k] <= shape[k]`
+    """
+
+    chunks = list(shape)
+    stack = 0 if stackingDim is None else stackingDim
+    budget = max(1, int(chunkBytes // itemsize))
+
+    # Trial-aligned extent along the stacking dimension
+    lengths = [int(ln) for ln in (trialLengths if trialLengths is not None else []) if ln > 0]
+    rowSize = max(1, np.prod(shape, dtype=np.int64) // shape[stack])
+    if len(lengths) == 0:
+        # no trials known: keep all channels of a sample together
+        chunks[stack] = max(1, int(budget // rowSize))
+    else:
+        common = reduce(math.gcd, lengths)
+        if common * rowSize * 16 >= min(budget, max(lengths) * rowSize):
+            chunks[stack] = common
+        else:
+            chunks[stack] = int(np.median(lengths))
+    chunks[stack] = min(chunks[stack], shape[stack])
+
+    # Split channels into blocks until chunks fit into the budget
+    for ax in reversed([ax for ax in channelAxes if ax != stack]):
+        size = np.prod(chunks, dtype=np.int64)
+        if size <= budget:
+            break
+        chunks[ax] = max(1, int(chunks[ax] * budget // size))
+
+    # Split trials into (preferably equal) parts
+    size = np.prod(chunks, dtype=np.int64)
+    if size > budget:
+        nParts = int(math.ceil(size / budget))
+        extent = chunks[stack]
+        for parts in range(nParts, min(2 * nParts, extent) + 1):
+            if extent % parts == 0:
+                nParts = parts
+                break
+        chunks[stack] = max(1, int(math.ceil(extent / nParts)))
+
+    # Remaining axes (e.g., frequencies or tapers) as last resort
+    for ax in range(len(chunks)):
+        size = np.prod(chunks, dtype=np.int64)
+        if size <= budget:
+            break
+        if ax != stack:
+            chunks[ax] = max(1, int(chunks[ax] * budget // size))
+
+    return tuple(chunks)
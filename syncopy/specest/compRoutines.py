@@ -28,7 +28,7 @@ from scipy import signal
 # backend method imports
 from .mtmfft import mtmfft
 from .mtmconvol import mtmconvol
-from .superlet import superlet
+from .superlet import superlet, superlet_blocks
 from .wavelet import wavelet
 from .fooofspy import fooofspy
 
@@ -51,6 +51,11 @@ from syncopy.shared.metadata import (
 
 from syncopy.shared.const_def import spectralConversions, spectralDTypes
 
+# minimal memory (bytes) for the intermediate complex transform of a block of
+# scales in `wavelet_cF` and `superlet_cF`, larger transforms get computed in
+# blocks of scales, each reduced to the requested output right away
+scaleBlockMem = 256 * 1024**2
+
 # -----------------------
 # MultiTaper FFT
 # -----------------------
@@ -246,7 +251,6 @@ def mtmconvol_cF(
     trl_dat,
     soi,
     postselect,
-    equidistant=True,
     toi=None,
     foi=None,
     nTaper=1,
@@ -266,19 +270,17 @@ def mtmconvol_cF(
     ----------
     trl_dat : 2D :class:`numpy.ndarray`
         Uniformly sampled multi-channel time-series
-    soi : list of slices or slice
-        Samples of interest; either a single slice encoding begin- to end-samples
-        to perform analysis on (if sliding window centroids are equidistant)
-        or list of slices with each slice corresponding to coverage of a single
-        analysis window (if spacing between windows is not constant)
+    soi : slice or 1D :class:`numpy.ndarray` of int
+        Samples of interest; either a slice encoding begin- to end-samples
+        to perform the sliding window analysis on (if `toi` is `'all'` or a
+        percentage) or the sample indices to center the analysis windows on
+        (if `toi` is an array)
     samplerate : float
         Samplerate of `trl_dat` in Hz
     noverlap : int
         Number of samples covered by two adjacent analysis windows
     nperseg : int
         Size of analysis windows (in samples)
-    equidistant : bool
-        If `True`, spacing of window-centroids is equidistant.
     toi : 1D :class:`numpy.ndarray` or float or str
         Either time-points to center windows on if `toi` is a :class:`numpy.ndarray`,
         or percentage of overlap between windows if `toi` is a scalar or `"all"`
@@ -336,8 +338,11 @@ def mtmconvol_cF(
     Consequently, this function does **not** perform any error checking and operates
     under the assumption that all inputs have been externally validated and cross-checked.
 
-    The computational heavy lifting in this code is performed by SciPy's Short Time
-    Fourier Transform (STFT) implementation :func:`scipy.signal.stft`.
+    The computational heavy lifting in this code is performed by
+    :func:`~syncopy.specest.mtmconvol.mtmconvol`: it frames the trial into a strided
+    view of overlapping segments (see :func:`~syncopy.specest.mtmconvol._segment_view`)
+    and transforms the tapered segments with a single batched real FFT
+    :func:`scipy.fft.rfft`.
 
     See also
     --------
@@ -345,7 +350,8 @@ def mtmconvol_cF(
     MultiTaperFFTConvol : :class:`~syncopy.shared.computational_routine.ComputationalRoutine`
                           instance that calls this method as
                           :meth:`~syncopy.shared.computational_routine.ComputationalRoutine.computeFunction`
-    scipy.signal.stft : SciPy's STFT implementation
+    syncopy.specest.mtmconvol.mtmconvol : (multi-)tapered short time FFT backend
+    scipy.fft.rfft : SciPy's real FFT implementation
     """
 
     # Re-arrange array if necessary and get dimensional information
@@ -383,29 +389,15 @@ def mtmconvol_cF(
     # additional keyword args for `stft` in dictionary
     method_kwargs.update({"boundary": stftBdry, "padded": stftPad, "detrend": detrend})
 
-    if equidistant:
-        ftr, freqs = mtmconvol(dat[soi, :], **method_kwargs)
-        _, fIdx = best_match(freqs, foi, squash_duplicates=True)
-        spec = ftr[postselect, :, fIdx, :]
-        spec = spectralConversions[output](spec)
-
+    if isinstance(toi, np.ndarray):
+        # sparse evaluation: only the windows centered on the
+        # `toi` samples get transformed, independent of their spacing
+        ftr, freqs = mtmconvol(dat, centers=soi, **method_kwargs)
     else:
-        # in this case only a single window gets centered on
-        # every individual soi, so we can use mtmfft!
-        samplerate = method_kwargs["samplerate"]
-        taper = method_kwargs["taper"]
-
-        # In case tapers aren't preserved allocate `spec` "too big"
-        # and average afterwards
-        spec = np.full((nTime, nTaper, nFreq, nChannels), np.nan, dtype=spectralDTypes[output])
-
-        ftr, freqs = mtmfft(dat[soi[0], :], samplerate, taper=taper, taper_opt=taper_opt)
-        _, fIdx = best_match(freqs, foi, squash_duplicates=True)
-        spec[0, ...] = spectralConversions[output](ftr[:, fIdx, :])
-        # loop over remaining soi to center windows on
-        for tk in range(1, len(soi)):
-            ftr, freqs = mtmfft(dat[soi[tk], :], samplerate, taper=taper, taper_opt=taper_opt)
-            spec[tk, ...] = spectralConversions[output](ftr[:, fIdx, :])
+        ftr, freqs = mtmconvol(dat[soi, :], **method_kwargs)
+    _, fIdx = best_match(freqs, foi, squash_duplicates=True)
+    spec = ftr[postselect, :, fIdx, :]
+    spec = spectralConversions[output](spec)
 
     # Average across tapers if wanted
     # only valid if output='pow' !
@@ -588,11 +580,18 @@ def wavelet_cF(
     # actual method call
     # ------------------
     # Compute wavelet transform with given data/time-selection
-    spec = wavelet(dat[preselect, :], **method_kwargs)
-    # the cwt stacks the scales on the 1st axis, move to 2nd
-    spec = spec.transpose(1, 0, 2)[postselect, :, :]
+    # in blocks of scales, only the output gets allocated in full
+    dat = dat[preselect, :]
+    scales = method_kwargs["scales"]
+    blockSize = _scale_block_size(nScales, dat.shape[0], nChannels, outShape, output)
+    spec = np.empty(outShape, dtype=spectralDTypes[output])
+    for start in range(0, nScales, blockSize):
+        blk = slice(start, start + blockSize)
+        block = wavelet(dat, **{**method_kwargs, "scales": scales[blk]})
+        # the cwt stacks the scales on the 1st axis, move to 2nd
+        spec[:, 0, blk, :] = spectralConversions[output](block.transpose(1, 0, 2)[postselect, :, :])
 
-    return spectralConversions[output](spec[:, np.newaxis, :, :])
+    return spec
 
 
 class WaveletTransform(ComputationalRoutine):
@@ -755,11 +754,31 @@ def superlet_cF(
     # ------------------
     # actual method call
     # ------------------
-    gmean_spec = superlet(dat[preselect, :], **method_kwargs)
-    # the cwtSL stacks the scales on the 1st axis
-    gmean_spec = gmean_spec.transpose(1, 0, 2)[postselect, :, :]
+    # transform in blocks of scales, only the output gets allocated in full
+    dat = dat[preselect, :]
+    blockSize = _scale_block_size(nScales, dat.shape[0], nChannels, outShape, output)
+    spec = np.empty(outShape, dtype=spectralDTypes[output])
+    for blk, gmean_spec in superlet_blocks(dat, block_size=blockSize, **method_kwargs):
+        # the cwtSL stacks the scales on the 1st axis
+        spec[:, 0, blk, :] = spectralConversions[output](gmean_spec.transpose(1, 0, 2)[postselect, :, :])
+
+    return spec
+
+
+def _scale_block_size(nScales, nSamples, nChannels, outShape, output):
+    """
+    Local helper to determine the number of scales transformed at once by
+    `wavelet_cF` and `superlet_cF`: the intermediate complex transform of a
+    block needs at most as much memory as the output, but at least
+    `scaleBlockMem` bytes are used
+    """
+
+    outBytes = np.prod(outShape) * np.dtype(spectralDTypes[output]).itemsize
+    # complex128 product and inverse FFT buffer of up to
+    # twice the signal length plus the complex64 result
+    perScale = nSamples * nChannels * (2 * 2 * 16 + 8)
 
-    return spectralConversions[output](gmean_spec[:, np.newaxis, :, :])
+    return int(np.clip(max(outBytes, scaleBlockMem) // perScale, 1, nScales))
 
 
 class SuperletTransform(ComputationalRoutine):
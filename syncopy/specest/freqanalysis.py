@@ -38,7 +38,8 @@ from syncopy.shared.input_processors import (
 from syncopy.specest.fooofspy import default_fooof_opt
 import syncopy.specest.wavelets as spywave
 import syncopy.specest.superlet as superlet
-from .wavelet import get_optimal_wavelet_scales
+from .wavelet import get_optimal_wavelet_scales, use_frequency_domain, availableDomains
+from syncopy.preproc.preprocessing import preprocessing_stages
 
 # Local imports
 
@@ -79,6 +80,7 @@ def freqanalysis(
     wavelet="Morlet",
     width=6,
     order=None,
+    cwt_domain="auto",
     order_max=None,
     order_min=1,
     c_1=3,
@@ -86,6 +88,7 @@ def freqanalysis(
     out=None,
     fooof_opt=None,
     ft_compat=False,
+    preprocess=None,
     **kwargs,
 ):
     """
@@ -165,6 +168,7 @@ def freqanalysis(
         * **width** : Nondimensional frequency constant of Morlet wavelet function (>= 6)
         * **order** : Order of Paul wavelet function (>= 4) or derivative order
           of real-valued DOG wavelets (2 = mexican hat)
+        * **cwt_domain** : convolution in the time or frequency domain
 
     "superlet" : Superlet transform
         Perform time-frequency analysis on time-series trial data using
@@ -282,6 +286,15 @@ def freqanalysis(
         `wavelet` to `'Mexican_hat'`, `'Marr'` or `'Ricker'`. **Note**: A real-valued
         wavelet function encodes *only* information about peaks and discontinuities
         in the signal and does *not* provide any information about amplitude or phase.
+    cwt_domain : str
+        Only valid if `method` is `'wavelet'`. One of
+        :data:`~syncopy.specest.wavelet.availableDomains`. With `'time'` the
+        wavelet transform convolves each scale separately in the time domain,
+        with `'frequency'` the data gets transformed only once and multiplied
+        with the analytic wavelet spectra (only available for `wavelet='Morlet'`).
+        If `'auto'`, the frequency domain is used for the Morlet wavelet if this
+        is expected to be faster given the number of scales and the length of
+        the longest trial. Both domains give the same result.
     order_max : int
         Only valid if `method` is `'superlet'`.
         Maximal order of the superlet set. Controls the maximum
@@ -319,6 +332,12 @@ def freqanalysis(
         Set to `True` to use Field Trip's spectral normalization for FFT based methods
         (``method='mtmfft'`` and ``method='mtmconvol'``). So spectral power is NOT
         independent of the padding size!
+    preprocess : dict or None, optional
+        Keyword arguments of :func:`~syncopy.preprocessing`, e.g.
+        ``{'filter_class': 'but', 'filter_type': 'bp', 'freq': [1, 100]}``.
+        The preprocessing gets applied to each trial in memory right before
+        the spectral estimation (and its `polyremoval`), without storing
+        the preprocessed data. Only real valued `hilbert` outputs are supported.
 
     Returns
     -------
@@ -488,6 +507,12 @@ def freqanalysis(
         "pad": pad,
     }
 
+    # preprocessing fused in front of the spectral estimation
+    pre_stages = None
+    if preprocess is not None:
+        pre_stages, pp_log = preprocessing_stages(data, preprocess)
+        log_dct["preprocess"] = pp_log
+
     SPYLog(f"Running specest method '{method}'.", loglevel="DEBUG")
 
     # --------------------------------
@@ -663,6 +688,7 @@ def freqanalysis(
             timeAxis=timeAxis,
             keeptapers=keeptapers,
             polyremoval=polyremoval,
+            pre_stages=pre_stages,
             output=output,
             method_kwargs=method_kwargs,
         )
@@ -687,13 +713,11 @@ def freqanalysis(
             if toi != "all":
                 lgl = "`toi = 'all'` to center analysis windows on all time-points"
                 raise SPYValueError(legal=lgl, varname="toi", actual=toi)
-            equidistant = True
             overlap = np.inf
 
         elif np.issubdtype(type(toi), np.number):
             scalar_parser(toi, varname="toi", lims=[0, 1])
             overlap = toi
-            equidistant = True
         # this captures all other cases, e.i. toi is of sequence type
         else:
             if method == "welch":
@@ -722,10 +746,6 @@ def freqanalysis(
             if tSteps.min() < dt:
                 msg = f"`toi` selection too fine, max. time resolution is {dt}s"
                 SPYWarning(msg)
-            # This is imho a bug in NumPy - even `arange` and `linspace` may produce
-            # arrays that are numerically not exactly equidistant - `unique` will
-            # show several entries here - use `allclose` to identify "even" spacings
-            equidistant = np.allclose(tSteps, [tSteps[0]] * tSteps.size)
 
         # If `toi` was 'all' or a percentage, use entire time interval of (selected)
         # trials and check if those trials have *approximately* equal length
@@ -739,7 +759,6 @@ def freqanalysis(
 
         # number of samples per window
         nperseg = int(t_ftimwin * data.samplerate)
-        halfWin = int(nperseg / 2)
         postSelect = slice(None)  # select all is the default
 
         if 0 <= overlap <= 1:  # `toi` is percentage
@@ -751,46 +770,14 @@ def freqanalysis(
 
         # `toi` is array
         if overlap < 0:
-            # Compute necessary padding at begin/end of trials to fit sliding windows
-            offStart = ((toi[0] - tStart) * data.samplerate).astype(np.intp)
-            padBegin = halfWin - offStart
-            padBegin = ((padBegin > 0) * padBegin).astype(np.intp)
-            offEnd = ((tEnd - toi[-1]) * data.samplerate).astype(np.intp)
-            padEnd = halfWin - offEnd
-            padEnd = ((padEnd > 0) * padEnd).astype(np.intp)
-
-            # Treat equi-distant `toi` arrays with spacing large enough that windows
-            # do not overlap as if they were not equidistant
-            if tSteps.max() * data.samplerate > halfWin and equidistant:
-                equidistant = False
-
-            # Compute sample-indices (one slice/list per trial) from time-selections
+            # Compute the window center sample-indices (one array per trial),
+            # the spectral estimate gets evaluated only at those samples and
+            # windows reaching beyond the trial boundaries are zero padded
+            # (for trials with different offsets `toi` may even lie outside
+            # of single trials)
             soi = []
-            if equidistant:
-                # soi just trims the input data to the [toi[0], toi[-1]] interval
-                # postSelect then subsamples the spectral esimate to the user given toi
-                postSelect = []
-                for tk in range(numTrials):
-                    start = max(0, int(round(data.samplerate * (toi[0] - tStart[tk]) - halfWin)))
-                    stop = int(round(data.samplerate * (toi[-1] - tStart[tk]) + halfWin + 1))
-                    soi.append(slice(start, max(stop, stop - start)))
-
-                # chosen toi subsampling interval in sample units, min. is 1;
-                # compute `delta_idx` s.t. stop - start / delta_idx == toi.size
-                delta_idx = int(round((soi[0].stop - soi[0].start) / toi.size))
-                delta_idx = delta_idx if delta_idx > 1 else 1
-                postSelect = slice(None, None, delta_idx)
-
-            else:
-                for tk in range(numTrials):
-                    starts = (data.samplerate * (toi - tStart[tk]) - halfWin).astype(np.intp)
-                    starts += padBegin[tk]
-                    stops = (data.samplerate * (toi - tStart[tk]) + halfWin + 1).astype(np.intp)
-                    stops += padBegin[tk]
-                    stops = np.maximum(stops, stops - starts, dtype=np.intp)
-                    soi.append([slice(start, stop) for start, stop in zip(starts, stops)])
-                    # postSelect here remains slice(None), as resulting spectrum
-                    # has exactly one entry for each soi
+            for tk in range(numTrials):
+                soi.append(np.round(data.samplerate * (toi - tStart[tk])).astype(np.intp))
 
         # `toi` is percentage or "all"
         else:
@@ -809,12 +796,12 @@ def freqanalysis(
         specestMethod = MultiTaperFFTConvol(
             soi,
             postSelect,
-            equidistant=equidistant,
             toi=toi,
             foi=foi,
             timeAxis=timeAxis,
             keeptapers=keeptapers,
             polyremoval=polyremoval,
+            pre_stages=pre_stages,
             output=output,
             method_kwargs=method_kwargs,
         )
@@ -827,6 +814,12 @@ def freqanalysis(
         if wavelet not in availableWavelets:
             lgl = "'" + "or '".join(opt + "' " for opt in availableWavelets)
             raise SPYValueError(legal=lgl, varname="wavelet", actual=wavelet)
+        if cwt_domain not in availableDomains:
+            lgl = "'" + "or '".join(opt + "' " for opt in availableDomains)
+            raise SPYValueError(legal=lgl, varname="cwt_domain", actual=cwt_domain)
+        if cwt_domain == "frequency" and wavelet != "Morlet":
+            lgl = "'time' or 'auto' for wavelets other than 'Morlet'"
+            raise SPYValueError(legal=lgl, varname="cwt_domain", actual=cwt_domain)
         if wavelet not in ["Morlet", "Paul"]:
             msg = (
                 "the chosen wavelet '{}' is real-valued and does not provide "
@@ -882,18 +875,25 @@ def freqanalysis(
             foi[foi < 0.01] = 0.01
             scales = wfun.scale_from_period(1 / foi)
 
+        # decide once for all trials (and blocks of scales) which domain is faster
+        if cwt_domain == "auto":
+            useFreq = use_frequency_domain(wfun, scales, int(lenTrials.max()), dt)
+            cwt_domain = "frequency" if useFreq else "time"
+
         # Update `log_dct` w/method-specific options (use `lcls` to get actually
         # provided keyword values, not defaults set in here)
         log_dct["foi"] = foi
         log_dct["wavelet"] = lcls["wavelet"]
         log_dct["width"] = lcls["width"]
         log_dct["order"] = lcls["order"]
+        log_dct["cwt_domain"] = lcls["cwt_domain"]
 
         # method specific parameters
         method_kwargs = {
             "samplerate": data.samplerate,
             "scales": scales,
             "wavelet": wfun,
+            "cwt_domain": cwt_domain,
         }
 
         # Set up compute-class
@@ -903,6 +903,7 @@ def freqanalysis(
             toi=toi,
             timeAxis=timeAxis,
             polyremoval=polyremoval,
+            pre_stages=pre_stages,
             output=output,
             method_kwargs=method_kwargs,
         )
@@ -971,6 +972,7 @@ def freqanalysis(
             toi=toi,
             timeAxis=timeAxis,
             polyremoval=polyremoval,
+            pre_stages=pre_stages,
             output=output,
             method_kwargs=method_kwargs,
         )
@@ -5,13 +5,17 @@
 
 # Builtin/3rd party package imports
 import numpy as np
+import scipy.fft as sci_fft
+from numpy.lib.stride_tricks import sliding_window_view
 import logging
 import platform
-from scipy import signal
 
 # local imports
-from .stft import stft
-from ._norm_spec import _norm_taper
+from ._norm_spec import _norm_spec
+from .taper_cache import get_tapers
+
+# maximal size (bytes) of the tapered segments transformed at once
+segment_chunk_bytes = 16 * 1024**2
 
 
 def mtmconvol(
@@ -24,6 +28,7 @@ def mtmconvol(
     boundary="zeros",
     padded=True,
     detrend=False,
+    centers=None,
 ):
 
     """
@@ -59,6 +64,15 @@ def mtmconvol(
     padded : bool
         Additional padding in case ``noverlap != nperseg - 1`` to fit an integer number
         of windows.
+    detrend : str or `False`
+        Optional detrending of the individual segments, either
+        `'constant'` or `'linear'`, see :func:`scipy.signal.detrend`
+    centers : 1D :class:`numpy.ndarray` of int or None
+        Sparse evaluation: sample indices to center the windows on, only these
+        windows get transformed. The signal is zero padded as for
+        ``boundary='zeros'``, windows centered outside of the signal are
+        zero padded accordingly. `noverlap`, `boundary` and `padded` are
+        ignored. If `None`, the full sliding window transform is computed.
 
     Returns
     -------
@@ -70,6 +84,12 @@ def mtmconvol(
 
     Notes
     -----
+    The signal gets framed into overlapping segments only once, as a
+    strided view without copying. The segments are multiplied with all
+    tapers at once and transformed with a single batched real FFT. Detrending
+    and tapering happens in chunks of segments of at most :data:`segment_chunk_bytes` to bound the
+    memory footprint for long trials.
+
     For a (MTM) power spectral estimate average the absolute squared
     transforms across tapers:
 
@@ -95,11 +115,6 @@ def mtmconvol(
     # frequency bins
     dFreq = freqs[1] - freqs[0]
 
-    if taper is None:
-        taper = "boxcar"
-
-    taper_func = getattr(signal.windows, taper)
-
     if taper_opt is None:
         taper_opt = {}
 
@@ -110,14 +125,13 @@ def mtmconvol(
     if taper == "dpss":
         taper_opt["sym"] = False
 
-    # only truly 2d for multi-taper "dpss"
-    windows = np.atleast_2d(taper_func(nperseg, **taper_opt))
-
-    # normalize window(s)
-    windows = _norm_taper(taper, windows, nperseg)
+    # only truly 2d for multi-taper "dpss", normalized window(s)
+    windows = get_tapers(taper, nperseg, taper_opt)
 
     # number of time points in the output
-    if boundary is None:
+    if centers is not None:
+        nTime = len(centers)
+    elif boundary is None:
         # no padding: we loose half the window on each side
         nTime = int(np.ceil(nSamples / (nperseg - noverlap))) - nperseg
     else:
@@ -133,20 +147,66 @@ def mtmconvol(
         f"Running mtmconvol on {len(windows)} windows, data chunk has {nSamples} samples and {nChannels} channels."
     )
 
-    for taperIdx, win in enumerate(windows):
-        # ftr has shape (nFreq, nChannels, nTime)
-        pxx, _, _ = stft(
-            data_arr,
-            samplerate,
-            window=win,
-            nperseg=nperseg,
-            noverlap=noverlap,
-            boundary=boundary,
-            padded=padded,
-            axis=0,
-            detrend=detrend,
-        )
-
-        ftr[:, taperIdx, ...] = pxx.transpose(2, 0, 1)[:nTime, ...]
+    # strided view of all segments (nSegments x nChannels x nperseg)
+    if centers is not None:
+        # centers outside of the signal give (partially) zero padded windows,
+        # beyond one window length these are all zeros
+        centers = np.clip(np.asarray(centers, dtype=np.intp), -nperseg, nSamples + nperseg - 1)
+        # window k of the unit step view is centered on sample k - nperseg,
+        # fancy indexing copies only the requested windows
+        nfront = nperseg // 2 + nperseg
+        padded_arr = np.pad(data_arr, ((nfront, 2 * nperseg - nperseg // 2), (0, 0)))
+        segments = _segment_view(padded_arr, nperseg, nperseg - 1, None, False)[centers + nperseg]
+    else:
+        segments = _segment_view(data_arr, nperseg, noverlap, boundary, padded)[:nTime]
+
+    # centered sample times for the least squares slopes
+    tc = np.arange(nperseg) - (nperseg - 1) / 2
+
+    # tapered segments of one chunk are (nChunk x nTapers x nChannels x nperseg)
+    chunk = max(1, segment_chunk_bytes // (windows.shape[0] * nChannels * nperseg * 8))
+    for start in range(0, segments.shape[0], chunk):
+        stop = start + chunk
+        dat = segments[start:stop]
+        # detrending copies the segments of this chunk, once for all tapers
+        if detrend in ("constant", "linear"):
+            trend = dat.mean(axis=-1, keepdims=True)
+            if detrend == "linear":
+                trend = trend + (dat @ tc / (tc @ tc))[..., np.newaxis] * tc
+            dat = dat - trend
+        # apply the whole taper bank by broadcasting
+        pxx = sci_fft.rfft(dat[:, np.newaxis, ...] * windows[:, np.newaxis, :], axis=-1, overwrite_x=True)
+        # normalization to power -> squared amplitude / 2
+        pxx = _norm_spec(pxx, nperseg, samplerate)
+        ftr[start:stop] = pxx.transpose(0, 1, 3, 2)
 
     return ftr, freqs
+
+
+def _segment_view(data_arr, nperseg, noverlap, boundary, padded):
+    """
+    Frames the (nSamples x nChannels) `data_arr` into overlapping segments,
+    padding as :func:`~syncopy.specest.stft.stft` does
+
+    Returns
+    -------
+    segments : (nSegments, nChannels, nperseg) :class:`numpy.ndarray`
+        Read-only strided view into the (padded) data
+    """
+
+    if noverlap is None:
+        noverlap = nperseg // 2
+    nstep = nperseg - noverlap
+
+    # extend along time axis to fit in
+    # sliding windows at the edges
+    nfront = nperseg // 2 if boundary is not None else 0
+    nback = nfront
+    if padded:
+        # pad to integer number of windowed segments
+        nadd = (-(data_arr.shape[0] + 2 * nfront - nperseg) % nstep) % nperseg
+        nback += nadd
+    if nfront or nback:
+        data_arr = np.pad(data_arr, ((nfront, nback), (0, 0)))
+
+    return sliding_window_view(data_arr, nperseg, axis=0)[::nstep]
@@ -5,12 +5,13 @@
 
 # Builtin/3rd party package imports
 import numpy as np
-from scipy import signal
+import scipy.fft as sci_fft
 import logging
 import platform
 
 # local imports
-from ._norm_spec import _norm_spec, _norm_taper
+from ._norm_spec import _norm_spec
+from .taper_cache import get_tapers
 
 
 def mtmfft(
@@ -21,6 +22,8 @@ def mtmfft(
     taper_opt=None,
     demean_taper=False,
     ft_compat=False,
+    workers=None,
+    single_precision=False,
 ):
     """
     (Multi-)tapered fast Fourier transform. Returns
@@ -51,6 +54,12 @@ def mtmfft(
     ft_compat : bool
         Set to `True` to use Field Trip's normalization,
         which is NOT independent of the padding size
+    workers : int or None
+        Number of threads used by :func:`scipy.fft.rfft`,
+        `None` defaults to a single thread
+    single_precision : bool
+        Set to `True` to taper and transform in single precision,
+        trades accuracy for speed and memory
 
     Returns
     -------
@@ -84,47 +93,38 @@ def mtmfft(
     nChannels = data_arr.shape[1]
 
     freqs = np.fft.rfftfreq(nSamples, 1 / samplerate)
-    nFreq = freqs.size
 
-    # no taper is boxcar
-    if taper is None:
-        taper = "boxcar"
-
-    if taper_opt is None:
-        taper_opt = {}
-
-    taper_func = getattr(signal.windows, taper)
     # only really 2d if taper='dpss' with Kmax > 1
-    # here we take the actual signal lengths!
-    windows = np.atleast_2d(taper_func(signal_length, **taper_opt))
-    # normalize window with total (after padding) length
-    windows = _norm_taper(taper, windows, nSamples)
-
-    # Fourier transforms (nTapers x nFreq x nChannels)
-    ftr = np.zeros((windows.shape[0], nFreq, nChannels), dtype="complex64")
+    # here we take the actual signal lengths, but
+    # normalize with total (after padding) length
+    windows = get_tapers(taper, signal_length, taper_opt, nSamples)
 
     logger = logging.getLogger("syncopy_" + platform.node())
     logger.debug(
         f"Running mtmfft on {len(windows)} windows, data chunk has {nSamples} samples and {nChannels} channels."
     )
 
-    for taperIdx, win in enumerate(windows):
-        win = np.tile(win, (nChannels, 1)).T
-        win *= data_arr
-        # de-mean again after tapering - needed for Granger!
-        if demean_taper:
-            win -= win.mean(axis=0)
-        ftr[taperIdx] = np.fft.rfft(win, n=nSamples, axis=0)
-        # FT uses potentially padded length `nSamples`, which dilutes the power
-        if ft_compat:
-            ftr[taperIdx] = _norm_spec(ftr[taperIdx], nSamples, samplerate)
-        # here the normalization adapts such that padding is NOT changing power
-        else:
-            ftr[taperIdx] = _norm_spec(
-                ftr[taperIdx],
-                signal_length * np.sqrt(nSamples / signal_length),
-                samplerate,
-            )
+    if single_precision:
+        windows = windows.astype(np.float32)
+        data_arr = data_arr.astype(np.float32, copy=False)
+
+    # taper all channels with all windows at once
+    # has shape (nTapers x signal_length x nChannels)
+    tapered = windows[:, :, np.newaxis] * data_arr
+    # de-mean again after tapering - needed for Granger!
+    if demean_taper:
+        tapered -= tapered.mean(axis=1, keepdims=True)
+
+    # Fourier transforms (nTapers x nFreq x nChannels)
+    ftr = sci_fft.rfft(tapered, n=nSamples, axis=1, workers=workers)
+    ftr = ftr.astype("complex64", copy=False)
+
+    # FT uses potentially padded length `nSamples`, which dilutes the power
+    if ft_compat:
+        ftr = _norm_spec(ftr, nSamples, samplerate)
+    # here the normalization adapts such that padding is NOT changing power
+    else:
+        ftr = _norm_spec(ftr, signal_length * np.sqrt(nSamples / signal_length), samplerate)
 
     return ftr, freqs
 
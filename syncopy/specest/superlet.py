@@ -9,8 +9,16 @@
 import numpy as np
 import logging
 import platform
+import threading
+from collections import OrderedDict
+import scipy.fft as sci_fft
 from scipy.signal import fftconvolve
 
+# Maximal total size (bytes) of the wavelet spectra kept per process and
+# the maximal length of a single spectrum, longer ones get computed on the fly
+kernel_cache_bytes = 64 * 1024**2
+kernel_cache_max_length = 2**15
+
 
 def superlet(
     data_arr,
@@ -105,7 +113,57 @@ def superlet(
     return gmean_spec
 
 
-def multiplicativeSLT(data_arr, samplerate, scales, order_max, order_min=1, c_1=3):
+def superlet_blocks(
+    data_arr,
+    samplerate,
+    scales,
+    order_max,
+    order_min=1,
+    c_1=3,
+    adaptive=False,
+    block_size=None,
+):
+
+    """
+    Superlet transform computed in blocks of `block_size` scales,
+    see :func:`superlet` for the parameters.
+
+    Only the transform of one block is held in memory at a time,
+    which can be reduced (e.g. to power at the time points of
+    interest) by the caller before the next block gets computed.
+    With more than one block, all scales use the same padded
+    length, such that only a single spectrum of the data is kept.
+
+    Yields
+    ------
+    blk : slice
+        The scales of the current block
+    gmean_spec : :class:`numpy.ndarray`
+        Complex time-frequency representation of the block with
+        shape ``(nScalesBlock,) + data_arr.shape``
+    """
+
+    nScales = len(scales)
+    if block_size is None or block_size >= nScales:
+        yield slice(0, nScales), superlet(data_arr, samplerate, scales, order_max, order_min, c_1, adaptive)
+        return
+
+    dt = 1 / samplerate
+    nFFT = _fft_length(data_arr.shape[0], scales.max(), c_1 * order_max, dt)
+    spectra = {}
+
+    for start in range(0, nScales, block_size):
+        blk = slice(start, min(start + block_size, nScales))
+        if adaptive:
+            gmean_spec = FASLT(data_arr, samplerate, scales, order_max, order_min, c_1, blk, spectra, nFFT)
+        else:
+            gmean_spec = multiplicativeSLT(
+                data_arr, samplerate, scales[blk], order_max, order_min, c_1, spectra, nFFT
+            )
+        yield blk, gmean_spec
+
+
+def multiplicativeSLT(data_arr, samplerate, scales, order_max, order_min=1, c_1=3, spectra=None, nFFT=None):
 
     dt = 1 / samplerate
     # create the complete multiplicative set spanning
@@ -114,19 +172,23 @@ def multiplicativeSLT(data_arr, samplerate, scales, order_max, order_min=1, c_1=
     order_num = order_max + 1 - order_min  # number of different orders
     SL = [MorletSL(c) for c in cycles]
 
+    # the data gets transformed only once for all orders
+    if spectra is None:
+        spectra = {}
+
     # lowest order
-    gmean_spec = cwtSL(data_arr, SL[0], scales, dt)
+    gmean_spec = cwtSL_fft(data_arr, SL[0], scales, dt, spectra, nFFT)
     gmean_spec = np.power(gmean_spec, 1 / order_num)
 
     for wavelet in SL[1:]:
 
-        spec = cwtSL(data_arr, wavelet, scales, dt)
+        spec = cwtSL_fft(data_arr, wavelet, scales, dt, spectra, nFFT)
         gmean_spec *= np.power(spec, 1 / order_num)
 
     return gmean_spec
 
 
-def FASLT(data_arr, samplerate, scales, order_max, order_min=1, c_1=3):
+def FASLT(data_arr, samplerate, scales, order_max, order_min=1, c_1=3, block=None, spectra=None, nFFT=None):
 
     """Fractional adaptive SL transform
 
@@ -135,6 +197,9 @@ def FASLT(data_arr, samplerate, scales, order_max, order_min=1, c_1=3):
 
     R(o_f) = R_1 * R_2 * ... * R_i * R_i+1 ** alpha
     with o_f = o_i + alpha
+
+    The orders depend on all `scales`, a `block` (slice)
+    restricts the computation to a subset of them.
     """
 
     dt = 1 / samplerate
@@ -163,11 +228,18 @@ def FASLT(data_arr, samplerate, scales, order_max, order_min=1, c_1=3):
     # the fractions
     alphas = orders % orders_int
 
+    # the data gets transformed only once for all orders
+    if spectra is None:
+        spectra = {}
+
+    # first and last scale index of the block
+    b0, b1, _ = (block or slice(None)).indices(len(scales))
+
     # 1st order
     # lowest order is needed for all scales/frequencies
-    gmean_spec = cwtSL(data_arr, SL[0], scales, dt)  # 1st order <-> order_min
+    gmean_spec = cwtSL_fft(data_arr, SL[0], scales[b0:b1], dt, spectra, nFFT)  # 1st order <-> order_min
     # Geometric normalization according to scale dependent order
-    gmean_spec = np.power(gmean_spec.T, exponents).T
+    gmean_spec = np.power(gmean_spec.T, exponents[b0:b1]).T
 
     # we go to the next scale and order in any case..
     # but for order_max == 1 for which order_jumps is empty
@@ -175,22 +247,25 @@ def FASLT(data_arr, samplerate, scales, order_max, order_min=1, c_1=3):
 
     for i, jump in enumerate(order_jumps):
 
-        # relevant scales for the next order
-        scales_o = scales[last_jump:]
-        # order + 1 spec
-        next_spec = cwtSL(data_arr, SL[i + 1], scales_o, dt)
-
-        # which fractions for the current next_spec
-        # in the interval [order, order+1)
-        scale_span = slice(last_jump, jump + 1)
-        gmean_spec[scale_span, :] *= np.power(
-            next_spec[: jump - last_jump + 1].T,
-            alphas[scale_span] * exponents[scale_span],
-        ).T
-
-        # multiply non-fractional next_spec for
-        # all remaining scales/frequencies
-        gmean_spec[jump + 1 :] *= np.power(next_spec[jump - last_jump + 1 :].T, exponents[jump + 1 :]).T
+        # relevant scales for the next order within the block
+        first = max(last_jump, b0)
+        if first < b1:
+            # order + 1 spec
+            next_spec = cwtSL_fft(data_arr, SL[i + 1], scales[first:b1], dt, spectra, nFFT)
+
+            # which fractions for the current next_spec
+            # in the interval [order, order+1)
+            nFrac = max(0, min(jump + 1, b1) - first)
+            scale_span = slice(first, first + nFrac)
+            gmean_spec[first - b0 : first - b0 + nFrac] *= np.power(
+                next_spec[:nFrac].T,
+                alphas[scale_span] * exponents[scale_span],
+            ).T
+
+            # multiply non-fractional next_spec for
+            # all remaining scales/frequencies
+            rest = max(jump + 1, first)
+            gmean_spec[rest - b0 :] *= np.power(next_spec[rest - first :].T, exponents[rest:b1]).T
 
         # go to the next [order, order+1) interval
         last_jump = jump + 1
@@ -365,6 +440,202 @@ def cwtSL(data, wavelet, scales, dt):
     return output
 
 
+def cwtSL_fft(data, wavelet, scales, dt, spectra=None, nFFT=None):
+
+    """
+    Frequency domain version of :func:`cwtSL`, the results
+    are identical up to floating point precision.
+
+    Instead of one `fftconvolve` per scale, which transforms
+    the data again every time, the data gets transformed once
+    per padded length (see :func:`_fft_length`), and the
+    spectra can be re-used for all wavelets of a superlet set
+    via `spectra`. The wavelet spectra are kept in a process-local
+    LRU cache, such that trials of similar length analyzed with the
+    same scales only sample and transform the wavelets once.
+    All scales sharing a padded length are transformed back
+    with a single batched inverse FFT.
+
+    Parameters
+    ----------
+    data : :class:`numpy.ndarray`
+        Uniformly sampled time-series data
+        The 1st dimension is interpreted as the time axis
+    wavelet : :class:`MorletSL`
+        The superlet Morlet wavelet
+    scales : 1D :class:`numpy.ndarray`
+        Set of scales to use in wavelet transform.
+    dt : float
+        Sampling interval of the data
+    spectra : dict or None
+        Spectra of `data` keyed by the padded length, gets
+        filled on the fly. Pass the same dict for all wavelets
+        of a superlet set to transform the data only once.
+    nFFT : int or None
+        Padded length used for all scales, has to be at least the
+        :func:`_fft_length` of the largest wavelet. If `None` every
+        scale uses its own length class.
+
+    Returns
+    -------
+    output : :class:`numpy.ndarray`
+        Complex wavelet transform with shape
+        ``(len(scales),) + data.shape``
+    """
+
+    # this checks if really a Superlet Wavelet is being used
+    if not isinstance(wavelet, MorletSL):
+        raise ValueError("Wavelet is not of MorletSL type!")
+
+    if spectra is None:
+        spectra = {}
+
+    nSamples = data.shape[0]
+    output = np.empty((len(scales),) + data.shape, dtype=np.complex64)
+    if nFFT is None:
+        lengths = np.array([_fft_length(nSamples, scale, wavelet.c_i, dt) for scale in scales])
+    else:
+        lengths = np.full(len(scales), nFFT)
+
+    for nFFT in np.unique(lengths).tolist():
+        sidx = np.flatnonzero(lengths == nFFT)
+        if nFFT not in spectra:
+            spectra[nFFT] = _data_spectrum(data, nFFT)
+        data_fft = spectra[nFFT]
+
+        kernels = np.stack(
+            [
+                _kernel_spectrum(float(scales[idx]), wavelet.c_i, wavelet.k_sd, dt, nFFT)
+                for idx in sidx
+            ]
+        )
+        # broadcast over the non-time axes of the data
+        kernels = kernels.reshape((len(sidx),) + (1,) * (data_fft.ndim - 1) + (nFFT,))
+
+        res = sci_fft.ifft(kernels * data_fft[None], axis=-1, overwrite_x=True)
+        # move time back to the 2nd axis
+        output[sidx] = np.moveaxis(res[..., :nSamples], -1, 1)
+
+    return output
+
+
+def _fft_length(nSamples, scale, cycles, dt):
+
+    """
+    FFT length required to compute the 'same' mode convolution
+    with a wavelet without wrap around. Wavelets get truncated
+    to +-nSamples around their center, hence the length never
+    exceeds ``2 * nSamples - 1``. The lengths get rounded up to
+    one of 5 classes between `nSamples` and ``2 * nSamples``, such
+    that the data has to be transformed only a few times.
+    """
+
+    M = _get_superlet_support(scale, dt, cycles).size
+    reach = min(M - (M - 1) // 2, nSamples)
+
+    quarters = int(np.ceil(4 * (reach - 1) / nSamples))
+
+    return sci_fft.next_fast_len(nSamples + max(reach - 1, quarters * nSamples // 4))
+
+
+def _data_spectrum(data, nFFT):
+
+    """
+    Spectrum of the zero-padded data, the time axis (1st axis)
+    becomes the last axis for efficient batched transforms.
+    """
+
+    return sci_fft.fft(np.moveaxis(data, 0, -1), n=nFFT, axis=-1)
+
+
+def _compute_kernel_spectrum(scale, c_i, k_sd, dt, nFFT):
+
+    """
+    Spectrum of the normalized wavelet, shifted such that the
+    first `nSamples` of the circular convolution are the
+    'same' mode convolution of :func:`cwtSL` for all signals
+    this padded length gets used for (see :func:`_fft_length`).
+    """
+
+    t = _get_superlet_support(scale, dt, c_i)
+    # center of the wavelet, as in 'same' mode of `fftconvolve`
+    offset = (t.size - 1) // 2
+
+    # only the wavelet samples within half the padded length around
+    # its center, the remaining ones never reach the first `nSamples`
+    lo = max(0, offset - (nFFT - 1) // 2)
+    hi = min(t.size, offset + nFFT // 2 + 1)
+
+    norm = dt**0.5 / (4 * np.pi)
+    kernel = np.zeros(nFFT, dtype=np.complex128)
+    kernel[: hi - lo] = norm * MorletSL(c_i, k_sd)(t[lo:hi], scale)
+
+    spectrum = sci_fft.fft(np.roll(kernel, lo - offset))
+    spectrum.flags.writeable = False
+
+    return spectrum
+
+
+# process-local LRU cache of the wavelet spectra, bounded by `kernel_cache_bytes`
+_kernel_cache = OrderedDict()
+_kernel_cache_stats = {"hits": 0, "misses": 0, "nbytes": 0}
+_kernel_cache_lock = threading.Lock()
+
+
+def _kernel_spectrum(scale, c_i, k_sd, dt, nFFT):
+
+    # don't fill the cache with the spectra for very long signals
+    if nFFT > kernel_cache_max_length:
+        return _compute_kernel_spectrum(scale, c_i, k_sd, dt, nFFT)
+
+    key = (scale, c_i, k_sd, dt, nFFT)
+    with _kernel_cache_lock:
+        if key in _kernel_cache:
+            _kernel_cache.move_to_end(key)
+            _kernel_cache_stats["hits"] += 1
+            return _kernel_cache[key]
+        _kernel_cache_stats["misses"] += 1
+
+    spectrum = _compute_kernel_spectrum(scale, c_i, k_sd, dt, nFFT)
+
+    with _kernel_cache_lock:
+        if key not in _kernel_cache:
+            _kernel_cache[key] = spectrum
+            _kernel_cache_stats["nbytes"] += spectrum.nbytes
+        # evict the least recently used spectra
+        while _kernel_cache and _kernel_cache_stats["nbytes"] > kernel_cache_bytes:
+            _, evicted = _kernel_cache.popitem(last=False)
+            _kernel_cache_stats["nbytes"] -= evicted.nbytes
+
+    return spectrum
+
+
+def kernel_cache_info():
+    """
+    Hit and miss statistics of the process-local cache
+    of wavelet spectra used by :func:`cwtSL_fft`
+
+    Returns
+    -------
+    info : dict
+        With keys `'hits'`, `'misses'`, `'currsize'` (number of spectra),
+        `'nbytes'` and `'maxbytes'`
+    """
+
+    with _kernel_cache_lock:
+        return {**_kernel_cache_stats, "currsize": len(_kernel_cache), "maxbytes": kernel_cache_bytes}
+
+
+def clear_kernel_cache():
+    """
+    Empties the process-local wavelet spectra cache and resets its statistics
+    """
+
+    with _kernel_cache_lock:
+        _kernel_cache.clear()
+        _kernel_cache_stats.update(hits=0, misses=0, nbytes=0)
+
+
 def _get_superlet_support(scale, dt, cycles):
 
     """
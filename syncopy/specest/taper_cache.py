@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# Process-local cache for (normalized) taper banks
+#
+
+# Builtin/3rd party package imports
+from functools import lru_cache
+import numpy as np
+from scipy import signal
+
+# local imports
+from ._norm_spec import _norm_taper
+
+# Maximal number of different taper banks kept per process
+taper_cache_size = 32
+
+
+def get_tapers(taper, length, taper_opt=None, nSamples=None):
+    """
+    Returns the normalized taper bank for a given window configuration,
+    either freshly computed or from the process-local LRU cache.
+
+    Trials of equal length analyzed with the same taper settings
+    all use identical windows, hence these get only computed once
+    per process (e.g. once per dask worker).
+
+    Parameters
+    ----------
+    taper : str or None
+        Taper function to use, one of `scipy.signal.windows`
+        Set to `None` for no tapering (boxcar).
+    length : int
+        Length of the windows in samples
+    taper_opt : dict or None
+        Additional keyword arguments passed to the `taper` function
+    nSamples : int or None
+        Length used for the taper normalization, `None`
+        defaults to `length`
+
+    Returns
+    -------
+    windows : (nTapers, length) :class:`numpy.ndarray`
+        The normalized tapers, the array is read-only
+        as it is shared between all callers!
+    """
+
+    if taper is None:
+        taper = "boxcar"
+    if taper_opt is None:
+        taper_opt = {}
+    if nSamples is None:
+        nSamples = length
+
+    opt_key = tuple(sorted(taper_opt.items()))
+    try:
+        hash(opt_key)
+    except TypeError:
+        # unhashable taper options, can't be cached
+        return _compute_tapers(taper, int(length), opt_key, int(nSamples))
+
+    return _cached_tapers(taper, int(length), opt_key, int(nSamples))
+
+
+def taper_cache_info():
+    """
+    Hit and miss statistics of the process-local taper cache.
+
+    To inspect the caches of all workers of a dask cluster use
+    ``client.run(taper_cache_info)``.
+
+    Returns
+    -------
+    info : dict
+        With keys `'hits'`, `'misses'`, `'maxsize'` and `'currsize'`
+    """
+
+    return _cached_tapers.cache_info()._asdict()
+
+
+def clear_taper_cache():
+    """
+    Empties the process-local taper cache and resets its statistics
+    """
+
+    _cached_tapers.cache_clear()
+
+
+def _compute_tapers(taper, length, opt_key, nSamples):
+
+    taper_func = getattr(signal.windows, taper)
+    # only really 2d if taper='dpss' with Kmax > 1
+    windows = np.atleast_2d(taper_func(length, **dict(opt_key)))
+    # normalize window with total (after padding) length
+    windows = _norm_taper(taper, windows, nSamples)
+    windows.flags.writeable = False
+
+    return windows
+
+
+_cached_tapers = lru_cache(maxsize=taper_cache_size)(_compute_tapers)
@@ -9,10 +9,13 @@ import logging
 import platform
 
 # Local imports
-from syncopy.specest.wavelets import cwt
+from syncopy.specest.wavelets import cwt, Morlet
 
+# available convolution domains of the wavelet transform
+availableDomains = ("auto", "time", "frequency")
 
-def wavelet(data_arr, samplerate, scales, wavelet):
+
+def wavelet(data_arr, samplerate, scales, wavelet, cwt_domain="time"):
 
     """
     Perform time-frequency analysis on multi-channel time series data
@@ -31,6 +34,13 @@ def wavelet(data_arr, samplerate, scales, wavelet):
     wavelet : callable
         Wavelet function to use, one of
         :data:`~syncopy.specest.const_def.availableWavelets`
+    cwt_domain : str
+        Either `'time'` or `'frequency'`. Convolve in the time
+        domain (one `fftconvolve` per scale) or in the frequency domain
+        (one FFT of the data, analytic wavelet spectra and batched inverse
+        FFTs), the latter is only available for the Morlet wavelet.
+        Both give the same result, see :func:`use_frequency_domain`
+        to choose the faster one.
 
     Returns
     -------
@@ -44,11 +54,59 @@ def wavelet(data_arr, samplerate, scales, wavelet):
         f"Running wavelet transform on data with shape {data_arr.shape} and samplerate {samplerate}."
     )
 
-    spec = cwt(data_arr, wavelet=wavelet, widths=scales, dt=1 / samplerate, axis=0)
+    dt = 1 / samplerate
+    spec = cwt(
+        data_arr,
+        wavelet=wavelet,
+        widths=scales,
+        dt=dt,
+        frequency=cwt_domain == "frequency",
+        axis=0,
+    )
 
     return spec
 
 
+def use_frequency_domain(wavelet, scales, nSamples, dt):
+    """
+    Heuristic to choose between the time and the frequency domain
+    wavelet transform, based on the number of scales and the signal length
+
+    Parameters
+    ----------
+    wavelet : callable
+        Wavelet function to use
+    scales : 1D :class:`numpy.ndarray`
+        Set of scales to use in wavelet transform.
+    nSamples : int
+        Length of the signal
+    dt : float
+        Sampling interval of the signal
+
+    Returns
+    -------
+    frequency : bool
+        `True` if the frequency domain transform is expected to be faster
+    """
+
+    # the analytic spectrum of the Morlet neglects the
+    # correction term, hence requires a sufficiently large w0
+    if not isinstance(wavelet, Morlet) or wavelet.w0 < 5:
+        return False
+
+    scales = np.asarray(scales)
+    # the time domain transforms the data forth and back for every
+    # scale, at the convolution length of the respective wavelet
+    nConv = nSamples + 10 * scales / dt
+    costTime = np.sum(2 * nConv * np.log2(nConv))
+    # the frequency domain transforms once and back for every scale,
+    # at the padded length of the largest wavelet
+    nPad = nSamples + 5 * scales.max() / dt
+    costFreq = (scales.size + 1) * nPad * np.log2(nPad)
+
+    return costFreq < costTime
+
+
 def get_optimal_wavelet_scales(scale_from_period, nSamples, dt, dj=0.25, s0=None):
     """
     Local helper to compute an "optimally spaced" set of scales for wavelet analysis
@@ -2,6 +2,7 @@ from __future__ import division
 
 import numpy as np
 import scipy
+import scipy.fft
 import scipy.signal
 import scipy.optimize
 import scipy.special
@@ -10,6 +11,9 @@ from .wavelets import Morlet
 
 __all__ = ["cwt", "WaveletAnalysis", "WaveletTransform"]
 
+# size (bytes) of the complex buffers transformed at once by `cwt_freq`
+cwt_freq_batch_bytes = 4 * 1024**2
+
 
 def cwt(data, wavelet=None, widths=None, dt=1, frequency=False, axis=-1):
     """Continuous wavelet transform using the Fourier transform
@@ -94,10 +98,7 @@ def cwt_time(data, wavelet, widths, dt, axis):
     slices[axis] = slice(None)
     slices = tuple(slices)
     for ind, width in enumerate(widths):
-        # number of points needed to capture wavelet
-        M = 10 * width / dt
-        # times to use, centred at zero
-        t = np.arange((-M + 1) / 2.0, (M + 1) / 2.0) * dt
+        t = _wavelet_times(width, dt)
         # sample wavelet and normalise to harmonic amplitude
         norm = dt**0.5 / (width * 8 * np.pi)
         wavelet_data = norm * wavelet(t, width)
@@ -109,38 +110,51 @@ def cwt_time(data, wavelet, widths, dt, axis):
 
 
 def cwt_freq(data, wavelet, widths, dt, axis):
-    # compute in frequency
-    # next highest power of two for padding
-    N = data.shape[axis]
-    pN = int(2 ** np.ceil(np.log2(N)))
-    # N.B. padding in fft adds zeros to the *end* of the array,
-    # not equally either end.
-    fft_data = scipy.fft(data, n=pN, axis=axis)
-    # frequencies
+    # compute in frequency: one forward FFT of the data, the
+    # wavelet spectra get sampled analytically and batches of
+    # widths are transformed back with a single inverse FFT
+    frequency = getattr(wavelet, "frequency", wavelet)
+    widths = np.asarray(widths)
+
+    # time becomes the last axis for efficient batched transforms
+    data = np.moveaxis(data, axis, -1)
+    N = data.shape[-1]
+    # zero-pad such that the largest wavelet (the time domain
+    # support is +-5 widths, see `cwt_time`) does not wrap around
+    reach = int(np.ceil(5 * widths.max() / dt))
+    pN = scipy.fft.next_fast_len(N + reach)
+    fft_data = scipy.fft.fft(data, n=pN, axis=-1)
+    # angular frequencies
     w_k = np.fft.fftfreq(pN, d=dt) * 2 * np.pi
 
-    # sample wavelet and normalise
-    norm = (2 * np.pi * widths / dt) ** 0.5
-    wavelet_data = norm[:, None] * wavelet(w_k, widths[:, None])
-
-    # Convert negative axis. Add one to account for
-    # inclusion of widths axis above.
-    axis = (axis % data.ndim) + 1
-
-    # perform the convolution in frequency space
-    slices = [slice(None)] + [None for _ in data.shape]
-    slices[axis] = slice(None)
-
-    out = scipy.ifft(fft_data[None] * wavelet_data.conj()[slices], n=pN, axis=axis)
-
-    # remove zero padding
-    slices = [slice(None) for _ in out.shape]
-    slices[axis] = slice(None, N)
-
-    if data.ndim == 1:
-        return out[slices].squeeze()
-    else:
-        return out[slices]
+    # sample wavelet spectra and normalise to harmonic amplitude,
+    # consistent with the sampled wavelets of `cwt_time`
+    norm = (2 * np.pi / dt) ** 0.5 / (8 * np.pi)
+    wavelet_data = norm * frequency(w_k, widths[:, None])
+    # `cwt_time` samples the wavelets off-center by a fraction of a sample,
+    # its sample (M - 1) // 2 ends up at lag zero: shift the spectra alike
+    shifts = np.array([t[(t.size - 1) // 2] for t in (_wavelet_times(width, dt) for width in widths)])
+    wavelet_data = wavelet_data * np.exp(1j * w_k * shifts[:, None])
+    wavelet_data = wavelet_data.reshape((len(widths),) + (1,) * (data.ndim - 1) + (pN,))
+
+    output = np.empty((len(widths),) + data.shape[:-1] + (N,), dtype=np.complex64)
+    # small batches keep the complex buffers in cache
+    batch = max(1, cwt_freq_batch_bytes // (fft_data.nbytes))
+    for start in range(0, len(widths), batch):
+        stop = start + batch
+        out = scipy.fft.ifft(fft_data[None] * wavelet_data[start:stop], axis=-1, overwrite_x=True)
+        # remove zero padding
+        output[start:stop] = out[..., :N]
+
+    # move time back to its axis (add one to account for inclusion of widths axis)
+    return np.moveaxis(output, -1, (axis % data.ndim) + 1)
+
+
+def _wavelet_times(width, dt):
+    # number of points needed to capture wavelet
+    M = 10 * width / dt
+    # times to use, centred at zero
+    return np.arange((-M + 1) / 2.0, (M + 1) / 2.0) * dt
 
 
 class WaveletTransform(object):
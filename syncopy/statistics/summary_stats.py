@@ -325,7 +325,8 @@ def _trial_statistics(in_data, operation="mean"):
     computing. For this to work, the shapes of all trials have to match exactly.
 
     To be still memory safe, the computations stream new data on a trial-by-trial
-    basis and then 'manually' accumulate trial-by-trial to the result.
+    basis and then 'manually' accumulate trial-by-trial to the result. The next
+    trials get read in the background while the current one is accumulated.
     """
 
     # If no active selection is present, create a "fake" all-to-all selection
@@ -346,7 +347,7 @@ def _trial_statistics(in_data, operation="mean"):
     out_shape = in_data.selection.trials[idx0].shape
 
     # now look at the other ones
-    for trl in in_data.selection.trials:
+    for trl in in_data.selection.trials.prefetch():
         if trl.shape != out_shape:
             lgl = "all trials to have the same shape"
             act = f"found trials of different shape: {out_shape} and {trl.shape}"
@@ -419,7 +420,7 @@ def _trial_average(in_data, out_arr):
     """
 
     trials = in_data.selection.trials
-    for trl in trials:
+    for trl in trials.prefetch():
         out_arr += trl
 
     # normalize
@@ -446,7 +447,7 @@ def _trial_var(in_data, out_arr):
     average = _trial_average(in_data, average)
 
     trials = in_data.selection.trials
-    for trl in trials:
+    for trl in trials.prefetch():
         # absolute value for complex numbers
         out_arr += np.abs(trl - average) ** 2
 
@@ -471,7 +472,7 @@ def _trial_circ_average(in_data, out_arr):
     """
 
     trials = in_data.selection.trials
-    for trl in trials:
+    for trl in trials.prefetch():
         # add unit vectors on complex plane
         out_arr += trl / np.abs(trl)
 
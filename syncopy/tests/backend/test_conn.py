@@ -8,7 +8,13 @@ import matplotlib.pyplot as ppl
 from syncopy import synthdata
 from syncopy.connectivity import csd
 from syncopy.connectivity import ST_compRoutines as stCR
-from syncopy.connectivity.wilson_sf import wilson_sf, regularize_csd, max_rel_err
+from syncopy.connectivity.wilson_sf import (
+    wilson_sf,
+    wilson_sf_batch,
+    regularize_csd,
+    regularize_csd_batch,
+    max_rel_err,
+)
 from syncopy.connectivity.granger import granger
 
 
@@ -212,6 +218,57 @@ def test_wilson():
     ax.legend()
 
 
+def test_wilson_batch():
+    """
+    Stacked factorization of trial averaged CSDs with
+    individual convergence for every member of the batch.
+    """
+
+    fs = 200
+    nSamples = 500
+    nBatch = 4
+    nTrials = 30
+
+    CSDs = np.zeros((nBatch, nSamples // 2 + 1, 2, 2), dtype=np.complex128)
+    for idx in range(nBatch):
+        for trl in range(nTrials):
+            sol = synthdata.ar2_network(nSamples=nSamples, seed=idx * nTrials + trl, nTrials=None)
+            CSDs[idx] += csd.csd(sol, fs, norm=False)[0]
+    CSDs /= nTrials
+
+    H, Sigma, conv, err, nIters = wilson_sf_batch(CSDs, rtol=1e-6)
+    assert H.shape == CSDs.shape
+    assert Sigma.shape == (nBatch, 2, 2)
+    assert conv.shape == err.shape == nIters.shape == (nBatch,)
+
+    # every member gets the same result as when factorized alone
+    for idx in range(nBatch):
+        H1, Sigma1, conv1, err1 = wilson_sf(CSDs[idx], rtol=1e-6)
+        assert np.allclose(H[idx], H1)
+        assert np.allclose(Sigma[idx], Sigma1)
+        assert conv[idx] == conv1
+        assert err[idx] == err1
+
+    # converged members stop iterating early
+    assert np.all(nIters[conv] < 100)
+    assert np.all(err[conv] < 1e-6)
+
+    # a member which can't converge with only 1 iteration
+    # does not affect the others
+    H, Sigma, conv, err, nIters = wilson_sf_batch(CSDs, nIter=1, rtol=1e-6)
+    assert not np.any(conv)
+    assert np.all(nIters == 1)
+
+    # batched regularization matches the single CSD version
+    CSDs[0] += 1e3 * np.ones((2, 2))
+    CSDreg, eps, iniCN = regularize_csd_batch(CSDs, cond_max=1e2, eps_max=1e-1)
+    for idx in range(nBatch):
+        CSDreg1, eps1, iniCN1 = regularize_csd(CSDs[idx], cond_max=1e2, eps_max=1e-1)
+        assert np.allclose(CSDreg[idx], CSDreg1)
+        assert eps[idx] == eps1
+        assert iniCN[idx] == iniCN1
+
+
 def test_regularization():
 
     """
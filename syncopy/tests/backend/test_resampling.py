@@ -117,3 +117,55 @@ def trl_av_power(data, nSamples, fs, tapsmofrq=1):
     # trial averaging
     power = np.mean(power, axis=0)
     return power, freqs
+
+
+def test_filter_cache():
+
+    from syncopy.preproc import filter_cache
+
+    filter_cache.clear_filter_cache()
+
+    # identical designs get shared and are read-only
+    kernel = filter_cache.get_wsinc("hamming", 500, [0.1, 0.2], "bp")
+    assert kernel is filter_cache.get_wsinc("hamming", 500, np.array([0.1, 0.2]), "bp")
+    assert np.array_equal(kernel, firws.design_wsinc("hamming", 500, np.array([0.1, 0.2]), "bp"))
+    assert not kernel.flags.writeable
+    minphase = filter_cache.get_wsinc("hamming", 500, [0.1, 0.2], "bp", minphase=True)
+    assert np.allclose(minphase, firws.minphaserceps(kernel))
+
+    sos = filter_cache.get_butter_sos(4, 20, "lp", 1000)
+    assert np.array_equal(sos, sci_sig.butter(4, 20, "lp", fs=1000, output="sos"))
+    assert sos is filter_cache.get_butter_sos(4, 20.0, "lp", 1000.0)
+
+    info = filter_cache.filter_cache_info()
+    assert info["wsinc"]["misses"] == 2 and info["wsinc"]["hits"] == 1
+    assert info["butter"]["misses"] == 1 and info["butter"]["hits"] == 1
+
+    # the resampling filter of trials with equal settings is designed once
+    filter_cache.clear_filter_cache()
+    data = np.random.randn(3000, 2)
+    resampled = [resampling.resample(data, 1000, 300) for _ in range(5)]
+    info = filter_cache.filter_cache_info()
+    assert info["wsinc"]["misses"] == 1 and info["wsinc"]["hits"] == 4
+
+    # passing the pre-designed filter gives the same result
+    window = resampling.anti_alias_window(1000, 300, data.shape[0])
+    assert np.allclose(resampling.resample(data, 1000, 300, window=window), resampled[0])
+    filter_cache.clear_filter_cache()
+
+
+def test_resample_stream():
+
+    # block-wise resampling gives exactly the polyphase result
+    data = np.random.randn(5003, 2)
+    for orig_fs, new_fs in [(1000, 300), (1000, 750), (300, 1000), (24414, 1000)]:
+        up, down = resampling._get_updn(orig_fs, new_fs)
+        for window in [resampling.anti_alias_window(orig_fs, new_fs, data.shape[0], order=1000), ("kaiser", 5.0)]:
+            ref = sci_sig.resample_poly(data, up, down, window=window, axis=0)
+            for blockLen in [1, 123, 1000, 10000]:
+                blocks = resampling.resample_stream(
+                    lambda start, stop: data[start:stop], data.shape[0], up, down, window, blockLen
+                )
+                resampled = np.concatenate(list(blocks))
+                assert resampled.shape == ref.shape
+                assert np.allclose(resampled, ref)
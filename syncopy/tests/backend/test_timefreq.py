@@ -3,8 +3,10 @@ import matplotlib.pyplot as ppl
 from scipy.signal import windows
 
 from syncopy.specest import mtmfft
-from syncopy.specest import mtmconvol
+from syncopy.specest import mtmconvol, stft
 from syncopy.specest import superlet, wavelet
+from syncopy.specest import taper_cache
+from syncopy.specest import compRoutines
 from syncopy.specest import wavelets as spywave
 
 
@@ -406,6 +408,13 @@ def test_mtmfft():
     ax.plot(freqs[:150], dpss_powers[:150], label="Slepian", lw=2)
     ax.legend()
 
+    # threaded and single precision FFTs give the same result
+    ftr2, _ = mtmfft.mtmfft(signal, fs, taper="dpss", taper_opt=taper_opt, workers=2)
+    assert np.allclose(ftr, ftr2)
+    ftr2, _ = mtmfft.mtmfft(signal, fs, taper="dpss", taper_opt=taper_opt, single_precision=True)
+    assert ftr2.dtype == np.complex64
+    assert np.allclose(ftr, ftr2, atol=1e-4)
+
     # -----------------
     # test kaiser taper (is boxcar for beta -> inf)
     # -----------------
@@ -448,3 +457,237 @@ def test_mtmfft():
         except TypeError:
             # we didn't provide default parameters..
             pass
+
+
+def test_taper_cache():
+
+    nSamples = 1000
+    signal = np.random.randn(nSamples, 3)
+    taper_opt = {"Kmax": 5, "NW": 3}
+
+    taper_cache.clear_taper_cache()
+    ftr1, _ = mtmfft.mtmfft(signal, fs, taper="dpss", taper_opt=taper_opt)
+    info = taper_cache.taper_cache_info()
+    assert info["misses"] == 1
+    assert info["hits"] == 0
+
+    # same trial length and taper settings -> cache hit
+    ftr2, _ = mtmfft.mtmfft(signal, fs, taper="dpss", taper_opt=taper_opt)
+    assert taper_cache.taper_cache_info()["hits"] == 1
+    assert np.allclose(ftr1, ftr2)
+
+    # padding changes the normalization -> new entry
+    mtmfft.mtmfft(signal, fs, nSamples=2 * nSamples, taper="dpss", taper_opt=taper_opt)
+    assert taper_cache.taper_cache_info()["misses"] == 2
+
+    # cached windows are shared, hence read-only
+    windows = taper_cache.get_tapers("dpss", nSamples, taper_opt)
+    assert not windows.flags.writeable
+    assert windows.shape == (5, nSamples)
+
+    # the sliding window tapers get cached as well
+    mtmconvol.mtmconvol(signal, fs, nperseg=200, noverlap=100, taper="hann")
+    mtmconvol.mtmconvol(signal, fs, nperseg=200, noverlap=100, taper="hann")
+    info = taper_cache.taper_cache_info()
+    assert info["misses"] == 3
+    assert info["hits"] == 3
+
+    taper_cache.clear_taper_cache()
+    assert taper_cache.taper_cache_info()["currsize"] == 0
+
+
+def test_superlet_fft(monkeypatch):
+
+    nSamples = 1500
+    data = np.random.randn(nSamples, 3)
+    scales = superlet.scale_from_period(1 / np.linspace(2, 200, 40))
+
+    # short and long wavelets, the latter exceed the signal length
+    spectra = {}
+    for cycles in [3, 30]:
+        wav = superlet.MorletSL(cycles)
+        spec_time = superlet.cwtSL(data, wav, scales, 1 / fs)
+        spec_fft = superlet.cwtSL_fft(data, wav, scales, 1 / fs, spectra)
+        assert spec_time.shape == spec_fft.shape == (len(scales), nSamples, 3)
+        assert spec_fft.dtype == np.complex64
+        assert np.allclose(spec_time, spec_fft, atol=1e-6)
+
+    # the data gets transformed only a few times for all scales
+    assert len(spectra) <= 5
+    assert max(spectra) <= 2 * nSamples
+
+    # 1d data
+    spec_time = superlet.cwtSL(data[:, 0], wav, scales, 1 / fs)
+    spec_fft = superlet.cwtSL_fft(data[:, 0], wav, scales, 1 / fs)
+    assert np.allclose(spec_time, spec_fft, atol=1e-6)
+
+    # wavelet spectra get re-used for trials of equal length
+    superlet.clear_kernel_cache()
+    for adaptive in [False, True]:
+        superlet.superlet(data, fs, scales[::-1], order_max=5, c_1=3, adaptive=adaptive)
+        superlet.superlet(data[::-1], fs, scales[::-1], order_max=5, c_1=3, adaptive=adaptive)
+    info = superlet.kernel_cache_info()
+    assert info["misses"] == 5 * len(scales)
+    assert info["hits"] > 0
+    assert info["nbytes"] <= info["maxbytes"]
+    superlet.clear_kernel_cache()
+    assert superlet.kernel_cache_info()["currsize"] == 0
+
+    # the spectra only depend on the padded length
+    wav = superlet.MorletSL(3)
+    nFFT = superlet._fft_length(nSamples, scales.max(), wav.c_i, 1 / fs)
+    for nSmp in [nSamples, nSamples - 100]:
+        spec_time = superlet.cwtSL(data[:nSmp], wav, scales, 1 / fs)
+        spec_fft = superlet.cwtSL_fft(data[:nSmp], wav, scales, 1 / fs, nFFT=nFFT)
+        assert np.allclose(spec_time, spec_fft, atol=1e-6)
+    assert superlet.kernel_cache_info()["hits"] == len(scales)
+
+    # the cache is bounded by the size of the spectra
+    monkeypatch.setattr(superlet, "kernel_cache_bytes", 10 * nFFT * 16)
+    superlet.clear_kernel_cache()
+    superlet.cwtSL_fft(data, wav, scales, 1 / fs, nFFT=nFFT)
+    info = superlet.kernel_cache_info()
+    assert info["currsize"] == 10
+    assert info["nbytes"] <= info["maxbytes"]
+    superlet.clear_kernel_cache()
+
+
+def test_scale_blocks(monkeypatch):
+
+    nSamples = 2000
+    data = np.random.randn(nSamples, 4)
+    foi = np.linspace(5, 150, 30)
+    # decimated time points of interest
+    postselect = slice(None, None, 20)
+
+    wfun = spywave.Morlet(6)
+    wav_kwargs = {"samplerate": fs, "scales": wfun.scale_from_period(1 / foi), "wavelet": wfun}
+    sl_kwargs = {
+        "samplerate": fs,
+        "scales": superlet.scale_from_period(1 / foi),
+        "order_max": 6,
+        "order_min": 1,
+        "c_1": 3,
+        "adaptive": True,
+    }
+    cFs = [(compRoutines.wavelet_cF, wav_kwargs), (compRoutines.superlet_cF, sl_kwargs)]
+
+    for cF, method_kwargs in cFs:
+        for output in ["pow", "fourier"]:
+            kwargs = dict(toi=np.arange(0, nSamples, 20), polyremoval=None, output=output, method_kwargs=method_kwargs)
+            ref = cF(data, slice(None), postselect, **kwargs)
+            assert ref.shape == (nSamples // 20, 1, foi.size, 4)
+
+            # enforce blocks of one scale each
+            monkeypatch.setattr(compRoutines, "scaleBlockMem", 0)
+            assert compRoutines._scale_block_size(foi.size, nSamples, 4, ref.shape, output) == 1
+            spec = cF(data, slice(None), postselect, **kwargs)
+            monkeypatch.undo()
+
+            assert spec.dtype == ref.dtype
+            assert np.allclose(spec, ref, rtol=1e-5, atol=1e-8)
+
+    # the block size scales with the output size
+    full = compRoutines._scale_block_size(100, 10**6, 64, (10**6, 1, 100, 64), "pow")
+    decimated = compRoutines._scale_block_size(100, 10**6, 64, (10**4, 1, 100, 64), "pow")
+    assert 1 == decimated < full < 100
+
+
+def test_wavelet_fft():
+
+    nSamples = 1500
+    data = np.random.randn(nSamples, 3)
+    wfun = spywave.Morlet(10)
+    # the longest wavelets exceed the signal length
+    scales = wfun.scale_from_period(1 / np.linspace(2, 200, 40))
+    dt = 1 / fs
+
+    spec_time = spywave.cwt(data, wfun, scales, dt, frequency=False, axis=0)
+    spec_freq = spywave.cwt(data, wfun, scales, dt, frequency=True, axis=0)
+    assert spec_time.shape == spec_freq.shape == (len(scales), nSamples, 3)
+    assert spec_freq.dtype == np.complex64
+
+    # both domains give the same complex transform, also in phase
+    # (`cwt_time` samples the wavelets off-center by a fraction of a sample)
+    assert np.allclose(spec_freq, spec_time, rtol=1e-4, atol=1e-4 * np.abs(spec_time).max())
+
+    # small batches give the same result
+    batch_bytes = spywave.transform.cwt_freq_batch_bytes
+    spywave.transform.cwt_freq_batch_bytes = 1
+    assert np.allclose(spywave.cwt(data, wfun, scales, dt, frequency=True, axis=0), spec_freq)
+    spywave.transform.cwt_freq_batch_bytes = batch_bytes
+
+    # both domains give the same transform of the test signal
+    specs = [
+        wavelet.wavelet(signal, fs, wfun.scale_from_period(1 / foi), wfun, cwt_domain=domain)
+        for domain in ["time", "frequency"]
+    ]
+    assert np.allclose(specs[0], specs[1], rtol=1e-4, atol=1e-4 * np.abs(specs[0]).max())
+
+    # many scales favor the frequency domain, unless a single long
+    # wavelet blows up the padding, non-Morlet wavelets never use it
+    assert wavelet.use_frequency_domain(wfun, scales, 5000, dt)
+    assert not wavelet.use_frequency_domain(wfun, np.r_[scales[-10:], 5], 500, dt)
+    assert not wavelet.use_frequency_domain(spywave.Paul(4), scales, 5000, dt)
+
+
+def test_mtmconvol_framing(monkeypatch):
+
+    nSamples = 1200
+    data = np.random.randn(nSamples, 3) + np.linspace(0, 5, nSamples)[:, None]
+    nperseg = 200
+    taper_opt = {"Kmax": 5, "NW": 3}
+
+    for noverlap, boundary, padded in [(nperseg - 1, "zeros", True), (150, "zeros", True), (nperseg - 1, None, False)]:
+        for detrend in [False, "constant", "linear"]:
+            kwargs = dict(nperseg=nperseg, noverlap=noverlap, boundary=boundary, padded=padded, detrend=detrend)
+            ftr, freqs = mtmconvol.mtmconvol(data, fs, taper="dpss", taper_opt=taper_opt.copy(), **kwargs)
+            nTime = ftr.shape[0]
+            assert ftr.shape[1:] == (5, freqs.size, 3)
+
+            # reference: one stft per taper
+            windows = taper_cache.get_tapers("dpss", nperseg, dict(taper_opt, sym=False))
+            for taperIdx, win in enumerate(windows):
+                pxx, _, _ = stft.stft(data, fs, window=win, axis=0, **kwargs)
+                ref = pxx.transpose(2, 0, 1)[:nTime]
+                assert np.allclose(ftr[:, taperIdx], ref, atol=1e-5)
+
+            # chunking over segments does not change the result
+            monkeypatch.setattr(mtmconvol, "segment_chunk_bytes", 1)
+            ftr_chunked, _ = mtmconvol.mtmconvol(data, fs, taper="dpss", taper_opt=taper_opt.copy(), **kwargs)
+            monkeypatch.undo()
+            assert np.array_equal(ftr, ftr_chunked)
+
+    # the segments are a view into the data, no copy
+    segments = mtmconvol._segment_view(data, nperseg, nperseg - 1, None, False)
+    assert segments.shape == (nSamples - nperseg + 1, 3, nperseg)
+    assert np.shares_memory(segments, data)
+
+
+def test_mtmconvol_sparse():
+
+    nSamples = 3000
+    data = np.random.randn(nSamples, 2)
+    kwargs = dict(nperseg=300, taper="dpss", detrend="linear")
+
+    # full sliding window transform, one window per sample
+    ftr, freqs = mtmconvol.mtmconvol(data, fs, noverlap=299, taper_opt={"Kmax": 3, "NW": 2}, **kwargs)
+    assert ftr.shape[0] == nSamples
+
+    # irregular centers, including the trial boundaries
+    centers = np.array([0, 17, 1000, 1003, 2500, nSamples - 1])
+    ftr_sparse, freqs_sparse = mtmconvol.mtmconvol(data, fs, centers=centers, taper_opt={"Kmax": 3, "NW": 2}, **kwargs)
+    assert np.array_equal(freqs, freqs_sparse)
+    assert ftr_sparse.shape == (centers.size,) + ftr.shape[1:]
+    assert np.allclose(ftr_sparse, ftr[centers], atol=1e-6)
+
+    # centers outside of the signal give zero padded windows
+    pad = 1000
+    ftr_pad, _ = mtmconvol.mtmconvol(
+        np.pad(data, ((pad, pad), (0, 0))), fs, noverlap=299, taper_opt={"Kmax": 3, "NW": 2}, **kwargs
+    )
+    centers = np.array([-800, -250, -5, 0, nSamples + 10, nSamples + 290, nSamples + 900])
+    ftr_sparse, _ = mtmconvol.mtmconvol(data, fs, centers=centers, taper_opt={"Kmax": 3, "NW": 2}, **kwargs)
+    assert np.allclose(ftr_sparse, ftr_pad[centers + pad], atol=1e-6)
+    # windows entirely outside of the signal are all zeros
+    assert np.all(ftr_sparse[[0, -1]] == 0)
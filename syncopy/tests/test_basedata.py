@@ -12,7 +12,9 @@ import pytest
 import numpy as np
 
 # Local imports
+import syncopy as spy
 from syncopy.datatype import AnalogData
+from syncopy.shared.storage import get_storage_manager
 import syncopy.datatype as spd
 from syncopy.shared.errors import SPYValueError, SPYTypeError, SPYError
 from syncopy.tests.misc import is_win_vm, is_slurm_node
@@ -203,12 +205,48 @@ class TestBaseData:
             data.selection.trials[1]
 
         # check that invalid trial indexing gets catched
-        with pytest.raises(SPYTypeError, match="trial index"):
+        with pytest.raises(SPYValueError, match="existing trials"):
             data.trials[range(4)]
         with pytest.raises(SPYTypeError, match="trial index"):
-            data.trials[2:3]
+            data.trials["1"]
+        with pytest.raises(SPYTypeError, match="trial index"):
+            data.trials[np.ones((2, 2), dtype=int)]
+        with pytest.raises(SPYTypeError, match="trial index"):
+            data.trials[[True, False]]
         with pytest.raises(SPYTypeError, match="trial index"):
-            data.trials[np.arange(3)]
+            data.trials[np.array([True, False])]
+        with pytest.raises(SPYTypeError, match="trial index"):
+            data.trials[True]
+
+        # multiple trials of the same shape get stacked
+        trials = data.trials[1:3]
+        assert trials.shape == (2, 2, 2)
+        assert np.all(trials[0] == 1) and np.all(trials[1] == 2)
+        trials = data.trials[np.array([2, 0])]
+        assert np.all(trials[0] == 2) and np.all(trials[1] == 0)
+        assert data.trials[[0, 1, 2]].shape == (3, 2, 2)
+        # slices of selections pick the selected trials in range
+        assert data.selection.trials[0:3].shape == (2, 2, 2)
+        assert np.all(data.selection.trials[:][1] == 2)
+
+        # trials of different lengths come as a list
+        # (4 trials of 1, 2, 3 and 4 samples, trial index = data values)
+        lengths = np.arange(1, 5)
+        stops = np.cumsum(lengths)
+        trldef = np.column_stack([stops - lengths, stops, np.zeros(4)])
+        values = np.repeat(np.arange(4), lengths)[:, None] * np.ones((1, 2))
+        data = AnalogData(values, samplerate=1, trialdefinition=trldef)
+        trials = data.trials[[0, 1, 3]]
+        assert isinstance(trials, list)
+        assert [trl.shape[0] for trl in trials] == [1, 2, 4]
+        assert all([np.all(trl == i) for trl, i in zip(trials, [0, 1, 3])])
+
+        # ordered iteration, also with prefetching
+        data = AnalogData([i * np.ones((2, 2)) for i in range(20)], samplerate=1)
+        assert [trl[0, 0] for trl in data.trials] == list(range(20))
+        assert [trl[0, 0] for trl in data.trials.prefetch(depth=3)] == list(range(20))
+        # budget for a single trial only: synchronous reads
+        assert [trl[0, 0] for trl in data.trials.prefetch(max_mem=1)] == list(range(20))
 
     # Test ``_gen_filename`` with `AnalogData` only - method is independent from concrete data object
     def test_filename(self):
@@ -221,6 +259,47 @@ class TestBaseData:
             fnames.append(dummy._gen_filename())
         assert np.unique(fnames).size == numf
 
+    # Reference counting of temporary files, with `AnalogData` only
+    def test_storage_index(self):
+        storage = get_storage_manager()
+
+        # files shared by several objects get deleted with the last of them
+        dummy = AnalogData(data=self.data["AnalogData"], samplerate=self.samplerate)
+        fname = dummy.filename
+        assert fname in storage.files(referenced=True)
+        dummy2 = AnalogData(data=dummy.data, samplerate=self.samplerate)
+        assert dummy2.filename == fname
+        del dummy
+        assert os.path.isfile(fname)
+        del dummy2
+        assert not os.path.exists(fname)
+        assert fname not in storage.files()
+
+        # datasets attached from other files keep these alive
+        dummy = AnalogData(data=self.data["AnalogData"], samplerate=self.samplerate)
+        extra = AnalogData(data=self.data["AnalogData"], samplerate=self.samplerate)
+        extraName = extra.filename
+        dummy._register_dataset("dset_extra", extra.data)
+        extra._persistent_hdf5 = True
+        del extra
+        assert extraName in storage.files(referenced=True)
+        del dummy
+        assert not os.path.exists(extraName)
+
+        # unreferenced files get evicted by the quota and removed by `cleanup`
+        for k in range(2):
+            dummy = AnalogData(data=self.data["AnalogData"], samplerate=self.samplerate)
+            fname = dummy.filename
+            dummy._persistent_hdf5 = True
+            del dummy
+            assert fname in storage.files(referenced=False)
+            if k == 0:
+                assert fname in storage.enforce_quota(quota=0)
+            else:
+                spy.cleanup(interactive=False, only_current_session=True)
+            assert not os.path.exists(fname)
+            assert fname not in storage.files()
+
     # Object copying is tested with all members of `classes`
     def test_copy(self):
 
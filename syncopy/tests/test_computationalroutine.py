@@ -10,6 +10,7 @@ import time
 import pytest
 import numpy as np
 from glob import glob
+import h5py
 from scipy import signal
 import dask.distributed as dd
 
@@ -19,6 +20,8 @@ from syncopy.datatype.selector import Selector
 from syncopy.io import load
 from syncopy.shared.computational_routine import ComputationalRoutine
 from syncopy.shared.kwarg_decorators import process_io, unwrap_cfg, unwrap_select
+from syncopy.shared.pipelined_io import BlockWriter, TrialPrefetcher
+from syncopy.shared.metadata import metadata_from_hdf5_file
 from syncopy.tests.misc import generate_artificial_data
 
 
@@ -547,6 +550,197 @@ class TestComputationalRoutine:
 
         client.close()
 
+    def test_parallel_trial_average(self, testcluster):
+        client = dd.Client(testcluster)
+
+        # sequential reference
+        avg_seq = filter_manager(self.sigdata, self.b, self.a, keeptrials=False)
+
+        # use a small fan-in to get a multi-level reduction tree over the 8 trials
+        for fan_in in [2, 3, 8]:
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter = LowPassFilter(self.b, a=self.a)
+            myfilter.initialize(self.sigdata, out._stackingDim, keeptrials=False)
+            myfilter.reduceFanIn = fan_in
+            myfilter.compute(self.sigdata, out, parallel=True)
+
+            assert not out.data.is_virtual
+            assert len(out.trials) == 1
+            assert np.allclose(out.data, avg_seq.data)
+            assert np.max(np.abs(out.data - self.orig[: self.t.size, :])) < self.tols[0]
+
+        client.close()
+
+    def test_block_writer(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            fname = os.path.join(tdir, "dummy.h5")
+            with h5py.File(fname, mode="w") as h5f:
+                h5f.create_dataset("data", shape=self.sig.shape, dtype=self.sig.dtype)
+
+            # blocks arrive in random order, the queue is small
+            with BlockWriter(fname, "data", max_queue=2) as writer:
+                for trl in self.seed.permutation(self.nTrials):
+                    outgrid = (slice(trl * self.fs, (trl + 1) * self.fs), slice(0, self.nChannels))
+                    writer.put(outgrid, self.sig[outgrid], {f"__{trl}_0": {"trl": np.array(trl)}})
+
+            with h5py.File(fname, mode="r") as h5f:
+                assert np.array_equal(h5f["data"][()], self.sig)
+                assert len(h5f["metadata"].attrs) == self.nTrials
+
+            stats = writer.stats
+            assert stats["blocks"] == self.nTrials
+            # adjacent blocks waiting in the queue get merged
+            assert 1 <= stats["writes"] <= self.nTrials
+            assert stats["max_queue_depth"] <= 2
+            assert np.isclose(stats["MB"], self.sig.nbytes / 1024**2)
+
+            # errors of the writer get raised in the main thread
+            outgrid = (slice(0, self.fs), slice(0, self.nChannels + 1))
+            with pytest.raises(Exception):
+                with BlockWriter(fname, "data") as writer:
+                    writer.put(outgrid, np.zeros((self.fs, self.nChannels + 1)))
+
+            # but don't replace errors raised within the context
+            with pytest.raises(RuntimeError, match="within the context"):
+                with BlockWriter(fname, "data") as writer:
+                    writer.put(outgrid, np.zeros((self.fs, self.nChannels + 1)))
+                    writer._thread.join(timeout=10)
+                    raise RuntimeError("within the context")
+            assert writer._error is not None
+
+    def test_sequential_pipelined(self):
+        results = []
+        for depth, budget in [(0, None), (3, None), (3, 1)]:
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter = LowPassFilter(self.b, a=self.a)
+            myfilter.initialize(self.sigdata, out._stackingDim)
+            myfilter.prefetchDepth = depth
+            myfilter.pipelineMem = budget
+            if budget is not None:
+                # a tiny memory budget allows no read-ahead
+                assert myfilter._pipeline_depths() == (0, 1)
+            myfilter.compute(self.sigdata, out)
+
+            assert np.max(np.abs(out.data - self.orig)) < self.tols[0]
+            assert myfilter.writerStats["blocks"] == self.nTrials
+            assert myfilter.readerStats["read_time"] > 0
+            results.append(out.data[()])
+
+        assert np.array_equal(results[0], results[1])
+        assert np.array_equal(results[0], results[2])
+
+    def test_trial_prefetcher(self):
+        arrays = [np.full(3, idx) for idx in range(10)]
+
+        for depth in [0, 1, 4]:
+            reader = TrialPrefetcher(lambda idx: arrays[idx], len(arrays), depth=depth)
+            assert all(np.array_equal(arr, ref) for arr, ref in zip(reader, arrays))
+
+        # errors while reading surface in the consumer
+        def read_func(idx):
+            if idx == 5:
+                raise ValueError("broken trial")
+            return arrays[idx]
+
+        reader = TrialPrefetcher(read_func, len(arrays), depth=2)
+        with pytest.raises(ValueError, match="broken trial"):
+            for _ in reader:
+                pass
+
+    def test_parallel_consolidate(self, testcluster):
+        client = dd.Client(testcluster)
+
+        @process_io
+        def lowpass_md(arr, b, a=None, noCompute=None, chunkShape=None):
+            if noCompute:
+                return arr.shape, arr.dtype
+            res = signal.filtfilt(b, a, arr.T, padlen=200).T
+            return res, {"maxabs": np.array(np.abs(res).max())}
+
+        class LowPassFilterMD(LowPassFilter):
+            computeFunction = staticmethod(lowpass_md)
+
+        results = {}
+        for consolidate in [False, True, None]:
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter = LowPassFilterMD(self.b, a=self.a)
+            myfilter.initialize(self.sigdata, out._stackingDim, chan_per_worker=self.chanPerWrkr)
+            if consolidate is None:
+                # the heuristic kicks in above this number of files
+                myfilter.consolidateMinFiles = myfilter.numCalls
+            vdsdir = os.path.join(os.path.dirname(out.filename), os.path.splitext(os.path.basename(out.filename))[0])
+            myfilter.compute(self.sigdata, out, parallel=True, parallel_store=True, consolidate=consolidate)
+
+            assert out.data.is_virtual == (consolidate is False)
+            assert os.path.isdir(vdsdir) == (consolidate is False)
+            assert np.max(np.abs(out.data - self.orig)) < self.tols[0]
+            results[consolidate] = (out.data[()], metadata_from_hdf5_file(out.filename))
+
+        for consolidate in [True, None]:
+            assert np.array_equal(results[consolidate][0], results[False][0])
+            metadata = results[consolidate][1]
+            assert metadata.keys() == results[False][1].keys()
+            assert len(metadata) == myfilter.numCalls
+
+        client.close()
+
+    def test_parallel_batched(self, testcluster):
+        client = dd.Client(testcluster)
+
+        avg_seq = filter_manager(self.sigdata, self.b, self.a, keeptrials=False)
+
+        for trials_per_task in [3, self.nTrials]:
+            for parallel_store in [True, False]:
+                out = AnalogData(dimord=AnalogData._defaultDimord)
+                myfilter = LowPassFilter(self.b, a=self.a)
+                myfilter.initialize(self.sigdata, out._stackingDim, chan_per_worker=self.chanPerWrkr)
+                myfilter.compute(
+                    self.sigdata,
+                    out,
+                    parallel=True,
+                    parallel_store=parallel_store,
+                    trials_per_task=trials_per_task,
+                )
+                assert len(myfilter.taskBatches) == int(np.ceil(myfilter.numCalls / trials_per_task))
+                assert out.data.is_virtual == parallel_store
+                assert np.max(np.abs(out.data - self.orig)) < self.tols[0]
+
+            # batches get summed up on the workers before the tree reduction
+            out = AnalogData(dimord=AnalogData._defaultDimord)
+            myfilter = LowPassFilter(self.b, a=self.a)
+            myfilter.initialize(self.sigdata, out._stackingDim, keeptrials=False)
+            myfilter.compute(self.sigdata, out, parallel=True, trials_per_task=trials_per_task)
+            assert np.allclose(out.data, avg_seq.data)
+
+        # automatic batching aims at `tasksPerWorker` tasks per worker
+        myfilter = LowPassFilter(self.b, a=self.a)
+        myfilter.initialize(self.sigdata, out._stackingDim)
+        myfilter.tasksPerWorker = 1
+        nWorkers = len(client.scheduler_info()["workers"])
+        batches = myfilter.task_batches(client)
+        assert len(batches) == int(np.ceil(self.nTrials / (self.nTrials // nWorkers)))
+        assert sum(batches, []) == list(range(self.nTrials))
+        # but is limited by the worker memory
+        assert len(myfilter.task_batches(client, workerMem=myfilter.chunkMem)) == self.nTrials
+
+        client.close()
+
+    def test_parallel_write_behind(self, testcluster):
+        client = dd.Client(testcluster)
+
+        out = AnalogData(dimord=AnalogData._defaultDimord)
+        myfilter = LowPassFilter(self.b, a=self.a)
+        myfilter.initialize(self.sigdata, out._stackingDim, chan_per_worker=self.chanPerWrkr)
+        myfilter.writerQueueSize = 2
+        myfilter.compute(self.sigdata, out, parallel=True, parallel_store=False)
+
+        assert not out.data.is_virtual
+        assert np.max(np.abs(out.data - self.orig)) < self.tols[0]
+        assert myfilter.writerStats["blocks"] == myfilter.numCalls
+        assert myfilter.writerStats["max_queue_depth"] <= 2
+
+        client.close()
+
 
 if __name__ == "__main__":
     T1 = TestComputationalRoutine()
@@ -15,7 +15,7 @@ import dask.distributed as dd
 
 import syncopy as spy
 from syncopy import AnalogData, SpectralData
-from syncopy.connectivity.connectivity_analysis import connectivity_outputs
+from syncopy.connectivity.connectivity_analysis import connectivity_outputs, ppc_trial_pairs
 from syncopy import connectivityanalysis as cafunc
 from syncopy import synthdata
 import syncopy.tests.helpers as helpers
@@ -1002,6 +1002,20 @@ class TestPPC:
             if len(kwargs) == 0:
                 res.singlepanelplot(channel_i=0, channel_j=1)
 
+    def test_ppc_trial_pairs(self):
+
+        # closed form single pass PPC
+        res = cafunc(self.spec, method="ppc")
+
+        # explicit computation of all trial pairs
+        st_csd = cafunc(self.spec, method="csd", keeptrials=True)
+        ppc = ppc_trial_pairs(st_csd)
+
+        assert res.data.shape == ppc.shape
+        assert np.allclose(res.data[()], ppc, atol=1e-5)
+        # auto-PPC is always 1
+        assert np.allclose(res.data[0, :, 0, 0], 1)
+
     def test_ppc_channelcmb(self):
 
         # use str and index
@@ -1028,8 +1042,9 @@ class TestPPC:
             assert np.all(res_cmb.channel_j == res_all_sel.channel_j)
 
             # now compare with post-selections of full output
-            # here there is strict numerical equality:
-            # shape of csd has no influence on specific channel pair coherence!
+            # shape of csd has no influence on specific channel pair PPC,
+            # up to single precision as the order of the (parallel)
+            # trial summation of the phasors is not fixed
             fig, ax = ppl.subplots()
 
             ax.plot(res_all.freq, res_all_sel.show(channel_i=0, channel_j=0), label='post-select')
@@ -1039,7 +1054,7 @@ class TestPPC:
             ax.set_xlabel('frequency (Hz)')
             ax.legend()
 
-            assert np.allclose(res_all_sel.data[:], res_cmb.data[:], atol=1e-15)
+            assert np.allclose(res_all_sel.data[:], res_cmb.data[:], atol=1e-6)
 
     def test_ppc_selections(self):
 
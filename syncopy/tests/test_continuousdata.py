@@ -20,6 +20,7 @@ from syncopy.io import save, load
 from syncopy.datatype.methods.selectdata import selectdata
 from syncopy.shared.errors import SPYValueError, SPYTypeError
 from syncopy.shared.tools import StructDict
+from syncopy.shared.memmap_io import memmap_dataset
 from syncopy.tests.misc import (
     flush_local_cluster,
     generate_artificial_data,
@@ -319,6 +320,56 @@ class TestAnalogData:
 
         del dummy
 
+    def test_memmap_trialretrieval(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            fname = os.path.join(tdir, "dummy")
+            dummy = AnalogData(data=self.data, trialdefinition=self.trl, samplerate=1000)
+            dummy.save(fname)
+            filename = construct_spy_filename(fname, dummy)
+            del dummy
+
+            # read-only contiguous datasets are memory mapped: trials are views
+            dummy = load(filename, mode="r")
+            assert memmap_dataset(dummy.data) is not None
+            for trlno, start in enumerate(range(0, self.ns, 5)):
+                trl = dummy._get_trial(trlno)
+                assert not trl.flags.owndata
+                assert np.array_equal(trl, self.data[start : start + 5, :])
+
+            # in-place changes of trials neither reach the file nor other trials
+            trl = dummy.trials[0]
+            trl += 1
+            assert np.array_equal(dummy.trials[0], self.data[:5, :])
+            assert np.array_equal(dummy.data[:5, :], self.data[:5, :])
+
+            # computations read via the map as well
+            res = spy.selectdata(dummy, trials=[1, 3], parallel=False)
+            assert np.array_equal(res.trials[1], self.data[15:20, :])
+            del dummy, res
+
+            # writable files are read via h5py
+            with h5py.File(os.path.join(tdir, "plain.h5"), mode="w") as h5f:
+                dset = h5f.create_dataset("data", data=self.data)
+                assert memmap_dataset(dset) is None
+            with h5py.File(os.path.join(tdir, "plain.h5"), mode="r") as h5f:
+                assert np.array_equal(memmap_dataset(h5f["data"]), self.data)
+
+            # chunked datasets are read via h5py
+            policy = spy.__storagepolicy__
+            try:
+                spy.__storagepolicy__ = "lzf"
+                dummy = AnalogData(data=self.data, trialdefinition=self.trl, samplerate=1000)
+                dummy.save(fname + "_lzf")
+            finally:
+                spy.__storagepolicy__ = policy
+            del dummy
+            dummy = load(construct_spy_filename(fname + "_lzf", AnalogData()), mode="r")
+            assert dummy.data.chunks is not None
+            assert memmap_dataset(dummy.data) is None
+            assert np.array_equal(dummy._get_trial(1), self.data[5:10, :])
+            del dummy
+            time.sleep(0.1)
+
     def test_saveload(self):
         with tempfile.TemporaryDirectory() as tdir:
             fname = os.path.join(tdir, "dummy")
@@ -416,6 +467,33 @@ class TestAnalogData:
         for tk, trl in enumerate(result.trials):
             assert np.array_equal(trl, (dummy.trials[tk] + dummy2.trials[tk]) / dummy.trials[tk] ** 3)
 
+        # The same expression evaluated lazily in a single pass
+        expr = (spy.lazy(dummy) + dummy2) / dummy**3
+        assert isinstance(expr, spy.LazyExpression)
+        for tk, trl in enumerate(expr.trials):
+            assert np.allclose(trl, result.trials[tk])
+        assert expr.compute() is expr.compute()
+
+        # Reflected operators, arrays and selections in the base object
+        kwdict = {"trials": [3, 1, 2], "channel": [4, 2, 2, 5]}
+        selected = dummy.selectdata(**kwdict)
+        dummy.selectdata(inplace=True, **kwdict)
+        arr = np.arange(selected.trials[0].shape[1])
+        expr = 2 / (1 + spy.lazy(dummy)) - arr * spy.lazy(dummy) ** 2
+        assert expr.base is dummy
+        res = expr.compute()
+        assert np.array_equal(res.channel, selected.channel)
+        for tk, trl in enumerate(res.trials):
+            sel = selected.trials[tk]
+            assert np.allclose(trl, 2 / (1 + sel) - arr * sel**2)
+        dummy.selection = None
+
+        # Input errors are caught while building the expression
+        with pytest.raises(SPYValueError, match="expected non-zero scalar for division"):
+            _ = spy.lazy(dummy) / 0
+        with pytest.raises(SPYValueError):
+            _ = spy.lazy(dummy) + ymmud
+
     def test_parallel(self, testcluster):
         # repeat selected test w/parallel processing engine
         client = dd.Client(testcluster)
@@ -8,7 +8,7 @@ import os
 import tempfile
 
 # Local imports
-from syncopy.datatype.util import get_dir_size
+from syncopy.datatype.util import get_dir_size, storage_census
 
 
 class TestDirSize:
@@ -27,6 +27,28 @@ class TestDirSize:
             dir_size_gb, num_files = get_dir_size(tdir, out="GB")
             assert dir_size_gb < 1e-6
 
+    def test_storage_census(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            storage = os.path.join(tdir, "tmp_storage")
+            os.mkdir(storage)
+            for folder in [tdir, storage]:
+                for file_idx in range(10):
+                    with open(os.path.join(folder, "tmpfile" + str(file_idx)), "w") as f:
+                        f.write(f"This is a dummy file {file_idx}.")
+
+            # storage inside of config folder: single walk
+            census = storage_census(storage_dir=storage, spy_dir=tdir)
+            assert census["storage_num_files"] == 10
+            assert census["spydir_num_files"] == 20
+            assert census["storage_size_gb"] == get_dir_size(storage, out="GB")[0]
+            assert census["spydir_size_gb"] == get_dir_size(tdir, out="GB")[0]
+
+            # storage somewhere else
+            with tempfile.TemporaryDirectory() as other:
+                census = storage_census(storage_dir=other, spy_dir=storage)
+                assert census["storage_num_files"] == 0
+                assert census["spydir_num_files"] == 10
+
 
 if __name__ == "__main__":
 
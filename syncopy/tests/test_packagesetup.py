@@ -40,9 +40,44 @@ def test_spytmpdir():
     assert syncopy.__storage__ == tmpDir
     shutil.rmtree(tmpDir, ignore_errors=True)
     del os.environ["SPYTMPDIR"]
+    importlib.reload(syncopy)  # restore default storage for subsequent tests
     time.sleep(1)
 
 
+# check that subpackages and optional dependencies are only imported on first use
+def test_lazy_import():
+    commandStr = (
+        "import sys; "
+        + "import syncopy as spy; "
+        + "assert 'syncopy.specest' not in sys.modules; "
+        + "assert 'matplotlib' not in sys.modules; "
+        + "assert 'acme' not in sys.modules; "
+        + "assert 'distributed' not in sys.modules; "
+        + "spy.freqanalysis; "
+        + "assert 'syncopy.specest' in sys.modules; "
+        + "assert 'syncopy.plotting' not in sys.modules; "
+        + "assert 'syncopy.synthdata' not in sys.modules; "
+        + "assert callable(spy.synthdata.white_noise)"
+    )
+    env = dict(os.environ, SPYSTORAGECHECK="off")
+    subprocess.run([sys.executable, "-c", commandStr], check=True, env=env)
+
+
+# check that the lazily loaded names are those of the subpackages
+def test_lazy_names():
+    for name, pkg in syncopy._lazy_names.items():
+        module = importlib.import_module("syncopy." + pkg)
+        assert getattr(syncopy, name) is getattr(module, name)
+    for pkg in syncopy._lazy_subpackages:
+        module = importlib.import_module("syncopy." + pkg)
+        if hasattr(module, "__all__"):
+            assert set(module.__all__) <= set(syncopy._lazy_names)
+            # the public names of the subpackages get exported but those of `synthdata`
+            assert set(module.__all__) <= set(syncopy.__all__) or pkg == "synthdata"
+    # neither modules nor helpers of the package namespace get exported
+    assert not {"io", "os", "sys", "np", "shared", "datatype", "white_noise"} & set(syncopy.__all__)
+
+
 # check if `cleanup` does what it's supposed to do
 # @skip_in_ghactions
 def test_cleanup():
@@ -480,6 +480,50 @@ class TestFIRWS:
             call(hilbert="absnot")
         assert "one of {'" in str(err)
 
+    def test_firws_streaming(self):
+
+        # filtering block-wise straight from disk gives
+        # the same result as filtering entire trials
+        nSamples = 5000
+        arr = [np.random.randn(nSamples, 3) + np.linspace(0, 4, nSamples)[:, None] for _ in range(3)]
+        arr[2][1000:1010, 1] = np.nan
+        adata = AnalogData(data=arr, samplerate=self.fs)
+        fkernel = preproc.firws.design_wsinc("hamming", 200, 0.1)
+
+        settings = [
+            {"direction": "onepass"},
+            {"direction": "twopass", "select": {"latency": [0.5, 20], "channel": [0, 2]}},
+            {"direction": "onepass-minphase", "polyremoval": 0},
+            {"direction": "twopass", "polyremoval": 1, "select": {"trials": [0, 1]}},
+        ]
+        for kwargs in settings:
+            ref = ppfunc(adata, filter_class="firws", freq=20, order=200, **kwargs)
+            streamMem, blockMem = preproc.compRoutines.SincFiltering.streamMem, preproc.compRoutines.SincFiltering.streamBlockMem
+            try:
+                preproc.compRoutines.SincFiltering.streamMem = 0
+                # blocks of ~300 samples
+                preproc.compRoutines.SincFiltering.streamBlockMem = 300 * 3 * 8
+                res = ppfunc(adata, filter_class="firws", freq=20, order=200, **kwargs)
+            finally:
+                preproc.compRoutines.SincFiltering.streamMem = streamMem
+                preproc.compRoutines.SincFiltering.streamBlockMem = blockMem
+
+            assert res.data.shape == ref.data.shape
+            assert np.allclose(res.data[()], ref.data[()], atol=1e-5, equal_nan=True)
+            assert res.info["nan_trials"] == ref.info["nan_trials"]
+
+        # the backend stream for arbitrary blocks, NaNs stay local
+        sig = np.random.randn(nSamples, 2)
+        sig[3000, 0] = np.nan
+        blocks = (sig[i : i + 123] for i in range(0, nSamples, 123))
+        for npass in [1, 2]:
+            filtered = np.concatenate(list(preproc.firws.stream_fir(blocks, fkernel, npass)))
+            ref = sig
+            for _ in range(npass):
+                ref = preproc.firws.apply_fir(ref, fkernel, method="direct")
+            assert np.allclose(filtered, ref, equal_nan=True)
+            blocks = (sig[i : i + 123] for i in range(0, nSamples, 123))
+
     def test_firws_NaN(self):
 
         nSamples = 20
@@ -675,6 +719,101 @@ class TestStandardize:
         client.close()
 
 
+class TestFusedPipeline:
+
+    """All stages get applied in one pass per trial"""
+
+    nTrials = 3
+    nSamples = 2000
+    fs = 200
+    AData = 10 * sd.white_noise(nTrials=nTrials, nSamples=nSamples, samplerate=fs, seed=42) + 5
+
+    def test_fused_stages(self):
+
+        cR = preproc.compRoutines
+        fkernel = preproc.firws.design_wsinc("hamming", 200, 20 / self.fs)
+
+        res = ppfunc(
+            self.AData, filter_class="firws", freq=20, order=200, polyremoval=1, zscore=True, hilbert="abs"
+        )
+        assert res.cfg["preprocessing"]["hilbert"] == "abs"
+
+        # same as applying the stages one after the other
+        for trl_idx, trl in enumerate(self.AData.trials):
+            ref = cR.standardize_cF(trl, polyremoval=1)
+            ref, _ = cR.sinc_filtering_cF(ref, samplerate=self.fs, fkernel=fkernel, direction="twopass", polyremoval=1)
+            ref = cR.hilbert_cF(ref, output="abs")
+            assert np.allclose(res.trials[trl_idx], ref, atol=1e-5)
+
+        # the stage details get merged
+        arr = self.AData.trials[0].copy()
+        arr[10, 0] = np.nan
+        nan_data = AnalogData(data=[arr, self.AData.trials[1]], samplerate=self.fs)
+        res = ppfunc(nan_data, filter_class="but", freq=20, rectify=True)
+        assert res.info["nan_trials"] == [0]
+
+        # large trials get filtered block-wise, unfused from the other stages
+        streamMem, stream_trial = cR.SincFiltering.streamMem, cR.SincFiltering._stream_trial
+        streamed = []
+
+        def counting_stream_trial(self, *args):
+            streamed.append(args[1])
+            yield from stream_trial(self, *args)
+
+        try:
+            cR.SincFiltering.streamMem = 0
+            cR.SincFiltering._stream_trial = counting_stream_trial
+            res = ppfunc(self.AData, filter_class="firws", freq=20, order=200, zscore=True, hilbert="abs")
+        finally:
+            cR.SincFiltering.streamMem = streamMem
+            cR.SincFiltering._stream_trial = stream_trial
+        # streaming only happens in sequential computations
+        try:
+            dd.get_client()
+        except ValueError:
+            assert len(streamed) == len(self.AData.trials)
+        else:
+            assert len(streamed) == 0
+        ref = ppfunc(ppfunc(self.AData, filter_class=None, zscore=True), filter_class="firws", freq=20, order=200)
+        for trl_idx, trl in enumerate(ref.trials):
+            assert np.allclose(res.trials[trl_idx], cR.hilbert_cF(trl, output="abs"), atol=1e-5)
+
+    def test_freqanalysis_prestage(self):
+
+        preprocess = {"filter_class": "but", "filter_type": "bp", "freq": [10, 40], "rectify": True}
+        spec = freqanalysis(self.AData, tapsmofrq=2, preprocess=preprocess)
+        ref = freqanalysis(ppfunc(self.AData, **preprocess), tapsmofrq=2)
+        assert np.allclose(spec.data[()], ref.data[()])
+        assert spec.cfg["freqanalysis"]["preprocess"] == preprocess
+
+        preprocess = {"filter_class": "firws", "freq": 30, "order": 100}
+        spec = freqanalysis(self.AData, method="mtmconvol", t_ftimwin=0.5, toi=[1, 2, 3], preprocess=preprocess)
+        ref = freqanalysis(ppfunc(self.AData, **preprocess), method="mtmconvol", t_ftimwin=0.5, toi=[1, 2, 3])
+        assert np.allclose(spec.data[()], ref.data[()])
+
+    def test_exceptions(self):
+
+        with pytest.raises(SPYValueError, match="preprocess"):
+            freqanalysis(self.AData, preprocess={"filter_class": "but", "nothing-real": 1})
+
+        with pytest.raises(SPYValueError, match="real valued Hilbert"):
+            freqanalysis(self.AData, preprocess={"filter_class": None, "zscore": True, "hilbert": "complex"})
+
+    def test_fused_parallel(self, testcluster):
+
+        client = dd.Client(testcluster)
+        all_tests = [
+            attr
+            for attr in self.__dir__()
+            if (inspect.ismethod(getattr(self, attr)) and "parallel" not in attr)
+        ]
+
+        for test_name in all_tests:
+            test_method = getattr(self, test_name)
+            test_method()
+        client.close()
+
+
 def mk_spec_ax():
 
     fig, ax = ppl.subplots()
@@ -249,6 +249,31 @@ class TestResampling:
             assert np.all(np.isfinite(spec_rs.data))
             assert pow_rs >= 0.9 * self.pow_orig
 
+    def test_rs_streaming(self):
+
+        # resampling block-wise straight from disk gives
+        # the same result as resampling entire trials
+        from syncopy.preproc.compRoutines import Resample
+
+        settings = [
+            {"resamplefs": self.fs * 0.43, "order": 500},
+            {"resamplefs": self.fs / 2.1, "select": {"latency": [0.5, 3], "channel": [0, 2]}},
+        ]
+        for kwargs in settings:
+            ref = resampledata(self.adata, method="resample", **kwargs)
+            streamMem, blockMem = Resample.streamMem, Resample.streamBlockMem
+            try:
+                Resample.streamMem = 0
+                # blocks of ~100 samples
+                Resample.streamBlockMem = 100 * self.nChannels * 4
+                res = resampledata(self.adata, method="resample", **kwargs)
+            finally:
+                Resample.streamMem = streamMem
+                Resample.streamBlockMem = blockMem
+
+            assert res.data.shape == ref.data.shape
+            assert np.allclose(res.data[()], ref.data[()], atol=1e-5)
+
     def test_rs_parallel(self, testcluster):
 
         ppl.ioff()
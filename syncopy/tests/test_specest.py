@@ -776,6 +776,15 @@ class TestMTMConvol:
                 tfSpec = freqanalysis(cfg, TestMTMConvol.get_tfdata_mtmconvol())
                 assert tfSpec.time[0].size == len(cfg.toi)
 
+                # Overlapping windows on a coarser than sample grid: only the
+                # windows centered on `toi` get evaluated
+                cfg.t_ftimwin = 0.5
+                cfg.toi = np.arange(0, 1, 0.01)
+                tfSpec = freqanalysis(cfg, TestMTMConvol.get_tfdata_mtmconvol())
+                assert tfSpec.data.shape[0] == cfg.toi.size * len(tfSpec.trials)
+                assert np.allclose(cfg.toi, tfSpec.time[0])
+                cfg.t_ftimwin = 0.05
+
         # Test correct time-array assembly for ``toi = "all"`` (cut down data signifcantly
         # to not overflow memory here); same for ``toi = 1.0```
         cfg.tapsmofrq = 10
@@ -811,6 +820,38 @@ class TestMTMConvol:
         with pytest.raises(SPYError) as spyval:
             freqanalysis(cfg, TestMTMConvol.get_tfdata_mtmconvol())
 
+    def test_tf_toi_trial_offsets(self):
+        # 3 trials of 6 s starting at -1, 0 and -5 s: `toi` can lie
+        # outside of single trials, their windows get zero padded
+        fs = 100
+        nSamples = 601
+        rng = np.random.default_rng(42)
+        trldef = np.array([[k * nSamples, (k + 1) * nSamples, offset] for k, offset in enumerate([-100, 0, -500])])
+        adata = AnalogData(data=rng.standard_normal((3 * nSamples, 2)), samplerate=fs, trialdefinition=trldef)
+
+        cfg = get_defaults(freqanalysis)
+        cfg.method = "mtmconvol"
+        cfg.taper = "hann"
+        cfg.t_ftimwin = 0.5
+        cfg.output = "pow"
+        toi = [-4, 0, 3, 5.5]
+        cfg.toi = toi
+        tfSpec = freqanalysis(cfg, adata)
+        assert [trl.shape[0] for trl in tfSpec.trials] == [4] * 3
+
+        # windows completely outside of a trial are all zeros
+        assert np.all(tfSpec.trials[0][[0, 3]] == 0)
+        assert np.all(tfSpec.trials[1][0] == 0)
+        assert np.all(tfSpec.trials[2][2:] == 0)
+
+        # all others match the estimates of the single trials
+        for trlno, tois in enumerate([[0, 3], [0, 3, 5.5], [-4, 0]]):
+            cfg.toi = tois
+            cfg.select = {"trials": [trlno]}
+            ref = freqanalysis(cfg, adata)
+            sel = [toi.index(t) for t in tois]
+            assert np.allclose(tfSpec.trials[trlno][sel], ref.trials[0])
+
     def test_tf_irregular_trials(self):
         # Settings for computing "full" non-overlapping TF-spectrum with DPSS tapers:
         # ensure non-equidistant/overlapping trials are processed (padded) correctly
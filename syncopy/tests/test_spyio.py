@@ -14,9 +14,11 @@ import numpy as np
 from glob import glob
 
 # Local imports
+import syncopy as spy
 from syncopy.datatype import AnalogData
 from syncopy.io import save, load, load_ft_raw, load_tdt
 from syncopy.shared.filetypes import FILE_EXT
+from syncopy.shared.storage_policy import StoragePolicy, chunk_shape
 from syncopy.shared.errors import SPYValueError, SPYIOError, SPYError, SPYTypeError
 import syncopy.datatype as swd
 from syncopy.tests.misc import generate_artificial_data
@@ -497,6 +499,52 @@ class TestSpyIO:
                     tag="2nd",
                 )
 
+    # Test trial-aligned chunking and compression of datasets
+    def test_storage_policy(self):
+        trials = [np.random.randn(6, self.nc).astype(np.float32) for _ in range(5)]
+        try:
+            spy.__storagepolicy__ = "gzip"
+            adata = AnalogData(data=trials, samplerate=1000)
+            assert adata.data.chunks == (6, self.nc)
+            assert adata.data.compression == "gzip"
+            assert np.array_equal(adata.show(trials=2), trials[2])
+
+            # outputs of ComputationalRoutines follow the policy as well
+            res = spy.selectdata(adata, trials=[0, 2, 4], parallel=False)
+            assert res.data.chunks == (6, self.nc)
+            assert res.data.compression == "gzip"
+            assert np.array_equal(res.show(trials=2), trials[4])
+
+            # saved containers keep the layout
+            spy.__storagepolicy__ = "lzf"
+            with tempfile.TemporaryDirectory() as tdir:
+                fname = os.path.join(tdir, "policy")
+                res.save(container=fname)
+                res2 = load(fname)
+                assert res2.data.chunks == (6, self.nc)
+                assert res2.data.compression == "lzf"
+                assert np.array_equal(res.data[()], res2.data[()])
+                del res2
+
+            # contiguous storage without filters
+            spy.__storagepolicy__ = "contiguous"
+            adata = AnalogData(data=trials, samplerate=1000)
+            assert adata.data.chunks is None
+            assert adata.data.compression is None
+
+            spy.__storagepolicy__ = "invalid"
+            with pytest.raises(SPYValueError, match="storage policy"):
+                AnalogData(data=trials, samplerate=1000)
+        finally:
+            spy.__storagepolicy__ = "contiguous"
+
+        # chunks are split into channel blocks and parts of trials
+        assert chunk_shape((1000, 64), 8, 0, [500, 500], [1], chunkBytes=4096) == (500, 1)
+        assert chunk_shape((100000, 4), 8, 0, [100000], [1], chunkBytes=8 * 1000) == (1000, 1)
+        assert chunk_shape((1200, 4), 4, 0, [400, 800], [1]) == (400, 4)
+        with pytest.raises(SPYValueError):
+            StoragePolicy(chunked=False, compression="gzip")
+
 
 @skip_no_esi
 class TestFTImporter:
@@ -18,7 +18,8 @@ from syncopy.shared.errors import SPYValueError, SPYTypeError
 from syncopy.tests import helpers
 from syncopy import synthdata as sd
 from syncopy.statistics import jackknifing as jk
-from syncopy.connectivity.AV_compRoutines import NormalizeCrossSpectra
+from syncopy.connectivity.AV_compRoutines import NormalizeCrossSpectra, GrangerCausality
+from syncopy.connectivity.connectivity_analysis import granger_replicates
 
 
 class TestSumStatistics:
@@ -610,6 +611,31 @@ class TestJackknife:
         # the 5% significance interval and hence are deteceted as true positives
         assert np.sum(pvals[bi] < 0.05) / bi[bi].size > 0.8
 
+    def test_jk_granger_replicates(self):
+
+        adata = sd.ar2_network(nTrials=10, seed=42)
+        csd = spy.connectivityanalysis(adata, method="csd", keeptrials=True, tapsmofrq=5)
+        replicates = jk.trial_avg_replicates(csd)
+
+        # direct estimate from the trial average
+        direct = CrossSpectralData(dimord=csd.dimord)
+        GrCR = GrangerCausality(rtol=5e-6, nIter=100, cond_max=1e4)
+        GrCR.initialize(spy.mean(csd, dim="trials"), direct._stackingDim, chan_per_worker=None)
+        GrCR.compute(spy.mean(csd, dim="trials"), direct)
+
+        # one CR run per replicate
+        jack_rep = CrossSpectralData(dimord=csd.dimord)
+        GrCR.initialize(replicates, jack_rep._stackingDim, chan_per_worker=None)
+        GrCR.compute(replicates, jack_rep)
+
+        # batched factorization, with a last incomplete batch
+        jack_batched = granger_replicates(replicates, direct, batch_size=4, **GrCR.cfg)
+
+        assert jack_batched.data.shape == jack_rep.data.shape
+        assert np.allclose(jack_batched.data[()], jack_rep.data[()], atol=1e-5)
+        assert np.all(jack_batched.channel_i == direct.channel_i)
+        assert len(jack_batched.trials) == len(replicates.trials)
+
 
 if __name__ == "__main__":
 